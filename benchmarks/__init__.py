@@ -0,0 +1,4 @@
+"""
+Benchmarks for wavy, run them from the project root with
+``python -m benchmarks.<name>``.
+"""
@@ -0,0 +1,44 @@
+"""
+Compare listing the chunks of files with trailing chunks against os.stat.
+"""
+import argparse
+import os
+import struct
+import wavy
+from .info_syscalls import count_calls
+from .utils import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=600,
+                        help='Duration of the test file in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 2
+
+    with temporary_folder() as dir_name:
+        file_path = create_wave_file(dir_name, 24, framerate, n_channels,
+                                     args.seconds * framerate)
+        # chunks written after the data by many applications
+        with open(file_path, 'ab') as file:
+            for id, size in [(b'LIST', 64), (b'bext', 602), (b'iXML', 1024)]:
+                file.write(struct.pack('<4sL', id, size) + bytes(size))
+
+        print('{} MB file, {} chunks'.format(
+            os.path.getsize(file_path) // 10 ** 6,
+            len(wavy.chunks(file_path))))
+        print('{:<40} {:>10} calls'.format(
+            'chunks', count_calls(file_path, wavy.chunks)))
+
+        for name, function in [
+            ('os.stat', lambda: os.stat(file_path)),
+            ('wavy.info', lambda: wavy.info(file_path)),
+            ('wavy.chunks', lambda: wavy.chunks(file_path))
+        ]:
+            seconds = measure(function, repeat=1000)
+            print('{:<40} {:>10.1f} us'.format(name, seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main()
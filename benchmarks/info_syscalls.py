@@ -0,0 +1,66 @@
+"""
+Count the I/O calls made on the raw file for each call to wavy.info.
+"""
+import io
+import wavy
+import wavy.detail
+from .utils import *
+
+
+class CountingFileIO(io.FileIO):
+    """
+    Raw file that counts the calls that result in a system call.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+        super().__init__(*args, **kwargs)
+
+    def readinto(self, buffer):
+        self.calls += 1
+        return super().readinto(buffer)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self.calls += 1
+        return super().seek(offset, whence)
+
+    def tell(self):
+        self.calls += 1
+        return super().tell()
+
+
+def count_calls(file_path, function):
+    """
+    Count raw I/O calls made by function to parse the file header.
+    """
+    raw = CountingFileIO(file_path, 'rb')
+    with io.BufferedReader(raw) as stream:
+        # ignore the calls made to open the file
+        raw.calls = 0
+        function(stream)
+    return raw.calls
+
+
+def main():
+    with temporary_folder() as dir_name:
+        for junk_size in [0, 2 ** 14, 2 ** 20]:
+            file_path = create_wave_file(dir_name, 16, 48000, 2, 48000,
+                                         junk_size=junk_size)
+            print('header with {} bytes of JUNK'.format(junk_size))
+
+            # chunk by chunk reads and seeks on the stream
+            calls = count_calls(file_path,
+                                lambda stream: wavy.detail.read_stream(
+                                    stream, read_data=False))
+            print('{:<40} {:>10} calls'.format('read_stream', calls))
+
+            # single read for the whole header
+            calls = count_calls(file_path, wavy.info)
+            print('{:<40} {:>10} calls'.format('info', calls))
+
+            seconds = measure(lambda: wavy.info(file_path), repeat=1000)
+            print('{:<40} {:>10.1f} us'.format('info', seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Compare computing peaks for a waveform overview from the whole data read with
+wavy.read against wavy.peaks, which decodes the data one block at the time,
+and against peaks loaded from the sidecar cache.
+"""
+import argparse
+import numpy
+import tracemalloc
+import wavy
+from .utils import *
+
+
+def read_peaks(file_path, samples_per_bucket):
+    data = wavy.read(file_path).data
+    n_buckets = -(-len(data) // samples_per_bucket)
+    padded = numpy.zeros((n_buckets * samples_per_bucket, data.shape[1]),
+                         data.dtype)
+    padded[:len(data)] = data
+    buckets = padded.reshape(n_buckets, samples_per_bucket, -1)
+    return buckets.min(axis=1), buckets.max(axis=1), \
+        numpy.sqrt(numpy.mean(numpy.square(buckets, dtype=numpy.float64),
+                              axis=1))
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=600,
+                        help='Duration of the test file in seconds.')
+    parser.add_argument('--samples-per-bucket', type=int, default=512,
+                        help='Number of frames in each bucket.')
+    args = parser.parse_args()
+
+    framerate, n_channels, n_frames = 48000, 2, args.seconds * 48000
+    samples_per_bucket = args.samples_per_bucket
+
+    with temporary_folder() as dir_name:
+        file_path = create_wave_file(dir_name, 16, framerate, n_channels,
+                                     n_frames)
+        n_bytes = n_frames * n_channels * 2
+
+        functions = [
+            ('read and reduce',
+             lambda: read_peaks(file_path, samples_per_bucket)),
+            ('peaks', lambda: wavy.peaks(file_path, samples_per_bucket)),
+            ('peaks (cached)',
+             lambda: wavy.peaks(file_path, samples_per_bucket, cache=True))
+        ]
+
+        for name, function in functions:
+            print_result(name, measure(function), n_bytes)
+
+        for name, function in functions:
+            print(f'{name:<40} {peak_memory(function) / 2 ** 20:8.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Compare 24 bit decoding throughput against the 16 bit numpy path.
+"""
+import argparse
+import wavy
+from .utils import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=60,
+                        help='Duration of the test files in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 2
+    n_frames = args.seconds * framerate
+
+    with temporary_folder() as dir_name:
+        for sample_width in [16, 24]:
+            for little_endian in [True, False]:
+                file_path = create_wave_file(dir_name, sample_width, framerate,
+                                             n_channels, n_frames,
+                                             little_endian)
+                seconds = measure(lambda: wavy.read(file_path))
+                print_result('{} bit {}'.format(
+                    sample_width, 'RIFF' if little_endian else 'RIFX'),
+                    seconds, n_frames * n_channels * sample_width // 8)
+
+
+if __name__ == '__main__':
+    main()
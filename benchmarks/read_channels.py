@@ -0,0 +1,47 @@
+"""
+Compare reading a few channels of a 64 channel file against reading all of
+them.
+"""
+import argparse
+import tracemalloc
+import wavy
+from .utils import *
+
+
+def peak_memory(function):
+    """
+    Get the peak memory (in bytes) allocated by function.
+    """
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=10,
+                        help='Duration of the test files in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 64
+    n_frames = args.seconds * framerate
+
+    with temporary_folder() as dir_name:
+        for sample_width in [16, 24]:
+            file_path = create_wave_file(dir_name, sample_width, framerate,
+                                         n_channels, n_frames)
+            n_bytes = n_frames * n_channels * sample_width // 8
+            print('{} bit, {} channels'.format(sample_width, n_channels))
+
+            for channels in [None, [0], [0, 1, 2, 3]]:
+                function = lambda: wavy.read(file_path, channels=channels)
+                seconds = measure(function)
+                print_result('channels={}'.format(channels), seconds, n_bytes)
+                print('{:<40} {:>10.1f} MB'.format(
+                    '  peak memory', peak_memory(function) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Compare reading with dtype='float32' against reading and then converting.
+"""
+import argparse
+import numpy
+import wavy
+from .read_channels import peak_memory
+from .utils import *
+
+
+def read_then_convert(file_path, sample_width):
+    data = wavy.read(file_path).data
+    return data.astype(numpy.float32) / 2 ** (sample_width - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=60,
+                        help='Duration of the test files in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 2
+    n_frames = args.seconds * framerate
+
+    with temporary_folder() as dir_name:
+        for sample_width in [16, 24, 32]:
+            file_path = create_wave_file(dir_name, sample_width, framerate,
+                                         n_channels, n_frames)
+            n_bytes = n_frames * n_channels * sample_width // 8
+            print('{} bit to float32'.format(sample_width))
+
+            for name, function in [
+                ('read then convert',
+                 lambda: read_then_convert(file_path, sample_width)),
+                ("read(dtype='float32')",
+                 lambda: wavy.read(file_path, dtype='float32'))
+            ]:
+                print_result(name, measure(function), n_bytes)
+                print('{:<40} {:>10.1f} MB'.format(
+                    '  peak memory', peak_memory(function) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare serving ranges of frames from a thread pool with a shared WaveSource
+against opening the file for every request.
+"""
+import argparse
+import concurrent.futures
+import numpy
+import wavy
+from .utils import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=600,
+                        help='Duration of the test file in seconds.')
+    parser.add_argument('--requests', type=int, default=10000,
+                        help='Number of ranges read.')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Number of threads serving the requests.')
+    args = parser.parse_args()
+
+    framerate, n_channels, n_frames = 48000, 2, args.seconds * 48000
+    # one second of audio per request, at random positions
+    starts = numpy.random.randint(0, n_frames - framerate, args.requests)
+
+    with temporary_folder() as dir_name:
+        file_path = create_wave_file(dir_name, 24, framerate, n_channels,
+                                     n_frames)
+        n_bytes = args.requests * framerate * n_channels * 3
+
+        def read_reopen(start):
+            return wavy.read(file_path, start=start, stop=start + framerate)
+
+        def serve(function):
+            with concurrent.futures.ThreadPoolExecutor(args.workers) as \
+                    executor:
+                for _ in executor.map(function, starts):
+                    pass
+
+        with wavy.WaveSource(file_path) as source:
+            def read_source(start):
+                return source.read_frames(start, start + framerate)
+
+            print_result('read (open per request)',
+                         measure(lambda: serve(read_reopen)), n_bytes)
+            print_result('WaveSource.read_frames',
+                         measure(lambda: serve(read_source)), n_bytes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare sequential reads of many files with wavy.read_many.
+"""
+import wavy
+from .utils import *
+
+N_FILES = 64
+
+
+def read_sequential(file_paths):
+    for file_path in file_paths:
+        wavy.read(file_path)
+
+
+def read_parallel(file_paths, workers):
+    for result in wavy.read_many(file_paths, workers=workers, ordered=False):
+        if result.error:
+            raise result.error
+
+
+def main():
+    with temporary_folder() as dir_name:
+        for n_frames in [4800, 480000]:
+            file_paths = [create_wave_file(dir_name, 16, 48000, 2, n_frames,
+                                           junk_size=2 * i)
+                          for i in range(N_FILES)]
+            n_bytes = N_FILES * n_frames * 4
+            print('{} files with {} frames'.format(N_FILES, n_frames))
+
+            seconds = measure(lambda: read_sequential(file_paths))
+            print_result('read', seconds, n_bytes)
+
+            for workers in [1, 2, 4, 8]:
+                seconds = measure(lambda: read_parallel(file_paths, workers))
+                print_result('read_many (workers={})'.format(workers),
+                             seconds, n_bytes)
+
+
+if __name__ == '__main__':
+    main()
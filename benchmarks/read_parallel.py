@@ -0,0 +1,43 @@
+"""
+Measure how reading one large file scales with the number of workers.
+"""
+import argparse
+import os
+import wavy
+from .utils import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=600,
+                        help='Duration of the test files in seconds.')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count(),
+                        help='Largest number of workers to measure.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 2
+    n_frames = args.seconds * framerate
+
+    workers = [1]
+    while workers[-1] * 2 <= args.max_workers:
+        workers.append(workers[-1] * 2)
+
+    with temporary_folder() as dir_name:
+        for sample_width, little_endian in [(16, True), (16, False),
+                                            (24, True), (24, False)]:
+            file_path = create_wave_file(dir_name, sample_width, framerate,
+                                         n_channels, n_frames, little_endian)
+            n_bytes = n_frames * n_channels * sample_width // 8
+            print('{} bit {}'.format(
+                sample_width, 'RIFF' if little_endian else 'RIFX'))
+
+            print_result('read', measure(lambda: wavy.read(file_path)),
+                         n_bytes)
+            for n in workers:
+                print_result('read(workers={})'.format(n), measure(
+                    lambda: wavy.read(file_path, workers=n)), n_bytes)
+            os.remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Compare reading a labelled region with wavy.read_region against reading the
+whole file and slicing the region out of it.
+"""
+import argparse
+import struct
+import wavy
+from .utils import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=600,
+                        help='Duration of the test file in seconds.')
+    parser.add_argument('--region', type=int, default=1,
+                        help='Duration of the region in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels, n_frames = 48000, 2, args.seconds * 48000
+    start, length = n_frames // 2, args.region * framerate
+
+    with temporary_folder() as dir_name:
+        file_path = create_wave_file(dir_name, 16, framerate, n_channels,
+                                     n_frames)
+
+        # label a region in the middle of the file, after the data
+        cue = struct.pack('<LLL4sLLL', 1, 1, 0, b'data', 0, 0, start)
+        labl = struct.pack('<L', 1) + b'clip\x00\x00'
+        ltxt = struct.pack('<LL4sHHHH', 1, length, b'rgn ', 0, 0, 0, 0)
+        adtl = b'adtl' + struct.pack('<4sL', b'labl', len(labl)) + labl + \
+            struct.pack('<4sL', b'ltxt', len(ltxt)) + ltxt
+        with open(file_path, 'ab') as file:
+            file.write(struct.pack('<4sL', b'cue ', len(cue)) + cue)
+            file.write(struct.pack('<4sL', b'LIST', len(adtl)) + adtl)
+
+        n_bytes = length * n_channels * 2
+
+        def read_slice():
+            return wavy.read(file_path).data[start:start + length]
+
+        print_result('read and slice', measure(read_slice), n_bytes)
+        print_result('read_region',
+                     measure(lambda: wavy.read_region(file_path, 'clip')),
+                     n_bytes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import numpy
+import os
+import struct
+import tempfile
+import timeit
+
+
+def create_wave_file(dir_name, sample_width, framerate, n_channels, n_frames,
+                     little_endian=True, junk_size=0):
+    """
+    Create a PCM WAVE file filled with random samples.
+
+    Args:
+        dir_name: Folder where to create the file.
+        sample_width: Sample width in bits.
+        framerate: Sampling frequency in Hz.
+        n_channels: Number of audio channels.
+        n_frames: Number of audio frames.
+        little_endian: Whether to write a RIFF (True) or RIFX (False) file.
+        junk_size: Size of a JUNK chunk written before the format chunk.
+
+    Returns:
+        str: Path to the created file.
+
+    """
+    prefix = '<' if little_endian else '>'
+    block_align = sample_width // 8 * n_channels
+    size = n_frames * block_align
+
+    # random bytes are valid samples for any integer width
+    data = numpy.random.bytes(size)
+
+    file_path = os.path.join(dir_name, '{}bit_{}Hz_{}ch_{}fr_{}_{}.wav'.format(
+        sample_width, framerate, n_channels, n_frames,
+        'riff' if little_endian else 'rifx', junk_size))
+
+    with open(file_path, 'wb') as file:
+        file.write(b'RIFF' if little_endian else b'RIFX')
+        file.write(struct.pack(prefix + 'L', 44 + junk_size + size))
+        file.write(b'WAVE')
+        file.write(b'JUNK')
+        file.write(struct.pack(prefix + 'L', junk_size))
+        file.write(bytes(junk_size))
+        file.write(b'fmt ')
+        file.write(struct.pack(prefix + 'LHHLLHH', 16, 1, n_channels,
+                               framerate, framerate * block_align,
+                               block_align, sample_width))
+        file.write(b'data')
+        file.write(struct.pack(prefix + 'L', size))
+        file.write(data)
+
+    return file_path
+
+
+def temporary_folder():
+    """
+    Get a temporary folder for benchmark files.
+    """
+    return tempfile.TemporaryDirectory(prefix='wavy_benchmark_')
+
+
+def measure(function, repeat=3):
+    """
+    Get the best time (in seconds) of a few runs of the function.
+    """
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def print_result(name, seconds, n_bytes):
+    """
+    Print timing and throughput for a benchmark.
+    """
+    print('{:<40} {:>10.4f} s {:>10.1f} MB/s'.format(
+        name, seconds, n_bytes / seconds / 1e6))
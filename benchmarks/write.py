@@ -0,0 +1,51 @@
+"""
+Compare writing files with wavy against scipy.io.wavfile.write.
+"""
+import argparse
+import numpy
+import os
+import scipy.io.wavfile
+import wavy
+from .utils import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=60,
+                        help='Duration of the test files in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 2
+    n_frames = args.seconds * framerate
+
+    with temporary_folder() as dir_name:
+        file_path = os.path.join(dir_name, 'test.wav')
+
+        for sample_width, dtype in [(16, numpy.int16), (24, numpy.int32),
+                                    (32, numpy.int32), (32, numpy.float32)]:
+            data = numpy.random.randint(
+                -2 ** (sample_width - 1), 2 ** (sample_width - 1),
+                (n_frames, n_channels), dtype=numpy.int64).astype(dtype)
+            n_bytes = n_frames * n_channels * sample_width // 8
+            wave_file = wavy.WaveFile(sample_width, framerate, data)
+            print('{} bit {}'.format(sample_width, data.dtype))
+
+            print_result('wavy.write', measure(
+                lambda: wavy.write(file_path, wave_file)), n_bytes)
+            print_result('wavy.write + wavy.read', measure(
+                lambda: (wavy.write(file_path, wave_file),
+                         wavy.read(file_path))), n_bytes)
+
+            # scipy only writes int32 data as 32 bit samples
+            if sample_width != 24:
+                print_result('scipy.io.wavfile.write', measure(
+                    lambda: scipy.io.wavfile.write(file_path, framerate,
+                                                   data)), n_bytes)
+                print_result('scipy write + read', measure(
+                    lambda: (scipy.io.wavfile.write(file_path, framerate,
+                                                    data),
+                             scipy.io.wavfile.read(file_path))), n_bytes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Measure 24 bit packing throughput on a single core, against a byte slicing
+implementation.
+"""
+import argparse
+import numpy
+import wavy.detail
+from .utils import *
+
+
+def pack_by_slicing(data, little_endian):
+    raw = numpy.ascontiguousarray(data, '<i4' if little_endian else '>i4') \
+        .view(numpy.uint8).reshape(-1, 4)
+    return numpy.ascontiguousarray(raw[:, :3] if little_endian else raw[:, 1:])
+
+
+def pack_by_blocks(data, little_endian):
+    for _ in wavy.detail.iter_packed_24_bit(data, little_endian):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=int, default=60,
+                        help='Duration of the test data in seconds.')
+    args = parser.parse_args()
+
+    framerate, n_channels = 48000, 2
+    n_frames = args.seconds * framerate
+    data = numpy.random.randint(-2 ** 23, 2 ** 23, (n_frames, n_channels),
+                                dtype=numpy.int32)
+    # throughput of the packed output
+    n_bytes = data.size * 3
+
+    for little_endian in [True, False]:
+        # packed samples are bit exact with the byte slicing
+        assert wavy.detail.pack_24_bit(data, little_endian).tobytes() == \
+            pack_by_slicing(data, little_endian).tobytes()
+
+        print('24 bit {}'.format('RIFF' if little_endian else 'RIFX'))
+        for name, function in [
+            ('byte slicing', lambda: pack_by_slicing(data, little_endian)),
+            ('pack_24_bit',
+             lambda: wavy.detail.pack_24_bit(data, little_endian)),
+            ('iter_packed_24_bit',
+             lambda: pack_by_blocks(data, little_endian))
+        ]:
+            print_result(name, measure(function), n_bytes)
+
+
+if __name__ == '__main__':
+    main()
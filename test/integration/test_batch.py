@@ -0,0 +1,101 @@
+import numpy
+import pytest
+import wavy
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_read_many(ordered, tmp_path):
+    """
+    Test read_many function with real audio files.
+    """
+    files = get_audio_files()
+
+    corrupted = str(tmp_path / 'corrupted.wav')
+    with open(corrupted, 'wb') as f:
+        f.write(b'RIFF\x00\x00\x00\x00WAVEfmt ')
+
+    paths = [file.file_path for file in files] + [corrupted]
+    results = {result.file: result
+               for result in read_many(paths, workers=4, ordered=ordered)}
+
+    assert len(results) == len(paths)
+
+    for file in files:
+        result = results[file.file_path]
+        assert result.error is None
+        assert numpy.array_equal(result.result.data,
+                                 read(file.file_path).data)
+
+    assert isinstance(results[corrupted].error, WaveFileIsCorrupted)
+    assert results[corrupted].result is None
+
+
+def test_info_many():
+    """
+    Test info_many function with real audio files.
+    """
+    paths = [file.file_path for file in get_audio_files()]
+    results = list(info_many(paths, workers=4))
+
+    assert [result.file for result in results] == paths
+    assert [result.result for result in results] == \
+        [info(path) for path in paths]
+
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_read_many_unexpected_error(workers, mocker):
+    """
+    Test a file raising an unexpected error does not stop the batch.
+    """
+    paths = [file.file_path for file in get_audio_files()[:4]]
+    bad = paths[1]
+    wavy_read = read
+
+    def read_mock(file, **kwargs):
+        if file == bad:
+            raise UnicodeDecodeError('utf-8', b'\xe9', 0, 1, 'invalid')
+        return wavy_read(file, **kwargs)
+
+    mocker.patch('wavy.read', side_effect=read_mock)
+
+    results = list(read_many(paths, workers=workers))
+
+    assert [result.file for result in results] == paths
+    assert isinstance(results[1].error, UnicodeDecodeError)
+    assert results[1].result is None
+    for result in results[:1] + results[2:]:
+        assert result.error is None
+        assert numpy.array_equal(result.result.data,
+                                 wavy_read(result.file).data)
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'channels': 'a'}, WaveValueError),
+    ({'dtype': 'int8'}, WaveValueError),
+    ({'foo': 1}, TypeError)
+])
+def test_read_many_invalid_arguments(kwargs, error, mocker):
+    """
+    Test invalid arguments are raised once, before any file is read.
+    """
+    paths = [file.file_path for file in get_audio_files()]
+    wavy_read = mocker.spy(wavy, 'read')
+
+    with pytest.raises(error):
+        list(read_many(paths, **kwargs))
+    wavy_read.assert_not_called()
+
+
+def test_info_many_invalid_arguments(mocker):
+    """
+    Test unknown arguments are raised once, before any file is read.
+    """
+    paths = [file.file_path for file in get_audio_files()]
+    wavy_info = mocker.spy(wavy, 'info')
+
+    with pytest.raises(TypeError):
+        list(info_many(paths, foo=1))
+    wavy_info.assert_not_called()
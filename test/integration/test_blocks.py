@@ -0,0 +1,25 @@
+import numpy
+import pytest
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+@pytest.mark.parametrize('blocksize, overlap', [(1000, 0), (1000, 250)])
+def test_blocks(file, blocksize, overlap):
+    """
+    Test blocks function with real audio files.
+    """
+    data = read(file.file_path).data
+
+    step = blocksize - overlap
+    for i, block in enumerate(blocks(file.file_path, blocksize, overlap)):
+        expected = data[i * step:i * step + blocksize]
+        assert block.shape == (blocksize, file.n_channels)
+        assert block.dtype == file.dtype
+        # all frames after the end of the file are zero
+        assert numpy.array_equal(block[:len(expected)], expected)
+        assert not block[len(expected):].any()
+
+    # make sure all the frames were read
+    assert i * step + blocksize >= file.n_frames
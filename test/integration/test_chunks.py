@@ -0,0 +1,102 @@
+import io
+import numpy
+import os
+import pytest
+import struct
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_chunks(file):
+    """
+    Test chunks function with real audio files.
+    """
+    table = chunks(file.file_path)
+    ids = [chunk.id for chunk in table]
+
+    assert b'fmt ' in ids
+    assert ids.count(b'data') == 1
+    data = table[ids.index(b'data')]
+    assert data.size == file.n_frames * file.n_channels * \
+        file.sample_width // 8
+
+    # chunks cover the whole file
+    end = table[-1].offset + table[-1].size
+    assert end + end % 2 >= os.path.getsize(file.file_path) - 1
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_chunks_buffered_stream(file):
+    """
+    Test the whole chunk table is listed for streams already holding
+    buffered bytes.
+    """
+    with open(file.file_path, 'rb') as stream:
+        stream.peek(1)
+        assert chunks(stream) == chunks(file.file_path)
+
+
+def test_chunks_buffered_stream_after_data():
+    """
+    Test chunks after the data are listed for pre-buffered streams.
+    """
+    file = next(file for file in get_audio_files() if file.tags_after_data)
+    with open(file.file_path, 'rb') as stream:
+        stream.read(1)
+        stream.seek(0)
+        table = chunks(stream)
+
+    ids = [chunk.id for chunk in table]
+    assert ids[:2] == [b'fmt ', b'data']
+    assert b'LIST' in ids[2:]
+
+
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_chunks_after_data(little_endian, tmp_path):
+    """
+    Test chunks after the data are listed.
+    """
+    prefix = '<' if little_endian else '>'
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int16)
+    create_wave_file(file_path, data, 16, little_endian=little_endian)
+
+    with open(file_path, 'ab') as file:
+        file.write(struct.pack(prefix + '4sL', b'iXML', 5) + b'<x/>\n\x00')
+        file.write(struct.pack(prefix + '4sL', b'JUNK', 2) + b'\x00\x00')
+
+    assert [chunk.id for chunk in chunks(file_path)] == \
+        [b'fmt ', b'data', b'iXML', b'JUNK']
+    assert chunks(file_path)[2] == ChunkInfo(b'iXML', 44 + 200 + 8, 5)
+
+
+def test_chunks_rf64_larger_than_4gb(tmp_path):
+    """
+    Test chunks of files with more than 4 GB of data.
+    """
+    file_path = str(tmp_path / 'large.wav')
+    n_frames = 2 ** 30 + 10
+    tail = numpy.arange(-20, 20, dtype=numpy.int16).reshape(-1, 2)
+    create_sparse_wave_file(file_path, n_frames, tail, 16)
+
+    table = chunks(file_path)
+    assert [chunk.id for chunk in table] == [b'ds64', b'fmt ', b'data']
+    assert table[-1].size == n_frames * 4
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_chunks_non_seekable(file):
+    """
+    Test chunks stops reading at the data chunk of streams that cannot seek.
+    """
+    with open(file.file_path, 'rb') as f:
+        pipe = MockPipe(f.read())
+
+    table = chunks(io.BufferedReader(pipe, 1024), buffer_size=1024)
+
+    # only the header is read, chunks after the data cannot be reached
+    assert pipe.stream.tell() <= 1024
+    expected = chunks(file.file_path)
+    assert table == expected[:[chunk.id for chunk in expected].index(
+        b'data') + 1]
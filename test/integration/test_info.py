@@ -1,4 +1,8 @@
+import io
+import numpy
+import os
 import pytest
+import struct
 from wavy import *
 from test.utils import *
 
@@ -18,3 +22,152 @@ def test_read(file):
     assert result.n_frames == file.n_frames
     assert result.tags == file.tags
 
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_info_from_memory(file):
+    """
+    Test info function with in-memory files.
+    """
+    with open(file.file_path, 'rb') as f:
+        assert info(f.read()) == info(file.file_path)
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+@pytest.mark.parametrize('buffer_size', [1, 16, 64])
+def test_info_small_buffer(file, buffer_size):
+    """
+    Test info function when the header does not fit the first read.
+    """
+    assert info(file.file_path, buffer_size) == info(file.file_path)
+
+
+def test_index(tmp_path):
+    """
+    Test index returns the same info as the info function.
+    """
+    files = get_audio_files()
+
+    with Index(str(tmp_path / 'index.db')) as index:
+        assert index.refresh(os.path.dirname(files[0].file_path)) == []
+        for file in files:
+            assert index.info(file.file_path) == info(file.file_path)
+
+
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_info_tags_after_data(little_endian, tmp_path):
+    """
+    Test tags after the data are found.
+    """
+    prefix = '<' if little_endian else '>'
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int16)
+    create_wave_file(file_path, data, 16, little_endian=little_endian)
+
+    with open(file_path, 'ab') as file:
+        file.write(struct.pack(prefix + '4sL', b'LIST', 16) + b'INFO' +
+                   struct.pack(prefix + '4sL', b'IART', 4) + b'abc\x00')
+
+    assert info(file_path).tags == Tags(artist='abc')
+    assert read(file_path).tags == Tags(artist='abc')
+
+
+def test_info_tags_after_data_not_utf8(tmp_path):
+    """
+    Test tags after the data written in a Windows code page are read.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int16)
+    create_wave_file(file_path, data, 16)
+
+    value = 'Caf\xe9s\x00'.encode('cp1252')
+    with open(file_path, 'ab') as file:
+        file.write(struct.pack('<4sL', b'LIST', 12 + len(value)) + b'INFO' +
+                   struct.pack('<4sL', b'ICMT', len(value)) + value)
+
+    expected = Tags(comment='Caf\ufffds')
+    assert info(file_path).tags == expected
+    assert read(file_path).tags == expected
+
+
+def test_info_tags_after_data_rf64(tmp_path):
+    """
+    Test tags after more than 4 GB of data are found.
+    """
+    file_path = str(tmp_path / 'large.wav')
+    tail = numpy.arange(-20, 20, dtype=numpy.int16).reshape(-1, 2)
+    create_sparse_wave_file(file_path, 2 ** 30 + 10, tail, 16)
+
+    with open(file_path, 'ab') as file:
+        file.write(struct.pack('<4sL', b'LIST', 16) + b'INFO' +
+                   struct.pack('<4sL', b'INAM', 4) + b'abc\x00')
+
+    assert info(file_path).tags == Tags(name='abc')
+
+
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_info_bext_ixml(little_endian, tmp_path):
+    """
+    Test bext and iXML chunks are parsed.
+    """
+    prefix = '<' if little_endian else '>'
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int16)
+    create_wave_file(file_path, data, 16, little_endian=little_endian)
+
+    bext = struct.pack(prefix + '256s32s32s10s8sLLH64shhhhh180x', b'take 1',
+                       b'recorder', b'ref', b'2021-05-06', b'07:08:09',
+                       48000 * 3600, 0, 2, b'\x01' * 64, -2300, 700, -100,
+                       -1500, -1800) + b'A=PCM\r\n'
+    ixml = b'<BWFXML><SCENE>1</SCENE></BWFXML>'
+
+    with open(file_path, 'ab') as file:
+        file.write(struct.pack(prefix + '4sL', b'bext', len(bext)) + bext +
+                   b'\x00')
+        file.write(struct.pack(prefix + '4sL', b'iXML', len(ixml)) + ixml)
+
+    result = info(file_path)
+    assert result.bext == Bext(
+        description='take 1', originator='recorder',
+        originator_reference='ref', origination_date='2021-05-06',
+        origination_time='07:08:09', time_reference=48000 * 3600, version=2,
+        umid=b'\x01' * 64, loudness_value=-23, loudness_range=7,
+        max_true_peak_level=-1, max_momentary_loudness=-15,
+        max_short_term_loudness=-18, coding_history='A=PCM\r\n')
+    assert result.ixml == ixml.decode()
+    assert result.n_frames == 100
+
+
+def test_info_no_bext_ixml():
+    """
+    Test files without bext and iXML chunks have none.
+    """
+    for file in get_audio_files():
+        result = info(file.file_path)
+        assert result.bext is None
+        assert result.ixml is None
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_info_buffered_stream(file):
+    """
+    Test streams already holding buffered bytes are fully parsed.
+    """
+    with open(file.file_path, 'rb') as stream:
+        stream.peek(1)
+        assert info(stream) == info(file.file_path)
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_info_non_seekable(file):
+    """
+    Test info stops reading at the data chunk of streams that cannot seek.
+    """
+    with open(file.file_path, 'rb') as f:
+        pipe = MockPipe(f.read())
+
+    result = info(io.BufferedReader(pipe, 1024), buffer_size=1024)
+
+    # only the header is read, tags after the data cannot be reached
+    assert pipe.stream.tell() <= 1024
+    assert result.n_frames == file.n_frames
+    assert result.tags == (None if file.tags_after_data else file.tags)
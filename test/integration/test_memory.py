@@ -0,0 +1,33 @@
+import numpy
+import pytest
+import tracemalloc
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8),
+    (16, numpy.int16),
+    (24, numpy.int32),
+    (32, numpy.int32),
+    (32, numpy.float32),
+    (64, numpy.float64)
+])
+def test_read_peak_memory(sample_width, dtype, tmp_path):
+    """
+    Test that reading a file does not need more memory than the data itself.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.random.randint(-2 ** 7, 2 ** 7, size=(2 ** 19, 2)).astype(dtype)
+    create_wave_file(file_path, data, sample_width)
+
+    tracemalloc.start()
+    try:
+        result = read(file_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert numpy.array_equal(result.data, data)
+    # allow for some overhead on top of the data
+    assert peak < 1.05 * data.nbytes + 2 ** 18
@@ -0,0 +1,78 @@
+import numpy
+import os
+import pytest
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+@pytest.mark.parametrize('samples_per_bucket', [1, 100, 1000000])
+def test_peaks(file, samples_per_bucket):
+    """
+    Test peaks function with real audio files.
+    """
+    data = read(file.file_path).data
+    data = data.reshape(len(data), -1)
+
+    result = peaks(file.file_path, samples_per_bucket)
+
+    # RMS of 8 bit samples is relative to silence
+    zero = 128 if file.sample_width == 8 else 0
+
+    n_buckets = -(-file.n_frames // samples_per_bucket)
+    for values in result:
+        assert len(values) == n_buckets
+
+    for i in [0, n_buckets // 2, n_buckets - 1]:
+        bucket = data[i * samples_per_bucket:(i + 1) * samples_per_bucket]
+        assert numpy.array_equal(result.min.reshape(n_buckets, -1)[i],
+                                 bucket.min(axis=0))
+        assert numpy.array_equal(result.max.reshape(n_buckets, -1)[i],
+                                 bucket.max(axis=0))
+        assert numpy.allclose(result.rms.reshape(n_buckets, -1)[i],
+                              numpy.sqrt(numpy.mean(
+                                  (bucket.astype(numpy.float64) - zero) ** 2,
+                                  axis=0)))
+
+
+def test_peaks_cache(tmp_path):
+    """
+    Test cached peaks are invalidated when the file changes.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    create_wave_file(file_path, numpy.arange(-50, 50, dtype=numpy.int16), 16)
+
+    result = peaks(file_path, 10, cache=True)
+    assert os.path.exists(file_path + '.peaks')
+    assert numpy.array_equal(result.max, numpy.arange(-41, 50, 10))
+
+    # cached peaks are returned as long as the file does not change
+    assert numpy.array_equal(peaks(file_path, 10, cache=True).max,
+                             result.max)
+
+    create_wave_file(file_path, numpy.arange(50, -50, -1, dtype=numpy.int16),
+                     16)
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    result = peaks(file_path, 10, cache=True)
+    assert numpy.array_equal(result.max, numpy.arange(50, -50, -10))
+
+    # other bucket sizes replace the cache
+    assert len(peaks(file_path, 50, cache=True).max) == 2
+    assert len(peaks(file_path, 10, cache=True).max) == 10
+
+
+@pytest.mark.parametrize('samples_per_bucket', [0, 2.5, 10.0])
+def test_peaks_bad_bucket(samples_per_bucket, tmp_path):
+    """
+    Test buckets must be a positive integer, even if peaks are cached.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    create_wave_file(file_path, numpy.arange(-50, 50, dtype=numpy.int16), 16)
+    peaks(file_path, 10, cache=True)
+
+    for cache in (False, True):
+        with pytest.raises(WaveValueError, match="Argument "
+                           "'samples_per_bucket' must be a positive integer."):
+            peaks(file_path, samples_per_bucket, cache=cache)
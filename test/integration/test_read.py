@@ -1,3 +1,5 @@
+import io
+import numpy
 import pytest
 from wavy import *
 from test.utils import *
@@ -19,3 +21,294 @@ def test_read(file):
     assert result.data.dtype == file.dtype
     assert result.tags == file.tags
 
+
+
+@pytest.mark.parametrize('file',
+                         filter(lambda x: x.sample_width != 24,
+                                get_audio_files()),
+                         ids=lambda x: str(x))
+def test_read_mmap(file):
+    """
+    Test read function maps the same data as a normal read.
+    """
+    # read file
+    result = read(file.file_path, mmap=True)
+
+    assert isinstance(result.data, numpy.memmap)
+    assert not result.data.flags.writeable
+    assert result.n_frames == file.n_frames
+    assert numpy.array_equal(result.data, read(file.file_path).data)
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_read_range(file):
+    """
+    Test read function only returns the requested frames.
+    """
+    data = read(file.file_path).data
+
+    # read frames
+    result = read(file.file_path, start=100, stop=200)
+    assert numpy.array_equal(result.data, data[100:200])
+
+    # read seconds
+    result = read(file.file_path, start=0.1, stop=-0.1, in_seconds=True)
+    offset = round(0.1 * file.framerate)
+    assert numpy.array_equal(result.data, data[offset:-offset])
+
+    if file.sample_width != 24:
+        result = read(file.file_path, mmap=True, start=-100)
+        assert numpy.array_equal(result.data, data[-100:])
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+@pytest.mark.parametrize('buffer_type', [bytes, bytearray, memoryview])
+def test_read_from_memory(file, buffer_type):
+    """
+    Test read function with in-memory files.
+    """
+    with open(file.file_path, 'rb') as f:
+        buffer = buffer_type(f.read())
+
+    result = read(buffer)
+    expected = read(file.file_path)
+
+    assert result.n_frames == file.n_frames
+    assert result.tags == file.tags
+    assert numpy.array_equal(result.data, expected.data)
+
+    # data is a view of the buffer unless it needs decoding
+    assert numpy.shares_memory(result.data, numpy.frombuffer(
+        buffer, numpy.uint8)) == (file.sample_width != 24)
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+def test_read_non_seekable(file):
+    """
+    Test read function with a stream that cannot seek.
+    """
+    with open(file.file_path, 'rb') as f:
+        stream = io.BufferedReader(MockPipe(f.read()))
+
+    result = read(stream)
+
+    # tags after the data cannot be reached without seeking
+    assert result.tags == (None if file.tags_after_data else file.tags)
+    assert numpy.array_equal(result.data, read(file.file_path).data)
+
+
+def test_read_non_seekable_mmap():
+    """
+    Test read function cannot map a stream that cannot seek.
+    """
+    file = get_audio_files()[0]
+    with open(file.file_path, 'rb') as f:
+        stream = io.BufferedReader(MockPipe(f.read()))
+
+    with pytest.raises(WaveValueError,
+                       match='mmap requires a file on disk or in memory.'):
+        read(stream, mmap=True)
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8),
+    (16, numpy.int16),
+    (24, numpy.int32),
+    (32, numpy.int32),
+    (32, numpy.float32),
+    (64, numpy.float64)
+])
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_read_rifx(sample_width, dtype, little_endian, tmp_path):
+    """
+    Test read function with both RIFF and RIFX files.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int32).astype(dtype).reshape(-1, 2)
+    create_wave_file(file_path, data, sample_width,
+                     little_endian=little_endian)
+
+    result = read(file_path)
+
+    assert result.data.dtype == dtype
+    assert numpy.array_equal(result.data, data)
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+@pytest.mark.parametrize('mmap', [False, True])
+def test_read_lazy(file, mmap):
+    """
+    Test lazy reading with real audio files.
+    """
+    if mmap and file.sample_width == 24:
+        pytest.skip('Memory mapping is not supported for 24 bits.')
+
+    expected = read(file.file_path, start=1, stop=-1)
+
+    with open(file.file_path, 'rb') as f:
+        content = f.read()
+
+    for source in [file.file_path, content]:
+        result = read(source, mmap=mmap, start=1, stop=-1, lazy=True)
+
+        assert result.n_channels == expected.n_channels
+        assert result.n_frames == expected.n_frames
+        assert result.tags == expected.tags
+        assert not result.is_loaded
+
+        assert numpy.array_equal(result.data, expected.data)
+        assert result.is_loaded
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8), (16, numpy.int16), (24, numpy.int32),
+    (32, numpy.int32), (32, numpy.float32), (64, numpy.float64)
+])
+@pytest.mark.parametrize('little_endian', [True, False])
+@pytest.mark.parametrize('n_channels, channels', [
+    (1, [0]), (6, [5]), (6, [4, 0, 1]), (64, [63, 1, 32, 2])
+])
+def test_read_channels(sample_width, dtype, little_endian, n_channels,
+                       channels, tmp_path):
+    """
+    Test only the selected channels are read from multi-channel files.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = (numpy.arange(-10 * n_channels, 10 * n_channels) % 100) \
+        .astype(dtype).reshape(-1, n_channels)
+    create_wave_file(file_path, data, sample_width,
+                     little_endian=little_endian)
+
+    expected = data[1:, channels]
+    if len(channels) == 1:
+        expected = expected.ravel()
+
+    mmap_options = [False] if sample_width == 24 else [False, True]
+    for mmap in mmap_options:
+        result = read(file_path, mmap=mmap, start=1, channels=channels)
+
+        assert result.n_channels == len(channels)
+        # mapping all channels keeps the byte order of the file
+        assert result.data.dtype.newbyteorder('=') == dtype
+        assert result.data.flags.c_contiguous
+        assert numpy.array_equal(result.data, expected)
+
+    result = read(file_path, start=1, channels=channels, lazy=True)
+    assert result.n_channels == len(channels)
+    assert numpy.array_equal(result.data, expected)
+
+    blocks_data = numpy.concatenate(list(blocks(file_path, 7,
+                                                channels=channels)))
+    assert numpy.array_equal(blocks_data[1:len(data)], expected)
+
+
+@pytest.mark.parametrize('sample_width, file_dtype', [
+    (8, numpy.uint8), (16, numpy.int16), (24, numpy.int32),
+    (32, numpy.int32), (32, numpy.float32), (64, numpy.float64)
+])
+@pytest.mark.parametrize('little_endian', [True, False])
+@pytest.mark.parametrize('dtype', ['float32', 'float64', 'int16'])
+def test_read_dtype(sample_width, file_dtype, little_endian, dtype, tmp_path):
+    """
+    Test data is converted to dtype while being read.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    # values that all sample widths can store exactly
+    values = (numpy.arange(-128, 128) / 128).reshape(-1, 2)
+    if file_dtype == numpy.uint8:
+        data = (values * 128 + 128).astype(file_dtype)
+    elif numpy.dtype(file_dtype).kind == 'i':
+        data = (values * 2 ** (sample_width - 1)).astype(file_dtype)
+    else:
+        data = values.astype(file_dtype)
+    create_wave_file(file_path, data, sample_width,
+                     little_endian=little_endian)
+
+    # convert the samples after reading them
+    if dtype == 'int16' and numpy.dtype(file_dtype).kind == 'f':
+        expected = numpy.clip(values * 2 ** 15, -2 ** 15, 2 ** 15 - 1)
+    elif dtype == 'int16':
+        expected = values * 2 ** 15
+    else:
+        expected = values
+    expected = expected.astype(dtype)
+
+    mmap_options = [False] if sample_width == 24 else [False, True]
+    for mmap in mmap_options:
+        result = read(file_path, mmap=mmap, dtype=dtype)
+        # mapped data that needs no conversion keeps the byte order of the
+        # file
+        assert result.data.dtype.newbyteorder('=') == dtype
+        assert result.sample_width == numpy.dtype(dtype).itemsize * 8
+        assert numpy.array_equal(result.data, expected)
+
+        result = read(file_path, mmap=mmap, dtype=dtype, channels=[1])
+        assert numpy.array_equal(result.data, expected[:, 1])
+
+    result = read(file_path, dtype=dtype, lazy=True)
+    assert result.sample_width == numpy.dtype(dtype).itemsize * 8
+    assert numpy.array_equal(result.data, expected)
+
+    blocks_data = numpy.concatenate(list(blocks(file_path, 30, dtype=dtype)))
+    assert blocks_data.dtype == dtype
+    assert numpy.array_equal(blocks_data[:len(data)], expected)
+
+
+@pytest.mark.parametrize('sample_width, file_dtype', [
+    (8, numpy.uint8), (16, numpy.int16), (24, numpy.int32),
+    (32, numpy.int32), (32, numpy.float32), (64, numpy.float64)
+])
+@pytest.mark.parametrize('little_endian', [True, False])
+@pytest.mark.parametrize('kwargs', [
+    {}, dict(start=3, stop=-5), dict(channels=[2, 0]), dict(dtype='float32'),
+    dict(lazy=True)
+])
+def test_read_workers(sample_width, file_dtype, little_endian, kwargs,
+                      tmp_path, mocker):
+    """
+    Test read function with many threads gives the same data.
+    """
+    # small ranges so that every worker gets some frames
+    mocker.patch('wavy.detail.read.MIN_RANGE_SIZE', 64)
+
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-600, 600, dtype=numpy.int32)
+    if sample_width == 24:
+        data = data * 2 ** 12
+    data = data.astype(file_dtype).reshape(-1, 3)
+    create_wave_file(file_path, data, sample_width,
+                     little_endian=little_endian)
+
+    expected = read(file_path, **kwargs).data
+    result = read(file_path, workers=4, **kwargs).data
+
+    assert result.dtype == expected.dtype
+    assert numpy.array_equal(result, expected)
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_read_truncated(mmap, tmp_path):
+    """
+    Test files cut short are reported as corrupted.
+    """
+    file_path = str(tmp_path / 'truncated.wav')
+    create_wave_file(file_path, numpy.arange(1000, dtype=numpy.int16), 16)
+    with open(file_path, 'r+b') as file:
+        file.truncate(1000)
+
+    with pytest.raises(WaveFileIsCorrupted):
+        read(file_path, mmap=mmap)
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_read_from_memory_truncated(mmap):
+    """
+    Test in-memory files cut short are reported as corrupted.
+    """
+    for file in get_audio_files():
+        if file.sample_width == 24:
+            continue
+        with open(file.file_path, 'rb') as f:
+            buffer = f.read()[:5000]
+        with pytest.raises(WaveFileIsCorrupted):
+            read(buffer, mmap=mmap)
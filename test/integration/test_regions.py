@@ -0,0 +1,102 @@
+import numpy
+import pytest
+import struct
+from wavy import *
+from test.utils import *
+
+
+def append_chunks(file_path, chunks, little_endian=True):
+    """
+    Append list of (name, data) chunks to the file.
+    """
+    prefix = '<' if little_endian else '>'
+    with open(file_path, 'ab') as file:
+        for name, data in chunks:
+            file.write(struct.pack(prefix + '4sL', name, len(data)) + data +
+                       b'\x00' * (len(data) % 2))
+
+
+def create_region_file(file_path, data, sample_width, little_endian=True):
+    """
+    Create a file with cue points, labels and a sample loop after the data.
+    """
+    prefix = '<' if little_endian else '>'
+    create_wave_file(file_path, data, sample_width,
+                     little_endian=little_endian)
+
+    cue = struct.pack(prefix + 'L', 3) + b''.join(
+        struct.pack(prefix + 'LL4sLLL', id, 0, b'data', 0, 0, frame)
+        for id, frame in [(1, 100), (2, 300), (3, 500)])
+
+    adtl = b'adtl' + b''.join(
+        struct.pack(prefix + '4sL', name, len(chunk)) + chunk +
+        b'\x00' * (len(chunk) % 2)
+        for name, chunk in [
+            (b'labl', struct.pack(prefix + 'L', 1) + b'kick\x00'),
+            (b'ltxt', struct.pack(prefix + 'LL4sHHHH', 1, 50, b'rgn ', 0, 0,
+                                  0, 0)),
+            (b'labl', struct.pack(prefix + 'L', 2) + b'snare\x00')
+        ])
+
+    smpl = struct.pack(prefix + '9L', 0, 0, 0, 60, 0, 0, 0, 1, 0) + \
+        struct.pack(prefix + '6L', 3, 0, 500, 699, 0, 0)
+
+    append_chunks(file_path, [(b'cue ', cue), (b'LIST', adtl),
+                              (b'smpl', smpl)], little_endian)
+
+
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_info_regions(little_endian, tmp_path):
+    """
+    Test regions are found after the data.
+    """
+    file_path = str(tmp_path / 'regions.wav')
+    data = numpy.arange(-1000, 1000, dtype=numpy.int16)
+    create_region_file(file_path, data, 16, little_endian)
+
+    assert info(file_path).regions == [Region(1, 100, 50, 'kick'),
+                                       Region(2, 300, 0, 'snare'),
+                                       Region(3, 500, 200, None)]
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8),
+    (16, numpy.int16),
+    (24, numpy.int32),
+    (32, numpy.float32)
+])
+@pytest.mark.parametrize('label_or_id, frames', [
+    ('kick', slice(100, 150)),
+    (1, slice(100, 150)),
+    ('snare', slice(300, 500)),
+    (3, slice(500, 700))
+])
+def test_read_region(sample_width, dtype, label_or_id, frames, tmp_path):
+    """
+    Test regions read the same frames as slicing the data.
+    """
+    file_path = str(tmp_path / 'regions.wav')
+    data = (numpy.arange(2000 * 2) % 200).astype(dtype).reshape(-1, 2)
+    create_region_file(file_path, data, sample_width)
+
+    region = read_region(file_path, label_or_id)
+    assert numpy.array_equal(region.data, data[frames])
+    assert region.framerate == 8000
+
+    region = read_region(file_path, label_or_id, channels=[1])
+    assert numpy.array_equal(region.data, data[frames, 1])
+
+
+def test_read_region_not_found(tmp_path):
+    """
+    Test error is raised for missing regions.
+    """
+    file_path = str(tmp_path / 'regions.wav')
+    create_region_file(file_path, numpy.zeros(1000, numpy.int16), 16)
+
+    with pytest.raises(WaveValueError):
+        read_region(file_path, 'hat')
+
+    for file in get_audio_files()[:1]:
+        with pytest.raises(WaveValueError):
+            read_region(file.file_path, 1)
@@ -0,0 +1,56 @@
+import numpy
+import pytest
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8), (16, numpy.int16), (24, numpy.int32),
+    (32, numpy.int32), (32, numpy.float32), (64, numpy.float64)
+])
+@pytest.mark.parametrize('header', [b'RF64', b'BW64'])
+def test_read_rf64(sample_width, dtype, header, tmp_path):
+    """
+    Test read function with RF64 and BW64 files.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int32).astype(dtype).reshape(-1, 2)
+    create_wave_file(file_path, data, sample_width, header=header)
+
+    assert info(file_path).n_frames == 50
+    assert numpy.array_equal(read(file_path).data, data)
+    assert numpy.array_equal(
+        numpy.concatenate(list(blocks(file_path, 10))), data)
+    if sample_width != 24:
+        assert numpy.array_equal(read(file_path, mmap=True).data, data)
+
+
+@pytest.mark.parametrize('header', [b'RF64', b'BW64'])
+def test_read_rf64_larger_than_4gb(header, tmp_path):
+    """
+    Test files with more than 4 GB of data, only the end of the data is
+    written so the file is sparse on disk.
+    """
+    file_path = str(tmp_path / 'large.wav')
+    n_frames = 2 ** 30 + 10
+    tail = numpy.arange(-20, 20, dtype=numpy.int16).reshape(-1, 2)
+    create_sparse_wave_file(file_path, n_frames, tail, 16, header=header)
+
+    file_info = info(file_path)
+    assert file_info.n_frames == n_frames
+    assert file_info.n_channels == 2
+    assert file_info.n_frames * 4 > 2 ** 32
+
+    # frames at the end of the data
+    assert numpy.array_equal(read(file_path, start=-20).data, tail)
+    assert numpy.array_equal(
+        read(file_path, start=-20, channels=[1], dtype='float32').data,
+        tail[:, 1] / 2 ** 15)
+    assert numpy.array_equal(read(file_path, start=-20, lazy=True).data,
+                             tail)
+
+    # map the whole data
+    data = read(file_path, mmap=True).data
+    assert data.shape == (n_frames, 2)
+    assert numpy.array_equal(data[-20:], tail)
+    assert not data[:10].any()
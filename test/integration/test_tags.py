@@ -0,0 +1,52 @@
+import numpy
+import os
+import pytest
+import shutil
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('file', get_audio_files(), ids=lambda x: str(x))
+@pytest.mark.parametrize('tags', [
+    Tags(name='a'), Tags(name='name' * 100, comment='comment'), None
+])
+def test_update_tags(file, tags, tmp_path):
+    """
+    Test update_tags function with real audio files.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    shutil.copy(file.file_path, file_path)
+    data = chunks(file_path)[[chunk.id for chunk in chunks(file_path)]
+                             .index(b'data')]
+
+    update_tags(file_path, tags)
+
+    result = read(file_path)
+    assert result.tags == tags
+    assert numpy.array_equal(result.data, read(file.file_path).data)
+    # data is not moved
+    assert data in chunks(file_path)
+
+    # updating again does not grow the file
+    size = os.path.getsize(file_path)
+    update_tags(file_path, tags)
+    assert os.path.getsize(file_path) == size
+    assert read(file_path).tags == tags
+
+
+def test_update_tags_rf64_larger_than_4gb(tmp_path):
+    """
+    Test tags of files with more than 4 GB of data.
+    """
+    file_path = str(tmp_path / 'large.wav')
+    n_frames = 2 ** 30 + 10
+    tail = numpy.arange(-20, 20, dtype=numpy.int16).reshape(-1, 2)
+    create_sparse_wave_file(file_path, n_frames, tail, 16)
+
+    update_tags(file_path, Tags(name='a'))
+    update_tags(file_path, Tags(name='b' * 50))
+
+    file_info = info(file_path)
+    assert file_info.tags == Tags(name='b' * 50)
+    assert file_info.n_frames == n_frames
+    assert numpy.array_equal(read(file_path, start=-20).data, tail)
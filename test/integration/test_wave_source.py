@@ -0,0 +1,33 @@
+import concurrent.futures
+import numpy
+import pytest
+from wavy import *
+from test.utils import *
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8), (16, numpy.int16), (24, numpy.int32),
+    (32, numpy.float32)
+])
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_wave_source_threads(sample_width, dtype, little_endian, tmp_path):
+    """
+    Test many threads reading ranges of frames from the same source.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-1000, 1000, dtype=numpy.int32)
+    if sample_width == 24:
+        data = data * 2 ** 10
+    data = data.astype(dtype).reshape(-1, 2)
+    create_wave_file(file_path, data, sample_width,
+                     little_endian=little_endian)
+
+    ranges = [(start, start + 100) for start in range(0, 1000, 7)]
+
+    with WaveSource(file_path) as source:
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda r: source.read_frames(*r),
+                                        ranges))
+
+    for (start, stop), result in zip(ranges, results):
+        assert numpy.array_equal(result, data[start:stop])
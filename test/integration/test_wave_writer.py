@@ -0,0 +1,49 @@
+import numpy
+import pytest
+from wavy import *
+
+
+@pytest.mark.parametrize('sample_width, dtype, format', [
+    (8, numpy.uint8, 'pcm'), (16, numpy.int16, 'pcm'),
+    (24, numpy.int32, 'pcm'), (32, numpy.int32, 'pcm'),
+    (32, numpy.float32, 'float'), (64, numpy.float64, 'float')
+])
+@pytest.mark.parametrize('little_endian, rf64', [
+    (True, False), (False, False), (True, True)
+])
+@pytest.mark.parametrize('extensible', [False, True])
+def test_wave_writer(sample_width, dtype, format, little_endian, rf64,
+                     extensible, tmp_path):
+    """
+    Test files written in blocks are read back.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.int32)
+    if sample_width == 24:
+        data = data * 2 ** 16
+    data = data.astype(dtype).reshape(-1, 2)
+
+    with WaveWriter(file_path, sample_width, 8000, 2, format=format,
+                    extensible=extensible, little_endian=little_endian,
+                    rf64=rf64) as writer:
+        for start in range(0, len(data), 15):
+            writer.write(data[start:start + 15])
+
+    file_info = info(file_path)
+    assert file_info.sample_width == sample_width
+    assert file_info.n_channels == 2
+    assert file_info.n_frames == 50
+    assert numpy.array_equal(read(file_path).data, data)
+
+
+def test_wave_writer_not_closed(tmp_path):
+    """
+    Test file is readable while writing when flushed.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-50, 50, dtype=numpy.float32)
+
+    writer = WaveWriter(file_path, 32, 8000, 1, format='float', flush_every=50)
+    writer.write(data)
+    assert numpy.array_equal(read(file_path).data, data)
+    writer.close()
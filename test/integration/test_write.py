@@ -0,0 +1,67 @@
+import numpy
+import pytest
+import scipy.io.wavfile
+from wavy import *
+
+
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8), (16, numpy.int16), (24, numpy.int32),
+    (32, numpy.int32), (32, numpy.float32), (64, numpy.float64)
+])
+@pytest.mark.parametrize('little_endian', [True, False])
+@pytest.mark.parametrize('n_channels', [1, 3])
+def test_write(sample_width, dtype, little_endian, n_channels, tmp_path):
+    """
+    Test files written are read back with the same data and tags.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-60, 60, dtype=numpy.int32)
+    if sample_width == 24:
+        data = data * 2 ** 16
+    data = data.astype(dtype)
+    if n_channels > 1:
+        data = data.reshape(-1, n_channels)
+    tags = Tags(name='name', artist='artist', comment='odd')
+
+    write(file_path, WaveFile(sample_width, 8000, data, tags),
+          little_endian=little_endian)
+
+    wave_file = read(file_path)
+    assert wave_file.sample_width == sample_width
+    assert wave_file.framerate == 8000
+    assert wave_file.tags == tags
+    assert numpy.array_equal(wave_file.data, data)
+
+
+@pytest.mark.parametrize('dtype', [numpy.uint8, numpy.int16, numpy.int32,
+                                   numpy.float32, numpy.float64])
+def test_write_equivalence(dtype, tmp_path):
+    """
+    Test files written are the same as the ones written by scipy.
+    """
+    wavy_path = str(tmp_path / 'wavy.wav')
+    scipy_path = str(tmp_path / 'scipy.wav')
+    data = numpy.arange(-60, 60).astype(dtype).reshape(-1, 2)
+
+    write(wavy_path, WaveFile(data.itemsize * 8, 8000, data))
+    scipy.io.wavfile.write(scipy_path, 8000, data)
+
+    framerate, scipy_data = scipy.io.wavfile.read(wavy_path)
+    assert framerate == 8000
+    assert numpy.array_equal(scipy_data, data)
+    assert numpy.array_equal(read(scipy_path).data, data)
+
+
+@pytest.mark.parametrize('little_endian', [True, False])
+def test_write_24_bit_round_trip(little_endian, tmp_path):
+    """
+    Test all 24 bit values are read back exactly.
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(-2 ** 23, 2 ** 23, dtype=numpy.int32).reshape(-1, 4)
+
+    write(file_path, WaveFile(24, 8000, data), little_endian=little_endian)
+
+    assert numpy.array_equal(read(file_path).data, data)
+    assert numpy.array_equal(
+        numpy.concatenate(list(blocks(file_path, 2 ** 16))), data)
@@ -0,0 +1,117 @@
+import pytest
+import threading
+import time
+from re import escape as esc
+from wavy import *
+from wavy.detail import *
+
+
+def mock_function(file):
+    """
+    Mock function that fails for some files and takes longer for others.
+    """
+    if file == 'corrupted':
+        raise WaveFileIsCorrupted('Corrupted.')
+    if file == 'missing':
+        raise FileNotFoundError('Missing.')
+    if file == 'invalid':
+        raise ValueError('Invalid.')
+    # first files take longer so they complete last
+    time.sleep(0.01 if file == 0 else 0)
+    return file * 2
+
+
+@pytest.mark.parametrize('workers', [1, 4, None])
+def test_map_files_ordered(workers):
+    """
+    Test results are returned in order
+    """
+    results = list(map_files(mock_function, range(50), workers))
+    assert results == [BatchResult(i, i * 2, None) for i in range(50)]
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_map_files_unordered(workers):
+    """
+    Test all results are returned when order does not matter
+    """
+    results = list(map_files(mock_function, range(50), workers, False))
+    assert sorted(results) == [BatchResult(i, i * 2, None) for i in range(50)]
+    if workers > 1:
+        # slowest file is not first
+        assert results[0].file != 0
+
+
+def test_map_files_errors():
+    """
+    Test errors are returned for each file without stopping the batch
+    """
+    results = list(map_files(mock_function,
+                             [1, 'corrupted', 'missing', 'invalid', 2]))
+
+    assert [result.result for result in results] == [2, None, None, None, 4]
+    assert results[0].error is None
+    assert isinstance(results[1].error, WaveFileIsCorrupted)
+    assert isinstance(results[2].error, FileNotFoundError)
+    assert isinstance(results[3].error, ValueError)
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_map_files_other_errors(workers):
+    """
+    Test unexpected errors are returned without stopping the batch
+    """
+    results = list(map_files(lambda x: x + 'a', ['a', 1, 'b'], workers))
+
+    assert [result.result for result in results] == ['aa', None, 'ba']
+    assert isinstance(results[1].error, TypeError)
+
+
+def test_map_files_interrupt():
+    """
+    Test errors that are not exceptions are raised
+    """
+    def interrupt(file):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        list(map_files(interrupt, [1]))
+
+
+def test_map_files_bounded():
+    """
+    Test files are not all submitted at once
+    """
+    submitted = []
+
+    def files():
+        for i in range(100):
+            submitted.append(i)
+            yield i
+
+    results = map_files(mock_function, files(), 2)
+    next(results)
+    assert len(submitted) <= 2 * N_PENDING_PER_WORKER + 1
+
+
+def test_map_files_invalid_workers():
+    """
+    Test exception is raised for invalid number of workers
+    """
+    with pytest.raises(WaveValueError,
+                       match=esc("Argument 'workers' must be positive.")):
+        next(map_files(mock_function, [1], 0))
+
+
+def test_check_arguments():
+    """
+    Test arguments not accepted by the function are raised
+    """
+    def function(file, foo=None):
+        pass
+
+    check_arguments(function, {'foo': 1})
+    with pytest.raises(TypeError):
+        check_arguments(function, {'bar': 1})
+    with pytest.raises(TypeError):
+        check_arguments(function, {'file': 'a'})
@@ -0,0 +1,75 @@
+import io
+import pytest
+from re import escape as esc
+from wavy import *
+from wavy.detail import *
+
+
+@pytest.mark.parametrize('le, data', [
+    (True, b'foo \x03\x00\x00\x00abc\x00bar \x02\x00\x00\x00de'),
+    (False, b'foo \x00\x00\x00\x03abc\x00bar \x00\x00\x00\x02de')
+])
+def test_iter_chunks(le, data):
+    """
+    Test chunks are found with correct sizes and padding
+    """
+    stream = io.BytesIO(data)
+    chunks = list(iter_chunks(stream, StreamHandler(le)))
+    assert chunks == [ChunkInfo(b'foo ', 8, 3), ChunkInfo(b'bar ', 20, 2)]
+
+
+def test_iter_chunks_moves_to_next_chunk():
+    """
+    Test stream is positioned at next chunk whatever was read
+    """
+    stream = io.BytesIO(b'foo \x04\x00\x00\x00abcdbar \x02\x00\x00\x00de')
+    chunks = iter_chunks(stream, StreamHandler(True))
+
+    assert next(chunks) == ChunkInfo(b'foo ', 8, 4)
+    assert stream.read(1) == b'a'
+    assert next(chunks) == ChunkInfo(b'bar ', 20, 2)
+    assert stream.read(2) == b'de'
+
+
+def test_iter_chunks_starts_at_position():
+    """
+    Test offsets are absolute when starting past the stream start
+    """
+    stream = io.BytesIO(b'RIFFfoo \x01\x00\x00\x00a')
+    stream.seek(4)
+    chunks = list(iter_chunks(stream, StreamHandler(True)))
+    assert chunks == [ChunkInfo(b'foo ', 12, 1)]
+
+
+def test_iter_chunks_non_seekable():
+    """
+    Test chunks are found on non-seekable streams
+    """
+    stream = ForwardStream(io.BytesIO(
+        b'foo \x03\x00\x00\x00abc\x00bar \x02\x00\x00\x00de'))
+    chunks = list(iter_chunks(stream, StreamHandler(True)))
+    assert chunks == [ChunkInfo(b'foo ', 8, 3), ChunkInfo(b'bar ', 20, 2)]
+
+
+def test_iter_chunks_truncated_header():
+    """
+    Test exception is raised if chunk header is truncated
+    """
+    stream = io.BytesIO(b'foo \x01\x00\x00\x00a\x00bar')
+    chunks = iter_chunks(stream, StreamHandler(True))
+    next(chunks)
+    with pytest.raises(WaveFileIsCorrupted,
+                       match=esc('Reached end of file prematurely.')):
+        next(chunks)
+
+
+def test_iter_chunks_ds64_sizes():
+    """
+    Test sizes that do not fit 32 bits are taken from the handler
+    """
+    stream = io.BytesIO(b'data\xff\xff\xff\xffabcdfoo \xff\xff\xff\xffa')
+    handler = StreamHandler(True)
+    handler.chunk_sizes[b'data'] = 4
+    chunks = list(iter_chunks(stream, handler))
+    assert chunks == [ChunkInfo(b'data', 8, 4),
+                      ChunkInfo(b'foo ', 20, 0xFFFFFFFF)]
@@ -8,7 +8,18 @@ class MockEmptyClass(object):
     """
     Test file is opened when string is passed.
     """
-    pass
+
+    def seekable(self):
+        return True
+
+
+class MockPipe(MockEmptyClass):
+    """
+    Stream that cannot seek.
+    """
+
+    def seekable(self):
+        return False
 
 
 def test_get_file_from_arg_with_string(mocker):
@@ -29,11 +40,31 @@ def test_get_file_from_arg_with_object():
     assert isinstance(res, MockEmptyClass)
 
 
+def test_get_file_from_arg_with_non_seekable_object():
+    """
+    Test non-seekable streams are wrapped to keep track of position.
+    """
+    res = get_stream_from_file(MockPipe(), 'rb', MockEmptyClass)
+    assert isinstance(res, ForwardStream)
+
+
 def test_get_file_from_arg_with_wrong_type():
     """
     Test exception is raise when object is not of expected types.
     """
     with pytest.raises(WaveFileNotSupported, match=esc(
-            "'file' argument must be a string or <MockEmptyClass> instance, "
-            "<class 'int'> given instead.")):
+            "'file' argument must be a string, bytes-like object or "
+            "<MockEmptyClass> instance, <class 'int'> given instead.")):
         get_stream_from_file(10, 'rb', MockEmptyClass)
+
+
+@pytest.mark.parametrize('file', [
+    b'abc', bytearray(b'abc'), memoryview(b'abc')
+])
+def test_get_file_from_arg_with_bytes(file):
+    """
+    Test memory stream is returned for bytes-like objects.
+    """
+    res = get_stream_from_file(file, 'rb', MockEmptyClass)
+    assert isinstance(res, MemoryStream)
+    assert res.read() == b'abc'
@@ -0,0 +1,55 @@
+import io
+import pytest
+from re import escape as esc
+from wavy import *
+from wavy.detail import *
+
+
+def test_forward_stream_read():
+    """
+    Test that ForwardStream keeps track of the position
+    """
+    stream = ForwardStream(io.BytesIO(b'abcdefgh'))
+    assert not stream.seekable()
+    assert stream.read(3) == b'abc'
+    assert stream.tell() == 3
+    assert stream.read() == b'defgh'
+    assert stream.tell() == 8
+
+
+@pytest.mark.parametrize('offset, whence, expected, data', [
+    (5, io.SEEK_SET, 5, b'fgh'),
+    (2, io.SEEK_CUR, 5, b'fgh'),
+    (3, io.SEEK_SET, 3, b'defgh'),
+    (20, io.SEEK_SET, 8, b'')
+])
+def test_forward_stream_seek(offset, whence, expected, data):
+    """
+    Test that ForwardStream seeks forward by reading
+    """
+    stream = ForwardStream(io.BytesIO(b'abcdefgh'))
+    stream.read(3)
+    assert stream.seek(offset, whence) == expected
+    assert stream.read() == data
+
+
+def test_forward_stream_seek_backwards():
+    """
+    Test that ForwardStream cannot seek backwards
+    """
+    stream = ForwardStream(io.BytesIO(b'abcdefgh'))
+    stream.read(3)
+    with pytest.raises(WaveValueError,
+                       match=esc('Cannot seek backwards in a non-seekable '
+                                 'stream.')):
+        stream.seek(2)
+
+
+def test_forward_stream_close():
+    """
+    Test that ForwardStream closes the stream
+    """
+    inner = io.BytesIO(b'abcdefgh')
+    with ForwardStream(inner):
+        pass
+    assert inner.closed
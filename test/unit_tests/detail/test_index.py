@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import wavy
+from wavy.detail import *
+
+
+def test_init_index(tmp_path):
+    """
+    Test table is created and dropped for a different version
+    """
+    connection = sqlite3.connect(str(tmp_path / 'index.db'))
+    init_index(connection)
+    connection.execute(INSERT_INDEX_ENTRY, ('path', 1, 2, 'info'))
+    connection.commit()
+
+    # same version, entries are kept
+    init_index(connection)
+    assert connection.execute(SELECT_INDEX_ENTRIES).fetchall() == \
+        [('path', 1, 2)]
+
+    # different version, entries are dropped
+    connection.execute('PRAGMA user_version = 0')
+    init_index(connection)
+    assert connection.execute(SELECT_INDEX_ENTRIES).fetchall() == []
+    assert connection.execute('PRAGMA user_version').fetchone() == \
+        (INDEX_VERSION,)
+
+
+def test_get_file_key(mocker):
+    """
+    Test key uses absolute path, size and modification time
+    """
+    stat = mocker.MagicMock(st_size=10, st_mtime_ns=20)
+    assert get_file_key('file.wav', stat) == \
+        (os.path.abspath('file.wav'), 10, 20)
+
+
+def test_dump_load_info():
+    """
+    Test info can be serialized and deserialized
+    """
+    for tags in [None, wavy.Tags(name='name', artist='artist')]:
+        info = wavy.WaveFileInfo(sample_width=16, framerate=8000,
+                                 n_channels=2, n_frames=100, tags=tags)
+        assert load_info(dump_info(info)) == info
+
+
+def test_dump_load_info_metadata():
+    """
+    Test bext, iXML and regions can be serialized and deserialized
+    """
+    bext = wavy.Bext('description', 'originator', 'reference', '2020-01-02',
+                     '03:04:05', 2 ** 40, 2, bytes(range(64)), -23.0, 5.5,
+                     -1.0, -18.0, -20.0, 'A=PCM')
+    info = wavy.WaveFileInfo(sample_width=16, framerate=8000, n_channels=2,
+                             n_frames=100, tags=None, bext=bext,
+                             ixml='<BWFXML/>',
+                             regions=[wavy.Region(1, 10, 0, None),
+                                      wavy.Region(2, 20, 5, 'label')])
+    assert load_info(dump_info(info)) == info
+
+
+def test_iter_wave_files(tmp_path):
+    """
+    Test WAVE files are found in sub-directories
+    """
+    (tmp_path / 'sub').mkdir()
+    for name in ['a.wav', 'b.WAV', 'c.wave', 'd.txt', 'sub/e.wav']:
+        (tmp_path / name).write_bytes(b'')
+
+    assert sorted(entry.name
+                  for entry in iter_wave_files(str(tmp_path))) == \
+        ['a.wav', 'b.WAV', 'c.wave', 'e.wav']
@@ -0,0 +1,69 @@
+import io
+import numpy
+import pytest
+from wavy.detail import *
+
+
+def test_memory_stream_read():
+    """
+    Test that MemoryStream reads like a file
+    """
+    stream = MemoryStream(b'abcdefgh')
+    assert stream.readable() and stream.seekable()
+    assert stream.read(3) == b'abc'
+    assert stream.tell() == 3
+    assert stream.read() == b'defgh'
+    assert stream.read(3) == b''
+
+
+def test_memory_stream_readinto():
+    """
+    Test that MemoryStream reads into buffers
+    """
+    stream = MemoryStream(bytearray(b'abcdefgh'))
+    buffer = bytearray(5)
+    assert stream.readinto(buffer) == 5
+    assert buffer == b'abcde'
+    assert stream.readinto(buffer) == 3
+    assert buffer == b'fghde'
+
+
+@pytest.mark.parametrize('offset, whence, expected', [
+    (2, io.SEEK_SET, 2),
+    (2, io.SEEK_CUR, 5),
+    (-2, io.SEEK_END, 6),
+    (10, io.SEEK_SET, 10)
+])
+def test_memory_stream_seek(offset, whence, expected):
+    """
+    Test that MemoryStream seeks like a file
+    """
+    stream = MemoryStream(b'abcdefgh')
+    stream.read(3)
+    assert stream.seek(offset, whence) == expected
+    assert stream.tell() == expected
+
+
+@pytest.mark.parametrize('offset, whence', [
+    (-1, io.SEEK_SET),
+    (0, 5)
+])
+def test_memory_stream_seek_invalid(offset, whence):
+    """
+    Test that MemoryStream raises for invalid seeks
+    """
+    with pytest.raises(ValueError):
+        MemoryStream(b'abcdefgh').seek(offset, whence)
+
+
+def test_memory_stream_getbuffer():
+    """
+    Test that MemoryStream does not copy the buffer
+    """
+    buffer = numpy.arange(4, dtype=numpy.int16)
+    stream = MemoryStream(buffer)
+    view = stream.getbuffer()
+    assert view.format == 'B'
+    assert len(view) == 8
+    assert numpy.shares_memory(numpy.frombuffer(view, dtype=numpy.int16),
+                               buffer)
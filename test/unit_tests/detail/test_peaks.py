@@ -0,0 +1,221 @@
+import io
+import numpy
+import os
+import pytest
+import tracemalloc
+import wavy.detail.peaks
+from re import escape as esc
+from wavy import *
+from wavy.detail import *
+from test.utils import *
+
+
+def create_peaks_file(tmp_path, data, sample_width, le=True):
+    """
+    Write data of shape (n_frames, n_channels) into a file, and return its
+    path.
+    """
+    file_path = str(tmp_path / 'peaks.wav')
+    create_wave_file(file_path, data, sample_width, little_endian=le)
+    return file_path
+
+
+def get_expected_peaks(data, samples_per_bucket, zero=0):
+    """
+    Compute peaks one bucket at the time.
+    """
+    buckets = [data[i:i + samples_per_bucket]
+               for i in range(0, len(data), samples_per_bucket)]
+    return (numpy.array([bucket.min(axis=0) for bucket in buckets]),
+            numpy.array([bucket.max(axis=0) for bucket in buckets]),
+            numpy.array([numpy.sqrt(numpy.mean(
+                (bucket.astype(numpy.float64) - zero) ** 2, axis=0))
+                for bucket in buckets]))
+
+
+@pytest.mark.parametrize('samples_per_bucket', [1, 3, 4, 100])
+@pytest.mark.parametrize('block_sizes', [[10], [2, 5, 3], [1] * 10])
+def test_reduce_block(samples_per_bucket, block_sizes):
+    """
+    Test buckets split across blocks of any size are combined
+    """
+    frames = (numpy.arange(20, dtype=numpy.int16) * 7 % 11 - 5).reshape(-1, 2)
+    n_buckets = -(-len(frames) // samples_per_bucket)
+    out_min = numpy.full((2, n_buckets), 2 ** 15 - 1, numpy.int16)
+    out_max = numpy.full((2, n_buckets), -2 ** 15, numpy.int16)
+    out_squares = numpy.zeros((2, n_buckets))
+    squares = numpy.empty((2, 10))
+
+    start = 0
+    for size in block_sizes:
+        samples = numpy.ascontiguousarray(frames[start:start + size].T)
+        reduce_block(samples, start, samples_per_bucket, squares, out_min,
+                     out_max, out_squares)
+        start += size
+
+    expected = get_expected_peaks(frames, samples_per_bucket)
+    assert numpy.array_equal(out_min, expected[0].T)
+    assert numpy.array_equal(out_max, expected[1].T)
+    counts = [len(frames[i:i + samples_per_bucket])
+              for i in range(0, len(frames), samples_per_bucket)]
+    assert numpy.allclose(numpy.sqrt(out_squares / counts), expected[2].T)
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('sample_width, dtype', [
+    (8, numpy.uint8),
+    (16, numpy.int16),
+    (24, numpy.int32),
+    (32, numpy.int32),
+    (32, numpy.float32)
+])
+@pytest.mark.parametrize('n_channels', [1, 3])
+@pytest.mark.parametrize('samples_per_bucket', [1, 5, 1000])
+def test_read_peaks(samples_per_bucket, n_channels, sample_width, dtype, le,
+                    tmp_path, mocker):
+    """
+    Test peaks are computed block by block
+    """
+    mocker.patch('wavy.detail.peaks.PEAKS_BLOCK_SIZE', 64)
+
+    if dtype == numpy.float32:
+        data = numpy.random.uniform(-1, 1, (503, n_channels)).astype(dtype)
+    else:
+        bits = min(sample_width, 32)
+        low, high = (0, 2 ** bits) if dtype == numpy.uint8 else \
+            (-2 ** (bits - 1), 2 ** (bits - 1))
+        data = numpy.random.randint(low, high, (503, n_channels),
+                                    dtype=numpy.int64).astype(dtype)
+    file_path = create_peaks_file(tmp_path, data, sample_width, le)
+
+    with open(file_path, 'rb') as stream:
+        result = read_peaks(stream, samples_per_bucket)
+
+    zero = 128 if sample_width == 8 else 0
+    for actual, expected in zip(result, get_expected_peaks(
+            data, samples_per_bucket, zero)):
+        if n_channels == 1:
+            expected = expected.reshape(-1)
+        assert actual.shape == expected.shape
+        assert numpy.allclose(actual, expected)
+    assert result[0].dtype == dtype
+    assert result[2].dtype == numpy.float64
+
+
+def test_read_peaks_8_bit_silence(tmp_path):
+    """
+    Test RMS of 8 bit silence is zero
+    """
+    data = numpy.full((100, 1), 128, numpy.uint8)
+    file_path = create_peaks_file(tmp_path, data, 8)
+
+    with open(file_path, 'rb') as stream:
+        peaks_min, peaks_max, peaks_rms = read_peaks(stream, 10)
+
+    assert (peaks_min == 128).all() and (peaks_max == 128).all()
+    assert (peaks_rms == 0).all()
+
+
+@pytest.mark.parametrize('samples_per_bucket', [2 ** 10, 2 ** 20])
+def test_read_peaks_memory(samples_per_bucket, tmp_path, mocker):
+    """
+    Test memory does not grow with the number of samples per bucket
+    """
+    mocker.patch('wavy.detail.peaks.PEAKS_BLOCK_SIZE', 2 ** 16)
+    data = numpy.zeros((2 ** 20, 2), numpy.int16)
+    file_path = create_peaks_file(tmp_path, data, 16)
+
+    with open(file_path, 'rb') as stream:
+        tracemalloc.start()
+        read_peaks(stream, samples_per_bucket)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    # buffers for one block, not for the 4 MB of data
+    assert peak < 16 * 2 ** 16
+
+
+def test_read_peaks_empty(tmp_path):
+    """
+    Test files without frames have no buckets
+    """
+    file_path = create_peaks_file(tmp_path, numpy.empty((0, 2), numpy.int16),
+                                  16)
+
+    with open(file_path, 'rb') as stream:
+        assert [peaks.shape for peaks in read_peaks(stream, 10)] == \
+            [(0, 2)] * 3
+
+
+@pytest.mark.parametrize('samples_per_bucket', [0, -1, 2.5, 10.0, '10',
+                                                None, True])
+def test_read_peaks_bad_bucket(samples_per_bucket):
+    """
+    Test error is raised for buckets that are not a positive number of frames
+    """
+    with pytest.raises(WaveValueError, match=esc(
+            "Argument 'samples_per_bucket' must be a positive integer.")):
+        read_peaks(io.BytesIO(), samples_per_bucket)
+
+
+def test_get_peaks_cache_path():
+    """
+    Test cache is next to the file
+    """
+    assert get_peaks_cache_path('dir/file.wav') == 'dir/file.wav.peaks'
+
+
+def test_save_load_peaks(tmp_path, mocker):
+    """
+    Test peaks are only loaded for the same file and bucket size
+    """
+    cache_path = str(tmp_path / 'file.wav.peaks')
+    stat = mocker.MagicMock(st_size=100, st_mtime_ns=2 ** 60)
+    peaks = (numpy.array([-1, -2], numpy.int16),
+             numpy.array([1, 2], numpy.int16),
+             numpy.array([0.5, 1.5]))
+
+    assert load_peaks(cache_path, 10, stat) is None
+
+    save_peaks(cache_path, 10, stat, peaks)
+    assert os.listdir(str(tmp_path)) == ['file.wav.peaks']
+
+    result = load_peaks(cache_path, 10, stat)
+    for actual, expected in zip(result, peaks):
+        assert numpy.array_equal(actual, expected)
+        assert actual.dtype == expected.dtype
+
+    assert load_peaks(cache_path, 20, stat) is None
+    for changed in [dict(st_size=101), dict(st_mtime_ns=2 ** 60 + 1)]:
+        assert load_peaks(cache_path, 10,
+                          mocker.MagicMock(**{'st_size': 100,
+                                              'st_mtime_ns': 2 ** 60,
+                                              **changed})) is None
+
+    mocker.patch('wavy.detail.peaks.PEAKS_CACHE_VERSION',
+                 PEAKS_CACHE_VERSION + 1)
+    assert load_peaks(cache_path, 10, stat) is None
+
+
+def test_load_peaks_damaged(tmp_path, mocker):
+    """
+    Test damaged caches are ignored
+    """
+    cache_path = tmp_path / 'file.wav.peaks'
+    stat = mocker.MagicMock(st_size=100, st_mtime_ns=1)
+    for content in [b'', b'PK\x03\x04', b'garbage']:
+        cache_path.write_bytes(content)
+        assert load_peaks(str(cache_path), 10, stat) is None
+
+
+def test_save_peaks_error(tmp_path, mocker):
+    """
+    Test temporary file is removed if the cache cannot be written
+    """
+    mocker.patch('numpy.savez', side_effect=ValueError)
+    stat = mocker.MagicMock(st_size=100, st_mtime_ns=1)
+
+    with pytest.raises(ValueError):
+        save_peaks(str(tmp_path / 'file.wav.peaks'), 10, stat,
+                   (numpy.zeros(1),) * 3)
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,91 @@
+import io
+import os
+import pytest
+from wavy.detail import *
+
+# positional reads are not available on every platform (e.g. Windows)
+requires_pread = pytest.mark.skipif(not hasattr(os, 'pread'),
+                                    reason='os.pread is not available')
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / 'test.bin'
+    path.write_bytes(b'abcdefgh')
+    return str(path)
+
+
+@requires_pread
+@pytest.mark.parametrize('preadv', [True, False])
+def test_positional_stream_read(preadv, file_path, monkeypatch):
+    """
+    Test that PositionalStream reads from its own position
+    """
+    if not preadv:
+        monkeypatch.delattr(os, 'preadv', raising=False)
+
+    with open(file_path, 'rb') as file:
+        first = PositionalStream(file.fileno(), 2)
+        second = PositionalStream(file.fileno())
+        assert first.seekable()
+        assert first.read(3) == b'cde'
+        assert second.read(2) == b'ab'
+        assert first.tell() == 5
+        assert first.read() == b'fgh'
+        assert first.read(2) == b''
+        # file position is not changed
+        assert file.tell() == 0
+
+
+@requires_pread
+@pytest.mark.parametrize('offset, whence, expected, data', [
+    (5, io.SEEK_SET, 5, b'fgh'),
+    (2, io.SEEK_CUR, 5, b'fgh'),
+    (1, io.SEEK_SET, 1, b'bcdefgh')
+])
+def test_positional_stream_seek(offset, whence, expected, data, file_path):
+    """
+    Test that PositionalStream seeks without reading
+    """
+    with open(file_path, 'rb') as file:
+        stream = PositionalStream(file.fileno())
+        stream.read(3)
+        assert stream.seek(offset, whence) == expected
+        assert stream.read() == data
+
+
+def test_positional_stream_seek_end(file_path):
+    """
+    Test that PositionalStream cannot seek from the end
+    """
+    with open(file_path, 'rb') as file:
+        with pytest.raises(ValueError):
+            PositionalStream(file.fileno()).seek(0, io.SEEK_END)
+
+
+@requires_pread
+def test_get_file_descriptor(file_path):
+    """
+    Test file descriptor is only returned for files on disk
+    """
+    with open(file_path, 'rb') as file:
+        assert get_file_descriptor(file) == file.fileno()
+        assert get_file_descriptor(ForwardStream(file)) is None
+
+    assert get_file_descriptor(io.BufferedReader(io.BytesIO(b'abc'))) is None
+    assert get_file_descriptor(MemoryStream(b'abc')) is None
+
+    read_fd, write_fd = os.pipe()
+    with open(read_fd, 'rb') as file:
+        assert get_file_descriptor(file) is None
+    os.close(write_fd)
+
+
+def test_get_file_descriptor_no_pread(file_path, monkeypatch):
+    """
+    Test file descriptor is not returned without positional reads
+    """
+    monkeypatch.delattr(os, 'pread', raising=False)
+
+    with open(file_path, 'rb') as file:
+        assert get_file_descriptor(file) is None
@@ -0,0 +1,132 @@
+import io
+import pytest
+from wavy.detail import *
+
+
+class MockCountingStream(io.BytesIO):
+    """
+    Stream that records every call made to it.
+    """
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.calls = []
+
+    def read1(self, size=-1):
+        self.calls.append(('read1', size))
+        return super().read1(size)
+
+    def readinto(self, buffer):
+        self.calls.append(('readinto', len(buffer)))
+        return super().readinto(buffer)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self.calls.append(('seek', offset, whence))
+        return super().seek(offset, whence)
+
+
+def test_prefetch_stream_single_read():
+    """
+    Test that reads and seeks within prefetched bytes do not hit the stream
+    """
+    stream = MockCountingStream(bytes(range(100)))
+    prefetched = PrefetchStream(stream, 50)
+
+    assert prefetched.read(4) == bytes(range(4))
+    prefetched.seek(10, io.SEEK_CUR)
+    assert prefetched.tell() == 14
+    assert prefetched.read(4) == bytes(range(14, 18))
+    prefetched.seek(40)
+    assert prefetched.read(10) == bytes(range(40, 50))
+
+    assert stream.calls == [('read1', 50)]
+
+
+def test_prefetch_stream_read_past_buffer():
+    """
+    Test that reads past prefetched bytes are served by the stream
+    """
+    stream = MockCountingStream(bytes(range(100)))
+    prefetched = PrefetchStream(stream, 50)
+
+    # continue where prefetch stopped, no seek needed
+    prefetched.seek(40)
+    assert prefetched.read(20) == bytes(range(40, 60))
+    # skip forward
+    prefetched.seek(80)
+    assert prefetched.read(20) == bytes(range(80, 100))
+
+    assert stream.calls == [('read1', 50), ('readinto', 10),
+                                ('seek', 80, io.SEEK_SET), ('readinto', 20)]
+
+
+def test_prefetch_stream_eof():
+    """
+    Test that end of file is only reached when the stream is exhausted
+    """
+    stream = MockCountingStream(bytes(range(10)))
+    prefetched = PrefetchStream(stream, 50)
+
+    assert prefetched.read(20) == bytes(range(10))
+    prefetched.seek(20)
+    assert prefetched.read(20) == b''
+
+
+def test_prefetch_stream_short_read(tmp_path):
+    """
+    Test that bytes after a short prefetch are read from the stream
+    """
+    expected = bytes(range(256)) * 1000
+    file_path = tmp_path / 'data'
+    file_path.write_bytes(expected)
+
+    with open(str(file_path), 'rb', buffering=1024) as file:
+        # buffered readers only return the buffered bytes once they hold any
+        file.peek(1)
+        prefetched = PrefetchStream(file, len(expected))
+        prefetched.seek(100000)
+        assert prefetched.read() == expected[100000:]
+
+
+def test_prefetch_stream_seek_end():
+    """
+    Test that seek can be relative to the end of the stream
+    """
+    prefetched = PrefetchStream(io.BytesIO(bytes(range(100))), 50)
+
+    assert prefetched.seek(-10, io.SEEK_END) == 90
+    assert prefetched.read() == bytes(range(90, 100))
+
+
+def test_prefetch_stream_start_offset():
+    """
+    Test that positions are absolute when stream does not start at zero
+    """
+    stream = io.BytesIO(bytes(range(100)))
+    stream.seek(10)
+    prefetched = PrefetchStream(stream, 50)
+
+    assert prefetched.tell() == 10
+    assert prefetched.read(2) == bytes([10, 11])
+    prefetched.seek(58)
+    assert prefetched.read(4) == bytes(range(58, 62))
+
+
+@pytest.mark.parametrize('seekable', [True, False])
+def test_prefetch_stream_seekable(seekable, mocker):
+    """
+    Test that the stream is only seekable if the underlying one is
+    """
+    stream = io.BytesIO(bytes(range(100)))
+    mocker.patch.object(stream, 'seekable', return_value=seekable)
+
+    assert PrefetchStream(stream, 50).seekable() == seekable
+
+
+def test_prefetch_memory_stream():
+    """
+    Test that in-memory streams are not wrapped
+    """
+    stream = MemoryStream(b'abc')
+    assert prefetch(stream, 10) is stream
+    assert isinstance(prefetch(io.BytesIO(b'abc'), 10), PrefetchStream)
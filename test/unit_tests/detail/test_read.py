@@ -1,16 +1,37 @@
-import chunk
+import concurrent.futures
+import io
 import numpy
+import os
 import pytest
+import stat
+import struct
+import wavy.detail.read
 from re import escape as esc
 from wavy import *
 from wavy.detail import *
 
 
-def test_get_chunk_eof(mocker):
-    mocker.patch.object(chunk.Chunk, '__init__', side_effect=EOFError)
-    with pytest.raises(wavy.WaveFileIsCorrupted,
-                       match=esc('Reached end of file prematurely.')):
-        get_chunk(None)
+# positional reads are not available on every platform (e.g. Windows)
+requires_pread = pytest.mark.skipif(not hasattr(os, 'pread'),
+                                    reason='os.pread is not available')
+
+
+def make_chunks(chunks, le=True):
+    """
+    Encode list of (name, data) into chunks.
+    """
+    return b''.join(struct.pack('<4sL' if le else '>4sL', name, len(data)) +
+                    data + b'\x00' * (len(data) % 2)
+                    for name, data in chunks)
+
+
+def make_stream(chunks, le=True):
+    """
+    Get stream, handler and chunk iterator for list of (name, data).
+    """
+    stream = io.BytesIO(make_chunks(chunks, le))
+    handler = StreamHandler(le)
+    return stream, handler, iter_chunks(stream, handler)
 
 
 @pytest.mark.parametrize('content, le', [
@@ -35,6 +56,41 @@ def test_get_stream_handler(content, le, mocker):
     assert handler.little_endian == le
 
 
+@pytest.mark.parametrize('header', [b'RF64', b'BW64'])
+def test_get_stream_handler_ds64(header):
+    """
+    Test 64 bit sizes are read from ds64 chunk
+    """
+    stream = io.BytesIO(header + b'\xff\xff\xff\xffWAVE' + b'ds64' +
+                        struct.pack('<LQQQL', 40, 2 ** 40, 2 ** 36, 7, 1) +
+                        struct.pack('<4sQ', b'foo ', 2 ** 33) + b'fmt ')
+
+    handler = get_stream_handler(stream)
+
+    assert handler.little_endian
+    assert handler.chunk_sizes == {b'data': 2 ** 36, b'foo ': 2 ** 33}
+    # stream is positioned at the next chunk
+    assert stream.read(4) == b'fmt '
+
+
+@pytest.mark.parametrize('content, expected_msg', [
+    (b'', 'Reached end of file prematurely.'),
+    (b'fmt ' + struct.pack('<L', 28) + bytes(28), "Chunk 'ds64' is missing."),
+    (b'ds64' + struct.pack('<L', 28) + bytes(20), "Chunk 'ds64' is truncated."),
+    (b'ds64' + struct.pack('<L', 20) + bytes(20), "Chunk 'ds64' is truncated."),
+    (b'ds64' + struct.pack('<LQQQL', 28, 0, 0, 0, 1),
+     "Chunk 'ds64' is truncated.")
+])
+def test_get_stream_handler_ds64_corrupted(content, expected_msg):
+    """
+    Test exception is raised if ds64 chunk is missing or truncated
+    """
+    stream = io.BytesIO(b'RF64\xff\xff\xff\xffWAVE' + content)
+
+    with pytest.raises(WaveFileIsCorrupted, match=esc(expected_msg)):
+        get_stream_handler(stream)
+
+
 def test_check_head_chunk_wrong_tag(mocker):
     """
     Test exception is raised when head tag has unknown type.
@@ -63,6 +119,19 @@ def test_check_head_chunk_wrong_type(mocker):
         get_stream_handler(stream)
 
 
+def make_fmt_data(chunk_size, format_tag, sub_format_tag, sample_width, le):
+    """
+    Encode format chunk data.
+    """
+    prefix = '<' if le else '>'
+    data = struct.pack(prefix + 'HHLLHH', format_tag, 1, 2, 3, 4,
+                       sample_width) + bytes(chunk_size - 16)
+    if chunk_size == 40:
+        data = data[:24] + struct.pack(prefix + 'H', sub_format_tag) + \
+               data[26:]
+    return data
+
+
 @pytest.mark.parametrize('fmt_names, chunk_size, format_tag, sub_format_tag', [
     # WAVE_FORMAT_PCM with allowed chunk sizes
     ([b'fmt ', ], 16, WAVE_FORMAT_PCM, 0),
@@ -72,42 +141,28 @@ def test_check_head_chunk_wrong_type(mocker):
     ([b'fmt ', ], 18, WAVE_FORMAT_IEEE_FLOAT, 0),
     ([b'fmt ', ], 40, WAVE_FORMAT_IEEE_FLOAT, 0),
     # make sure it finds chunk after others
-    ([b'fmt ', b'bar', b'RIFF', b'foo'], 16, WAVE_FORMAT_PCM, 0),
+    ([b'fmt ', b'bar ', b'RIFF', b'foo '], 16, WAVE_FORMAT_PCM, 0),
     # cover WAVE_FORMAT_EXTENSIBLE for PCM
     ([b'fmt ', ], 40, WAVE_FORMAT_EXTENSIBLE, WAVE_FORMAT_PCM),
     ([b'fmt ', ], 40, WAVE_FORMAT_IEEE_FLOAT, WAVE_FORMAT_PCM)
 ])
+@pytest.mark.parametrize('le', [True, False])
 def test_get_fmt_chunk(fmt_names, chunk_size, format_tag,
-                       sub_format_tag, mocker):
+                       sub_format_tag, le):
     """
     Test head chunk is read correctly
     """
-    read_list = [struct.pack('<H', sub_format_tag),
-                 struct.pack('<HHLLHH', format_tag, 1, 2, 3, 4, 32)]
-    # mock Chunk methods
-    mocker.patch.object(chunk.Chunk, '__init__', return_value=None)
-    mocker.patch.object(chunk.Chunk, 'getname',
-                        side_effect=lambda: fmt_names.pop())
-    mocker.patch.object(chunk.Chunk, 'getsize', return_value=chunk_size)
-    mocker.patch.object(chunk.Chunk, 'read',
-                        side_effect=lambda _: read_list[-1])
-    mocker.patch.object(chunk.Chunk, 'seek',
-                        side_effect=lambda _: read_list.pop())
-    mocker.patch.object(chunk.Chunk, 'skip')
+    # other chunks come before fmt (odd size to check padding)
+    chunks = [(name, b'abc') for name in reversed(fmt_names[1:])]
+    chunks += [(b'fmt ', make_fmt_data(chunk_size, format_tag,
+                                       sub_format_tag, 32, le)),
+               (b'data', b'')]
+    stream, handler, chunks = make_stream(chunks, le)
 
     expected_format = sub_format_tag if format_tag == WAVE_FORMAT_EXTENSIBLE else format_tag
-    assert get_fmt_chunk(None, StreamHandler(True)) == FormatInfo(expected_format, 1, 2, 3, 4, 32)
-    # check all called as expected
-    chunk.Chunk.__init__.assert_called_with(None, bigendian=False)
-    chunk.Chunk.getname.assert_called_with()
-    chunk.Chunk.getsize.assert_called_with()
-    if format_tag in SUPPORTED_WAVE_FORMATS:
-        chunk.Chunk.read.assert_called_with(16)
-    else:
-        chunk.Chunk.read.assert_has_calls([mocker.call(16),
-                                           mocker.call(2)])
-        chunk.Chunk.seek.assert_called_with(24)
-        chunk.Chunk.seek.skip()
+    assert get_fmt_chunk(stream, handler, chunks) == FormatInfo(expected_format, 1, 2, 3, 4, 32)
+    # check we can continue with the next chunk
+    assert next(chunks).id == b'data'
 
 
 test_get_fmt_chunk_fail_args = 'fmt_names, chunk_size, format_tag, ' \
@@ -118,6 +173,9 @@ test_get_fmt_chunk_fail_args = 'fmt_names, chunk_size, format_tag, ' \
     # data before fmt
     ([b'fmt ', b'data'], 16, WAVE_FORMAT_PCM, 0,
      WaveFileIsCorrupted, 'Found data chunk before fmt chunk.'),
+    # no fmt at all
+    ([b'foo '], 16, WAVE_FORMAT_PCM, 0,
+     WaveFileIsCorrupted, 'Reached end of file prematurely.'),
     # unsupported chunk size
     ([b'fmt ', ], 25, WAVE_FORMAT_PCM, 0,
      WaveFileIsCorrupted, 'Format chunk is of unexpected size: 25.'),
@@ -137,34 +195,45 @@ test_get_fmt_chunk_fail_args = 'fmt_names, chunk_size, format_tag, ' \
      WaveFileNotSupported, "Sample width '5' is not supported for given type.")
 ])
 def test_get_fmt_chunk_fail(fmt_names, chunk_size, format_tag,
-                            sub_format_tag, exception_type, error_msg, mocker):
+                            sub_format_tag, exception_type, error_msg):
     """
     Test head chunk is read correctly
     """
-    read_list = [struct.pack('<H', sub_format_tag),
-                 struct.pack('<HHLLHH', format_tag, 1, 2, 3, 4, 5)]
-    # mock Chunk methods
-    mocker.patch.object(chunk.Chunk, '__init__', return_value=None)
-    mocker.patch.object(chunk.Chunk, 'getname',
-                        side_effect=lambda: fmt_names.pop())
-    mocker.patch.object(chunk.Chunk, 'getsize', return_value=chunk_size)
-    mocker.patch.object(chunk.Chunk, 'read',
-                        side_effect=lambda _: read_list[-1])
-    mocker.patch.object(chunk.Chunk, 'seek',
-                        side_effect=lambda _: read_list.pop())
+    chunks = [(name, make_fmt_data(chunk_size, format_tag, sub_format_tag,
+                                   5, True))
+              for name in reversed(fmt_names)]
+    stream, handler, chunks = make_stream(chunks)
 
     with pytest.raises(exception_type, match=esc(error_msg)):
-        get_fmt_chunk(None, StreamHandler(True))
+        get_fmt_chunk(stream, handler, chunks)
 
 
-def test_check_format_info_pass():
-    check_format_info(FormatInfo(0, 0, 1, 2, 2, 8))
+def test_get_fmt_chunk_truncated():
+    """
+    Test exception is raised if fmt chunk is truncated
+    """
+    data = make_chunks([(b'fmt ', make_fmt_data(16, 1, 0, 16, True))])
+    stream = io.BytesIO(data[:-2])
+    handler = StreamHandler(True)
+
+    with pytest.raises(WaveFileIsCorrupted,
+                       match=esc('Reached end of file prematurely.')):
+        get_fmt_chunk(stream, handler, iter_chunks(stream, handler))
+
+
+@pytest.mark.parametrize('info', [
+    FormatInfo(0, 2, 1, 2, 2, 8),
+    FormatInfo(0, 1, 1, 3, 3, 24),
+    FormatInfo(0, 64, 1, 128, 128, 16)
+])
+def test_check_format_info_pass(info):
+    check_format_info(info)
 
 
 @pytest.mark.parametrize('info, expected_msg', [
-    (FormatInfo(0, 0, 0, 0, 2, 4), "Block align is incorrect for 4 bits. "
+    (FormatInfo(0, 1, 0, 0, 2, 8), "Block align is incorrect for 8 bits. "
                                    "Expected: 1, Actual: 2."),
-    (FormatInfo(0, 0, 1, 3, 2, 8), "Avg. bytes per sec. is incorrect. "
+    (FormatInfo(0, 2, 1, 3, 2, 8), "Avg. bytes per sec. is incorrect. "
                                    "Expected: 2, Actual: 3.")
 ])
 def test_check_format_info_fail(info, expected_msg):
@@ -182,24 +251,32 @@ def test_get_data_chunk(chunk_names, mocker):
     """
     Test data chunk is read correctly
     """
-    # mock Chunk methods
-    mock_chunk = mocker.MagicMock()
-    mock_chunk.skip.return_value = None
-    mock_chunk.getname.side_effect = lambda: chunk_names.pop()
-
-    get_chunk = mocker.patch('wavy.detail.read.get_chunk', return_value=mock_chunk)
+    chunks = [(name, b'12345') for name in reversed(chunk_names)]
+    stream, handler, chunks = make_stream(chunks)
 
     # list chunk parsing
     has_list = b'LIST' in chunk_names
     read_list_chunk = mocker.patch('wavy.detail.read.read_list_chunk')
 
-    assert get_data_chunk(None) == mock_chunk
-    # check all called as expected
-    get_chunk.assert_called_with(None)
-    mock_chunk.getname.assert_called_with()
+    chunk = get_data_chunk(stream, handler, chunks)
+    assert chunk == ChunkInfo(b'data', 8 + 14 * (len(chunk_names) - 1), 5)
+    # stream is ready to read data
+    assert stream.read(5) == b'12345'
 
     if has_list:
-        read_list_chunk.assert_called_with(None, mock_chunk, {})
+        read_list_chunk.assert_called_with(stream, ChunkInfo(b'LIST', 22, 5),
+                                           handler, {}, None)
+
+
+def test_get_data_chunk_missing():
+    """
+    Test exception is raised if there is no data chunk
+    """
+    stream, handler, chunks = make_stream([(b'fact', b'1234')])
+
+    with pytest.raises(WaveFileIsCorrupted,
+                       match=esc('Reached end of file prematurely.')):
+        get_data_chunk(stream, handler, chunks)
 
 
 @pytest.mark.parametrize('format, dtype', [
@@ -222,11 +299,10 @@ def test_get_data_from_chunk(format, dtype, mocker):
     """
     Test data is read correctly from chunk
     """
-    # mock Chunk methods
     data_size = 10 * format.nBlockAlign
+    chunk = ChunkInfo(b'data', 44, data_size)
 
-    chunk = mocker.MagicMock()
-    chunk.getsize.return_value = data_size
+    stream = mocker.MagicMock()
 
     data = mocker.MagicMock()
     data.reshape.return_value = data
@@ -234,14 +310,113 @@ def test_get_data_from_chunk(format, dtype, mocker):
     handler = mocker.MagicMock()
     handler.read_data.return_value = data
 
-    assert get_data_from_chunk(chunk, format, handler) is data
+    assert get_data_from_chunk(stream, chunk, format, handler) is data
     # check all called as expected
-    chunk.getsize.assert_called_with()
-    handler.read_data.assert_called_with(chunk, data_size, format.wBitsPerSample // 8, False)
+    stream.seek.assert_called_with(44)
+    handler.read_data.assert_called_with(stream, data_size, format.wBitsPerSample // 8, False, None)
     if format.nChannels > 1:
         data.reshape.assert_called_with(-1, format.nChannels)
 
 
+@pytest.mark.parametrize('start, stop, expected_size', [
+    (0, None, 40),
+    (3, None, 28),
+    (3, 5, 8),
+    (0, 5, 20)
+])
+def test_get_data_from_chunk_range(start, stop, expected_size, mocker):
+    """
+    Test only the requested frames are read from chunk
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=1,
+                        nAvgBytesPerSec=4, nBlockAlign=4, wBitsPerSample=16)
+
+    chunk = ChunkInfo(b'data', 44, 40)
+    stream = mocker.MagicMock()
+    handler = mocker.MagicMock()
+
+    get_data_from_chunk(stream, chunk, format, handler, start, stop)
+
+    stream.seek.assert_called_with(44 + start * 4)
+    handler.read_data.assert_called_with(stream, expected_size, 2, False, None)
+
+
+@pytest.mark.parametrize('start, stop, in_seconds, expected', [
+    (None, None, False, (0, 100)),
+    (10, 20, False, (10, 20)),
+    (-10, None, False, (90, 100)),
+    (None, -10, False, (0, 90)),
+    (50, 200, False, (50, 100)),
+    (20, 10, False, (20, 20)),
+    (0.5, 1.5, True, (5, 15)),
+    (-1, None, True, (90, 100)),
+    (None, 20, True, (0, 100))
+])
+def test_get_frame_range(start, stop, in_seconds, expected):
+    """
+    Test that frame range follows slice semantics
+    """
+    # 100 frames at 10Hz
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=10,
+                        nAvgBytesPerSec=40, nBlockAlign=4, wBitsPerSample=16)
+    assert get_frame_range(format, 400, start, stop, in_seconds) == expected
+
+
+@pytest.mark.parametrize('start, stop, in_seconds, expected', [
+    (1.5, None, False, 'integers'),
+    ('a', None, False, 'integers'),
+    (None, [1], False, 'integers'),
+    ('a', None, True, 'numbers'),
+    (None, [1], True, 'numbers'),
+    (b'a', 1, True, 'numbers')
+])
+def test_get_frame_range_invalid(start, stop, in_seconds, expected):
+    """
+    Test that frame range must be integer, or number of seconds
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=10,
+                        nAvgBytesPerSec=40, nBlockAlign=4, wBitsPerSample=16)
+    with pytest.raises(WaveValueError,
+                       match=esc(f"Arguments 'start' and 'stop' must be "
+                                 f"{expected} or None.")):
+        get_frame_range(format, 400, start, stop, in_seconds)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'start': 10, 'stop': -10},
+    {'start': 0.5, 'stop': None, 'in_seconds': True},
+    {'channels': [1, -1]},
+    {'dtype': 'float32', 'workers': 2, 'mmap': False, 'lazy': False}
+])
+def test_check_read_arguments(kwargs):
+    """
+    Test valid arguments are accepted, whatever the file
+    """
+    check_read_arguments(kwargs)
+
+
+@pytest.mark.parametrize('kwargs, error, message', [
+    ({'foo': 1}, TypeError, None),
+    ({'start': 1.5}, WaveValueError,
+     "Arguments 'start' and 'stop' must be integers or None."),
+    ({'stop': 'a', 'in_seconds': True}, WaveValueError,
+     "Arguments 'start' and 'stop' must be numbers or None."),
+    ({'channels': 'a'}, WaveValueError,
+     "Argument 'channels' must be a list of channel indexes."),
+    ({'channels': []}, WaveValueError,
+     "Argument 'channels' cannot be empty."),
+    ({'dtype': 'int8'}, WaveValueError, "Argument 'dtype' must be one of"),
+    ({'workers': 0}, WaveValueError, "Argument 'workers' must be positive.")
+])
+def test_check_read_arguments_invalid(kwargs, error, message):
+    """
+    Test invalid arguments are raised, whatever the file
+    """
+    with pytest.raises(error, match=message and esc(message)):
+        check_read_arguments(kwargs)
+
+
 @pytest.mark.parametrize('format', [
     # single channel (mono)
     FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
@@ -254,56 +429,367 @@ def test_get_data_from_chunk_raises_error_if_corrupt(format, mocker):
     """
     Test data is read correctly from chunk for 24 bit
     """
-    # mock Chunk methods
-    chunk = mocker.MagicMock()
-    chunk.getsize.return_value = 1
-
-    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=1,
-                        nAvgBytesPerSec=6, nBlockAlign=6, wBitsPerSample=24)
+    chunk = ChunkInfo(b'data', 44, 1)
 
     with pytest.raises(WaveFileIsCorrupted,
                        match=esc('Data size does not match frame '
                                  'size of 24 bits')):
-        get_data_from_chunk(chunk, format, None)
+        get_data_from_chunk(None, chunk, format, None)
 
 
-mock_tags = {
-    'tags': [b'foo', b'bar\x00'],
-    'values': [b'value2\x00\x00', b'value1\x00\x00\x00\x00'],
-}
+@pytest.mark.parametrize('format, dtype', [
+    # single channel (mono)
+    (FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
+                nAvgBytesPerSec=2, nBlockAlign=2, wBitsPerSample=16), '<i2'),
+    # multi-channel (stereo)
+    (FormatInfo(wFormatTag=3, nChannels=2, nSamplesPerSec=1,
+                nAvgBytesPerSec=8, nBlockAlign=8, wBitsPerSample=32), '<f4')
+])
+def test_map_data_from_chunk(format, dtype, mocker):
+    """
+    Test data is mapped correctly from chunk
+    """
+    data_size = 10 * format.nBlockAlign
+    chunk = ChunkInfo(b'data', 44, data_size)
+
+    stream = mocker.MagicMock()
+    mocker.patch('os.fstat', return_value=mocker.MagicMock(
+        st_mode=stat.S_IFREG, st_size=44 + data_size))
+
+    data = mocker.MagicMock()
+    data.reshape.return_value = data
+
+    memmap = mocker.patch('numpy.memmap', return_value=data)
+
+    assert map_data_from_chunk(stream, chunk, format,
+                               StreamHandler(True)) is data
+
+    memmap.assert_called_with(stream, dtype=dtype, mode='r', offset=44,
+                              shape=(data_size // (format.wBitsPerSample // 8),))
+    if format.nChannels > 1:
+        data.reshape.assert_called_with(-1, format.nChannels)
 
 
-def test_read_list_chunk(mocker):
+def test_map_data_from_chunk_truncated(tmp_path):
     """
-    Test info is read correctly from list chunk
+    Test exception is raised if the file is shorter than the data chunk
     """
-    chunk = mocker.MagicMock()
-    chunk.getsize.return_value = 36
-    chunk.read.return_value = b'INFO'
+    format = FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
+                        nAvgBytesPerSec=2, nBlockAlign=2, wBitsPerSample=16)
+    file_path = tmp_path / 'truncated.wav'
+    file_path.write_bytes(b'h' * 44 + b'd' * 10)
+
+    with open(str(file_path), 'rb') as stream:
+        with pytest.raises(WaveFileIsCorrupted,
+                           match='Reached end of file prematurely.'):
+            map_data_from_chunk(stream, ChunkInfo(b'data', 44, 20), format,
+                                StreamHandler(True))
+
+
+def test_map_data_from_chunk_memory_truncated():
+    """
+    Test exception is raised if in-memory data is shorter than the data chunk
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
+                        nAvgBytesPerSec=2, nBlockAlign=2, wBitsPerSample=16)
+    stream = MemoryStream(b'h' * 44 + b'd' * 10)
+
+    with pytest.raises(WaveFileIsCorrupted,
+                       match='Reached end of file prematurely.'):
+        map_data_from_chunk(stream, ChunkInfo(b'data', 44, 20), format,
+                            StreamHandler(True))
+
+
+def test_map_data_from_chunk_not_a_file():
+    """
+    Test exception is raised if the stream is neither on disk nor in memory
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
+                        nAvgBytesPerSec=2, nBlockAlign=2, wBitsPerSample=16)
+    stream = ForwardStream(io.BytesIO(b'h' * 44 + b'd' * 20))
+
+    with pytest.raises(WaveValueError,
+                       match='mmap requires a file on disk or in memory.'):
+        map_data_from_chunk(stream, ChunkInfo(b'data', 44, 20), format,
+                            StreamHandler(True))
+
+
+def test_map_data_from_chunk_pipe():
+    """
+    Test exception is raised if the file descriptor is not a regular file
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
+                        nAvgBytesPerSec=2, nBlockAlign=2, wBitsPerSample=16)
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+
+    with open(read_fd, 'rb') as stream:
+        with pytest.raises(WaveValueError,
+                           match='mmap requires a file on disk or in '
+                                 'memory.'):
+            map_data_from_chunk(stream, ChunkInfo(b'data', 44, 20), format,
+                                StreamHandler(True))
+
+
+def test_map_data_from_chunk_24_bit(mocker):
+    """
+    Test that 24 bit data cannot be mapped
+    """
+    chunk = ChunkInfo(b'data', 44, 6)
+
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=1,
+                        nAvgBytesPerSec=6, nBlockAlign=6, wBitsPerSample=24)
+
+    with pytest.raises(WaveFileNotSupported,
+                       match=esc('Memory mapping is not supported for '
+                                 '24 bits.')):
+        map_data_from_chunk(None, chunk, format, StreamHandler(True))
+
+
+@pytest.mark.parametrize('channels, expected', [
+    (None, None),
+    ([1], [1]),
+    ([-1, 0], [3, 0]),
+    ((0, 1, 2, 3), None),
+    (range(4), None),
+    ([0, 0], [0, 0])
+])
+def test_get_channels(channels, expected):
+    """
+    Test channels are checked and normalized
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=4, nSamplesPerSec=1,
+                        nAvgBytesPerSec=8, nBlockAlign=8, wBitsPerSample=16)
+    assert get_channels(format, channels) == expected
+
+
+@pytest.mark.parametrize('channels, expected_msg', [
+    ([4], "Argument 'channels' must be a list of channel indexes lower than "
+          "4."),
+    ([-5], "Argument 'channels' must be a list of channel indexes lower than "
+           "4."),
+    ([1.0], "Argument 'channels' must be a list of channel indexes lower "
+            "than 4."),
+    (1, "Argument 'channels' must be a list of channel indexes lower than "
+        "4."),
+    ([], "Argument 'channels' cannot be empty.")
+])
+def test_get_channels_invalid(channels, expected_msg):
+    """
+    Test exception is raised for invalid channels
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=4, nSamplesPerSec=1,
+                        nAvgBytesPerSec=8, nBlockAlign=8, wBitsPerSample=16)
+    with pytest.raises(WaveValueError, match=esc(expected_msg)):
+        get_channels(format, channels)
+
+
+@pytest.mark.parametrize('format, dtype, expected', [
+    (FormatInfo(1, 1, 1, 2, 2, 16), None, None),
+    (FormatInfo(1, 1, 1, 2, 2, 16), 'int16', None),
+    (FormatInfo(1, 1, 1, 2, 2, 16), '>i2', None),
+    (FormatInfo(1, 1, 1, 2, 2, 16), 'float32', numpy.dtype('float32')),
+    (FormatInfo(1, 1, 1, 3, 3, 24), numpy.float64, numpy.dtype('float64')),
+    (FormatInfo(3, 1, 1, 4, 4, 32), 'f4', None),
+    (FormatInfo(3, 1, 1, 4, 4, 32), 'i2', numpy.dtype('int16')),
+])
+def test_get_conversion_dtype(format, dtype, expected):
+    """
+    Test dtype is checked and only returned if data needs converting
+    """
+    assert get_conversion_dtype(format, StreamHandler(True), dtype) == \
+        expected
+
+
+@pytest.mark.parametrize('dtype', ['int32', 'uint8', 'foo', object])
+def test_get_conversion_dtype_invalid(dtype):
+    """
+    Test exception is raised for dtypes that are not supported
+    """
+    with pytest.raises(WaveValueError,
+                       match=esc("Argument 'dtype' must be one of float32, "
+                                 "float64, int16.")):
+        get_conversion_dtype(FormatInfo(1, 1, 1, 2, 2, 16),
+                             StreamHandler(True), dtype)
+
+
+@pytest.mark.parametrize('channels, expected', [
+    (None, [[0.25, 0.5], [0.75, -1]]),
+    ([1], [0.5, -1])
+])
+def test_map_data_from_chunk_dtype(channels, expected):
+    """
+    Test mapped data is converted to dtype
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=1,
+                        nAvgBytesPerSec=4, nBlockAlign=4, wBitsPerSample=16)
+    values = numpy.array([8192, 16384, 24576, -32768], dtype='>i2')
+    chunk = ChunkInfo(b'data', 0, 8)
+
+    data = map_data_from_chunk(MemoryStream(values.tobytes()), chunk, format,
+                               StreamHandler(False), channels=channels,
+                               dtype=numpy.dtype('float32'))
+
+    assert data.dtype == numpy.float32
+    assert data.tolist() == expected
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+@pytest.mark.parametrize('channels, expected', [
+    ([2], [5, 8, 11]),
+    ([2, 0], [[5, 3], [8, 6], [11, 9]])
+])
+def test_data_from_chunk_channels(mmap, channels, expected):
+    """
+    Test only the selected channels are read (or copied from the map)
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=3, nSamplesPerSec=1,
+                        nAvgBytesPerSec=6, nBlockAlign=6, wBitsPerSample=16)
+    stream = MemoryStream(numpy.arange(12, dtype='<i2').tobytes())
+    chunk = ChunkInfo(b'data', 0, 24)
+
+    function = map_data_from_chunk if mmap else get_data_from_chunk
+    data = function(stream, chunk, format, StreamHandler(True), 1, None,
+                    channels)
+
+    assert data.flags.c_contiguous
+    assert data.tolist() == expected
+
+
+def mock_read_header(mocker, format, data):
+    """
+    Mock read_header for a data chunk containing data, and return stream.
+    """
+    chunk = ChunkInfo(b'data', 0, data.nbytes)
+
+    mocker.patch('wavy.detail.read.read_header', return_value=(
+        StreamHandler(True), format, None, chunk))
+
+    return io.BytesIO(data.tobytes())
 
-    sub_chunk = mocker.MagicMock()
-    sub_chunk.getsize.return_value = 8
-    sub_chunk.getname.side_effect = lambda: mock_tags['tags'].pop()
-    sub_chunk.read.side_effect = lambda: mock_tags['values'].pop()
 
-    mocker.patch('wavy.detail.read.get_chunk', return_value=sub_chunk)
+@pytest.mark.parametrize('blocksize, overlap, expected', [
+    (4, 0, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 0, 0]]),
+    (5, 0, [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]),
+    (4, 2, [[0, 1, 2, 3], [2, 3, 4, 5], [4, 5, 6, 7], [6, 7, 8, 9]]),
+    (4, 1, [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]]),
+    (4, 3, [[0, 1, 2, 3], [1, 2, 3, 4], [2, 3, 4, 5], [3, 4, 5, 6],
+            [4, 5, 6, 7], [5, 6, 7, 8], [6, 7, 8, 9]]),
+    (20, 0, [list(range(10)) + [0] * 10])
+])
+def test_read_blocks(blocksize, overlap, expected, mocker):
+    """
+    Test data is split into blocks correctly
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=1, nSamplesPerSec=1,
+                        nAvgBytesPerSec=2, nBlockAlign=2, wBitsPerSample=16)
+    stream = mock_read_header(mocker, format, numpy.arange(10, dtype='<i2'))
+
+    result = [block.tolist() for block in read_blocks(stream, blocksize,
+                                                      overlap)]
+    assert result == expected
+
+
+def test_read_blocks_out(mocker):
+    """
+    Test the same output array is used for every block
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=1,
+                        nAvgBytesPerSec=4, nBlockAlign=4, wBitsPerSample=16)
+    stream = mock_read_header(mocker, format, numpy.arange(10, dtype='<i2'))
+
+    out = numpy.empty((2, 2), dtype=numpy.float32)
+    expected = [[[0, 1], [2, 3]], [[4, 5], [6, 7]], [[8, 9], [0, 0]]]
+
+    for block, values in zip(read_blocks(stream, 2, out=out), expected):
+        assert block is out
+        assert block.tolist() == values
+
+
+@pytest.mark.parametrize('channels, out, expected', [
+    ([1], None, [[1, 4], [7, 10], [13, 0]]),
+    ([2, 0], None, [[[2, 0], [5, 3]], [[8, 6], [11, 9]], [[14, 12], [0, 0]]]),
+    ([1], numpy.empty(2), [[1, 4], [7, 10], [13, 0]]),
+    ([2, 0], numpy.empty((2, 2)), [[[2, 0], [5, 3]], [[8, 6], [11, 9]],
+                                   [[14, 12], [0, 0]]])
+])
+def test_read_blocks_channels(channels, out, expected, mocker):
+    """
+    Test only the selected channels are read into blocks
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=3, nSamplesPerSec=1,
+                        nAvgBytesPerSec=6, nBlockAlign=6, wBitsPerSample=16)
+    stream = mock_read_header(mocker, format, numpy.arange(15, dtype='<i2'))
+
+    result = [block.tolist() for block in read_blocks(stream, 2, out=out,
+                                                      channels=channels)]
+    assert result == expected
+
+
+@pytest.mark.parametrize('blocksize, overlap, out, error', [
+    (0, 0, None, "Argument 'blocksize' must be positive and greater than "
+                 "'overlap'."),
+    (4, 4, None, "Argument 'blocksize' must be positive and greater than "
+                 "'overlap'."),
+    (4, -1, None, "Argument 'blocksize' must be positive and greater than "
+                  "'overlap'."),
+    (4, 0, numpy.empty(4), "Argument 'out' must be of shape (4, 2).")
+])
+def test_read_blocks_invalid_args(blocksize, overlap, out, error, mocker):
+    """
+    Test exception is raised for invalid block arguments
+    """
+    format = FormatInfo(wFormatTag=1, nChannels=2, nSamplesPerSec=1,
+                        nAvgBytesPerSec=4, nBlockAlign=4, wBitsPerSample=16)
+    stream = mock_read_header(mocker, format, numpy.arange(10, dtype='<i2'))
+
+    with pytest.raises(WaveValueError, match=esc(error)):
+        next(read_blocks(stream, blocksize, overlap, out))
+
+
+@pytest.mark.parametrize('le', [True, False])
+def test_read_list_chunk(le):
+    """
+    Test info is read correctly from list chunk
+    """
+    # odd sized values are padded
+    data = b'INFO' + make_chunks([(b'bar\x00', b'value1\x00\x00\x00'),
+                                  (b'foo\x00', b'value2\x00\x00')], le)
+    stream = io.BytesIO(data)
+    chunk = ChunkInfo(b'LIST', 0, len(data))
+
     info_dict = {}
-    read_list_chunk('stream', chunk, info_dict)
+    read_list_chunk(stream, chunk, StreamHandler(le), info_dict)
 
     assert info_dict == {'bar': 'value1', 'foo': 'value2'}
 
 
-def test_read_list_chunk_not_info(mocker):
+def test_read_list_chunk_not_utf8():
+    """
+    Test values that are not UTF-8 are read with replaced characters
+    """
+    data = b'INFO' + make_chunks([(b'IART', 'Ren\xe9e\x00'.encode('cp1252'))])
+    stream = io.BytesIO(data)
+    chunk = ChunkInfo(b'LIST', 0, len(data))
+
+    info_dict = {}
+    read_list_chunk(stream, chunk, StreamHandler(True), info_dict)
+
+    assert info_dict == {'IART': 'Ren\ufffde'}
+
+
+@pytest.mark.parametrize('data', [b'foo bar', b'fo'])
+def test_read_list_chunk_not_info(data):
     """
     Test list chunk is skipped if not info
     """
-    chunk = mocker.MagicMock()
-    chunk.read.return_value = b'foo '
-    chunk.skip.return_value = None
+    stream = io.BytesIO(data)
+    chunk = ChunkInfo(b'LIST', 0, len(data))
 
-    read_list_chunk(None, chunk, None)
+    info_dict = {}
+    read_list_chunk(stream, chunk, StreamHandler(True), info_dict)
 
-    chunk.skip.assert_called_with()
+    assert info_dict == {}
 
 
 @pytest.mark.parametrize('tags, expected', [
@@ -328,49 +814,564 @@ def test_get_info_from_tags_dict(tags, expected):
     assert get_info_from_tags_dict(tags) == expected
 
 
-@pytest.mark.parametrize('read_data, tags', [
-    (True, {}),
-    (True, {'foo': 'bar'}),
-    (False, {}),
-    (False, {'foo': 'bar'})
+@pytest.mark.parametrize('read_data, mmap, lazy, tags', [
+    (True, False, False, {}),
+    (True, False, False, {'foo': 'bar'}),
+    (True, True, False, {}),
+    (True, False, True, {}),
+    (True, True, True, {}),
+    (False, False, False, {}),
+    (False, False, False, {'foo': 'bar'})
 ])
-def test_read_stream(read_data, tags, mocker):
+def test_read_stream(read_data, mmap, lazy, tags, mocker):
     """
     Test that read stream return correct data
     """
 
-    chunk = mocker.MagicMock()
-    chunk.getsize.return_value = 8
+    chunk = ChunkInfo(b'data', 44, 8)
+    stream = mocker.Mock()
+    stream.seekable.return_value = True
 
-    def get_data_chunk_mck(x, y):
-        y.update(tags)
+    def get_data_chunk_mck(stream, handler, chunks, info_tags, metadata):
+        info_tags.update(tags)
         return chunk
 
     check_head_chunk = mocker.patch('wavy.detail.read.get_stream_handler', return_value='stream_handler')
+    iter_chunks = mocker.patch('wavy.detail.read.iter_chunks', return_value='chunks')
     get_fmt_chunk = mocker.patch('wavy.detail.read.get_fmt_chunk', return_value='format')
     check_format_info = mocker.patch('wavy.detail.read.check_format_info')
 
     get_data_chunk = mocker.patch('wavy.detail.read.get_data_chunk', side_effect=get_data_chunk_mck)
 
+    read_trailing_chunks = mocker.patch('wavy.detail.read.read_trailing_chunks')
     get_info_from_tags_dict = mocker.patch('wavy.detail.read.get_info_from_tags_dict', return_value='info')
     get_data_from_chunk = mocker.patch('wavy.detail.read.get_data_from_chunk', return_value='data')
+    map_data_from_chunk = mocker.patch('wavy.detail.read.map_data_from_chunk', return_value='data')
+    get_frame_range = mocker.patch('wavy.detail.read.get_frame_range', return_value=(0, 2))
 
-    result = read_stream('stream', read_data)
+    result = read_stream(stream, read_data, mmap, lazy=lazy)
 
-    check_head_chunk.assert_called_with('stream')
-    get_fmt_chunk.assert_called_with('stream', 'stream_handler')
+    check_head_chunk.assert_called_with(stream)
+    iter_chunks.assert_called_with(stream, 'stream_handler')
+    get_fmt_chunk.assert_called_with(stream, 'stream_handler', 'chunks')
     check_format_info.assert_called_with('format')
-    get_data_chunk.assert_called_with('stream', tags)
+    get_data_chunk.assert_called_with(stream, 'stream_handler', 'chunks', tags, None)
+    read_trailing_chunks.assert_called_with(stream, 'stream_handler', 'chunks', tags, None)
 
     if tags:
         get_info_from_tags_dict.assert_called_with(tags)
 
     if read_data:
-        get_data_from_chunk.assert_called_with(chunk, 'format', 'stream_handler')
+        get_frame_range.assert_called_with('format', 8, None, None, False)
+
+    if lazy:
+        map_data_from_chunk.assert_not_called()
+        get_data_from_chunk.assert_not_called()
+    elif read_data and mmap:
+        map_data_from_chunk.assert_called_with(stream, chunk, 'format', 'stream_handler', 0, 2, None, None)
+    elif read_data:
+        get_data_from_chunk.assert_called_with(stream, chunk, 'format', 'stream_handler', 0, 2, None, None)
 
     info = 'info' if tags else None
 
-    if read_data:
+    if lazy:
+        assert result == ('format', info, DataRange(chunk, 'stream_handler',
+                                                    0, 2, mmap, None, None,
+                                                    None))
+    elif read_data:
         assert result == ('format', info, 'data')
     else:
         assert result == ('format', info, 8)
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_read_file_data_range(mmap, mocker):
+    """
+    Test that data range is read from the file
+    """
+    stream = io.BytesIO()
+    get_stream_from_file = mocker.patch(
+        'wavy.detail.read.get_stream_from_file', return_value=stream)
+    get_data_from_chunk = mocker.patch('wavy.detail.read.get_data_from_chunk',
+                                       return_value='data')
+    map_data_from_chunk = mocker.patch('wavy.detail.read.map_data_from_chunk',
+                                       return_value='mapped')
+
+    data_range = DataRange('chunk', 'handler', 1, 2, mmap, [0], 'dtype',
+                           None)
+
+    assert read_file_data_range('file', 'format', data_range) == \
+        ('mapped' if mmap else 'data')
+
+    get_stream_from_file.assert_called_with('file', 'rb', io.BufferedReader)
+    (map_data_from_chunk if mmap else get_data_from_chunk).assert_called_with(
+        stream, 'chunk', 'format', 'handler', 1, 2, [0], 'dtype')
+    assert stream.closed
+
+
+@pytest.mark.parametrize('workers, expected', [
+    (None, None), (1, None), (4, 4)
+])
+def test_get_parallel_workers(workers, expected):
+    """
+    Test number of threads reading the data
+    """
+    assert get_parallel_workers(workers) == expected
+
+
+def test_get_parallel_workers_fail():
+    """
+    Test exception is raised if the number of workers is not positive
+    """
+    with pytest.raises(WaveValueError,
+                       match=esc("Argument 'workers' must be positive.")):
+        get_parallel_workers(0)
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('sample_width, dtype, channels, expected', [
+    (16, None, None, [[1, 2], [3, 4]]),
+    (24, None, None, [[1, 2], [3, 4]]),
+    (16, None, [1], [[2], [4]]),
+    (16, numpy.dtype('float32'), None,
+     [[2 ** -15, 2 * 2 ** -15], [3 * 2 ** -15, 4 * 2 ** -15]])
+])
+def test_read_frames_into(le, sample_width, dtype, channels, expected):
+    """
+    Test frames are read into the given array
+    """
+    n_bytes = sample_width // 8
+    stream = io.BytesIO(b''.join(
+        value.to_bytes(n_bytes, 'little' if le else 'big', signed=True)
+        for value in range(1, 5)))
+    format = FormatInfo(1, 2, 8000, 8000 * 2 * n_bytes, 2 * n_bytes,
+                        sample_width)
+    out = numpy.zeros((2, len(channels) if channels else 2),
+                      dtype or StreamHandler(le).get_data_dtype(n_bytes,
+                                                                False))
+
+    read_frames_into(stream, format, StreamHandler(le), 2, out, channels,
+                     dtype)
+    assert numpy.array_equal(out, expected)
+
+
+@requires_pread
+@pytest.mark.parametrize('n_channels, channels, expected_shape', [
+    (1, None, (50,)), (2, None, (50, 2)), (2, [1], (50,))
+])
+def test_read_data_parallel(n_channels, channels, expected_shape, tmp_path,
+                            mocker):
+    """
+    Test data is read in ranges by many threads
+    """
+    mocker.patch('wavy.detail.read.MIN_RANGE_SIZE', 8)
+    executor = mocker.spy(concurrent.futures, 'ThreadPoolExecutor')
+    read_frames_into = mocker.spy(wavy.detail.read, 'read_frames_into')
+
+    data = numpy.arange(50 * n_channels, dtype='<i2')
+    path = tmp_path / 'test.bin'
+    path.write_bytes(b'\x00' * 10 + data.tobytes())
+    format = FormatInfo(1, n_channels, 8000, 16000 * n_channels,
+                        2 * n_channels, 16)
+    data_range = DataRange(ChunkInfo(DATA, 10, data.nbytes),
+                           StreamHandler(True), 0, 50, False, channels, None,
+                           3)
+
+    with open(path, 'rb') as file:
+        result = read_data_parallel(file.fileno(), format, data_range)
+
+    expected = data.reshape(-1, n_channels)
+    if channels:
+        expected = expected[:, channels]
+    assert result.shape == expected_shape
+    assert numpy.array_equal(result, expected.reshape(expected_shape))
+
+    # frames are split into workers * N_RANGES_PER_WORKER ranges
+    executor.assert_called_once_with(3)
+    assert read_frames_into.call_count == 10
+
+
+@requires_pread
+def test_read_data_parallel_truncated(tmp_path):
+    """
+    Test exception is raised if the file ends before the data
+    """
+    path = tmp_path / 'test.bin'
+    path.write_bytes(b'\x00' * 10)
+    format = FormatInfo(1, 1, 8000, 16000, 2, 16)
+    data_range = DataRange(ChunkInfo(DATA, 0, 20), StreamHandler(True), 0,
+                           10, False, None, None, 2)
+
+    with open(path, 'rb') as file:
+        with pytest.raises(WaveFileIsCorrupted):
+            read_data_parallel(file.fileno(), format, data_range)
+
+
+@pytest.mark.parametrize('workers, fd, parallel', [
+    (None, 3, False), (2, None, False), (2, 3, True)
+])
+def test_read_data_range_workers(workers, fd, parallel, mocker):
+    """
+    Test data is read by many threads only for files on disk
+    """
+    get_file_descriptor = mocker.patch(
+        'wavy.detail.read.get_file_descriptor', return_value=fd)
+    get_data_from_chunk = mocker.patch('wavy.detail.read.get_data_from_chunk',
+                                       return_value='data')
+    read_data_parallel = mocker.patch('wavy.detail.read.read_data_parallel',
+                                      return_value='parallel')
+
+    data_range = DataRange('chunk', 'handler', 1, 2, False, None, None,
+                           workers)
+
+    assert read_data_range('stream', 'format', data_range) == \
+        ('parallel' if parallel else 'data')
+
+    if workers:
+        get_file_descriptor.assert_called_with('stream')
+    if parallel:
+        read_data_parallel.assert_called_with(fd, 'format', data_range)
+        get_data_from_chunk.assert_not_called()
+
+
+@pytest.mark.parametrize('le', [True, False])
+def test_read_chunk_table(le):
+    """
+    Test all chunks are listed, including those after the data
+    """
+    prefix = '<' if le else '>'
+    content = make_chunks([
+        (b'fmt ', b'f' * 16), (b'JUNK', b'j' * 3), (b'data', b'd' * 11),
+        (b'LIST', b'INFO'), (b'bext', b'b' * 5)
+    ], le)
+    stream = io.BytesIO(b'skip' + (b'RIFF' if le else b'RIFX') +
+                        struct.pack(prefix + 'L', len(content) + 4) +
+                        b'WAVE' + content)
+    stream.seek(4)
+
+    assert read_chunk_table(stream) == [
+        ChunkInfo(b'fmt ', 24, 16),
+        ChunkInfo(b'JUNK', 48, 3),
+        ChunkInfo(b'data', 60, 11),
+        ChunkInfo(b'LIST', 80, 4),
+        ChunkInfo(b'bext', 92, 5)
+    ]
+
+
+def test_read_chunk_table_rf64():
+    """
+    Test ds64 chunk is listed and 64 bit sizes are used
+    """
+    ds64 = struct.pack('<QQQL', 0, 2 ** 33, 0, 1) + \
+        struct.pack('<4sQ', b'JUNK', 2 ** 32 + 2)
+    content = make_chunks([(b'ds64', ds64), (b'fmt ', b'f' * 16)]) + \
+        struct.pack('<4sL', b'JUNK', 0xFFFFFFFF)
+    stream = io.BytesIO(b'RF64' + struct.pack('<L', 0xFFFFFFFF) + b'WAVE' +
+                        content)
+
+    assert read_chunk_table(stream) == [
+        ChunkInfo(b'ds64', 20, 40),
+        ChunkInfo(b'fmt ', 68, 16),
+        ChunkInfo(b'JUNK', 92, 2 ** 32 + 2)
+    ]
+
+
+def test_read_chunk_table_non_seekable():
+    """
+    Test chunks are listed up to the data for streams that cannot seek
+    """
+    content = make_chunks([(b'fmt ', b'f' * 16), (b'data', b'd' * 1000),
+                           (b'LIST', b'INFO')])
+    raw = io.BytesIO(b'RIFF' + struct.pack('<L', len(content) + 4) +
+                     b'WAVE' + content)
+    stream = PrefetchStream(ForwardStream(raw), 100)
+
+    assert read_chunk_table(stream) == [
+        ChunkInfo(b'fmt ', 20, 16),
+        ChunkInfo(b'data', 44, 1000)
+    ]
+    assert raw.tell() == 100
+
+
+def test_read_chunk_table_seeks(mocker):
+    """
+    Test only chunk headers are read
+    """
+    content = make_chunks([(b'fmt ', b'f' * 16), (b'data', b'd' * 1000),
+                           (b'LIST', b'INFO')])
+    stream = io.BytesIO(b'RIFF' + struct.pack('<L', len(content) + 4) +
+                        b'WAVE' + content)
+    read = mocker.spy(stream, 'read')
+
+    assert len(read_chunk_table(stream)) == 3
+    assert all(call.args[0] <= CHUNK_HEADER_SIZE
+               for call in read.call_args_list)
+
+
+@pytest.mark.parametrize('trailing, expected', [
+    (b'', {}),
+    (make_chunks([(b'LIST', b'INFOINAM\x02\x00\x00\x00a\x00')]),
+     {'INAM': 'a'}),
+    (make_chunks([(b'JUNK', b'j' * 3),
+                  (b'LIST', b'INFOICMT\x02\x00\x00\x00b\x00')]),
+     {'ICMT': 'b'}),
+    (make_chunks([(b'LIST', b'INFOINAM\x02\x00\x00\x00a\x00')]) + b'LIS',
+     {'INAM': 'a'}),
+    (make_chunks([(b'LIST', b'adtl')]), {}),
+    (make_chunks([(b'LIST', b'INFOICMT\x02\x00\x00\x00\xe9\x00')]),
+     {'ICMT': '\ufffd'})
+])
+def test_read_trailing_chunks(trailing, expected):
+    """
+    Test tags after the data chunk are read
+    """
+    stream, handler, chunks = make_stream([(b'data', b'd' * 1000)])
+    stream = io.BytesIO(stream.getvalue() + trailing)
+    chunks = iter_chunks(stream, handler)
+    assert get_data_chunk(stream, handler, chunks).id == DATA
+
+    info_tags = {}
+    read_trailing_chunks(stream, handler, chunks, info_tags)
+    assert info_tags == expected
+
+
+def make_file(chunks, le=True):
+    """
+    Encode list of (name, data) into a WAVE file.
+    """
+    content = make_chunks(chunks, le)
+    return (b'RIFF' if le else b'RIFX') + \
+        struct.pack('<L' if le else '>L', len(content) + 4) + b'WAVE' + content
+
+
+FMT_DATA = struct.pack('<HHLLHH', 1, 1, 8000, 16000, 2, 16)
+
+LIST_DATA = b'INFOINAM\x02\x00\x00\x00a\x00'
+
+
+@pytest.mark.parametrize('stream_class, trailing_chunks, expected', [
+    (io.BytesIO, True, Tags(name='a')),
+    (io.BytesIO, False, None),
+    (lambda data: ForwardStream(io.BytesIO(data)), True, None)
+])
+def test_read_header_trailing_chunks(stream_class, trailing_chunks,
+                                     expected):
+    """
+    Test tags after the data are only read from seekable streams
+    """
+    stream = stream_class(make_file([(b'fmt ', FMT_DATA),
+                                     (b'data', b'd' * 10),
+                                     (b'LIST', LIST_DATA)]))
+
+    handler, format, info, data_chunk = read_header(stream, trailing_chunks)
+    assert data_chunk == ChunkInfo(DATA, 44, 10)
+    assert info == expected
+
+
+BEXT_DATA = struct.pack('<256s32s32s10s8sLLH64shhhhh180x', b'desc', b'orig',
+                        b'ref\x00junk', b'2020-01-02', b'03:04:05', 1, 2, 2,
+                        b'u' * 64, -2300, 512, -100, -1800, -2000) + \
+    b'A=PCM,F=48000\r\n\x00'
+
+BEXT_INFO = Bext(description='desc', originator='orig',
+                 originator_reference='ref', origination_date='2020-01-02',
+                 origination_time='03:04:05', time_reference=2 ** 33 + 1,
+                 version=2, umid=b'u' * 64, loudness_value=-23,
+                 loudness_range=5.12, max_true_peak_level=-1,
+                 max_momentary_loudness=-18, max_short_term_loudness=-20,
+                 coding_history='A=PCM,F=48000\r\n')
+
+
+@pytest.mark.parametrize('data, expected', [
+    (BEXT_DATA, BEXT_INFO),
+    (BEXT_DATA[:346] + struct.pack('<H', 1) + BEXT_DATA[348:],
+     BEXT_INFO._replace(version=1, loudness_value=None, loudness_range=None,
+                        max_true_peak_level=None, max_momentary_loudness=None,
+                        max_short_term_loudness=None)),
+    (b'desc', Bext('desc', '', '', '', '', 0, 0, b'\x00' * 64, None, None,
+                   None, None, None, ''))
+], ids=['version_2', 'version_1', 'short'])
+def test_read_bext_chunk(data, expected):
+    """
+    Test bext chunk is parsed, short chunks are padded
+    """
+    stream = io.BytesIO(data)
+    chunk = ChunkInfo(b'bext', 0, len(data))
+    assert read_bext_chunk(stream, chunk, StreamHandler(True)) == expected
+
+
+def test_read_bext_chunk_big_endian():
+    """
+    Test bext chunk of RIFX files is parsed
+    """
+    data = struct.pack('>256s32s32s10s8sLLH64shhhhh180x', b'', b'', b'',
+                       b'', b'', 3, 0, 1, b'', 0, 0, 0, 0, 0)
+    chunk = ChunkInfo(b'bext', 0, len(data))
+    bext = read_bext_chunk(io.BytesIO(data), chunk, StreamHandler(False))
+    assert bext.time_reference == 3
+    assert bext.version == 1
+
+
+IXML_DATA = b'<BWFXML><PROJECT>p</PROJECT></BWFXML>\x00'
+
+
+@pytest.mark.parametrize('metadata, expected', [
+    (None, None),
+    ({}, {BEXT: BEXT_INFO, IXML: IXML_DATA[:-1].decode()})
+])
+@pytest.mark.parametrize('trailing', [False, True])
+def test_read_header_metadata(metadata, expected, trailing):
+    """
+    Test bext and iXML are read before and after the data, only if asked
+    """
+    metadata_chunks = [(b'bext', BEXT_DATA), (b'iXML', IXML_DATA)]
+    chunks = [(b'fmt ', FMT_DATA), (b'data', b'd' * 10)]
+    if trailing:
+        chunks += metadata_chunks
+    else:
+        chunks[1:1] = metadata_chunks
+    stream = io.BytesIO(make_file(chunks))
+
+    read_header(stream, metadata=metadata)
+    assert metadata == expected
+
+
+def make_cue_data(points, le=True):
+    """
+    Encode list of (id, frame) into cue chunk data.
+    """
+    prefix = '<' if le else '>'
+    return struct.pack(prefix + 'L', len(points)) + b''.join(
+        struct.pack(prefix + 'LL4sLLL', id, i, b'data', 0, 0, frame)
+        for i, (id, frame) in enumerate(points))
+
+
+def make_smpl_data(loops, le=True):
+    """
+    Encode list of (id, start, end) into smpl chunk data.
+    """
+    prefix = '<' if le else '>'
+    return struct.pack(prefix + '9L', 0, 0, 22675, 60, 0, 0, 0, len(loops),
+                       0) + b''.join(
+        struct.pack(prefix + '6L', id, 0, start, end, 0, 0)
+        for id, start, end in loops)
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('points, n_bytes, expected', [
+    ([], None, {}),
+    ([], 0, {}),
+    ([(1, 100), (2, 50)], None, {1: 100, 2: 50}),
+    # number of points larger than the chunk
+    ([(1, 100), (2, 50)], -1, {1: 100})
+])
+def test_read_cue_chunk(points, n_bytes, expected, le):
+    """
+    Test cue points are parsed
+    """
+    data = make_cue_data(points, le)[:n_bytes]
+    chunk = ChunkInfo(b'cue ', 0, len(data))
+    assert read_cue_chunk(io.BytesIO(data), chunk, StreamHandler(le)) == \
+        expected
+
+
+def test_read_adtl_list():
+    """
+    Test labels and lengths are parsed from the adtl list
+    """
+    data = make_chunks([
+        (b'labl', struct.pack('<L', 1) + b'kick\x00'),
+        (b'ltxt', struct.pack('<LL4sHHHH', 1, 30, b'rgn ', 0, 0, 0, 0)),
+        (b'ltxt', struct.pack('<LL4sHHHH', 2, 40, b'rgn ', 0, 0, 0, 0)),
+        (b'note', struct.pack('<L', 2) + b'a note\x00'),
+        (b'labl', struct.pack('<L', 3) + b'snare'),
+        (b'labl', b'\x01')
+    ])
+    assert read_adtl_list(data, StreamHandler(True)) == {
+        1: ('kick', 30),
+        2: (None, 40),
+        3: ('snare', 0)
+    }
+
+
+@pytest.mark.parametrize('data, expected', [
+    (b'', []),
+    (make_smpl_data([]), []),
+    (make_smpl_data([(1, 10, 19), (5, 30, 29)]), [(1, 10, 10), (5, 30, 0)]),
+    (make_smpl_data([(1, 10, 19), (5, 30, 29)])[:-1], [(1, 10, 10)])
+])
+def test_read_smpl_chunk(data, expected):
+    """
+    Test sample loops are parsed
+    """
+    chunk = ChunkInfo(b'smpl', 0, len(data))
+    assert read_smpl_chunk(io.BytesIO(data), chunk, StreamHandler(True)) == \
+        expected
+
+
+@pytest.mark.parametrize('metadata, expected', [
+    ({}, None),
+    ({ADTL: {1: ('a', 10)}}, None),
+    ({CUE: {2: 50, 1: 100}, ADTL: {1: ('a', 10)}},
+     [Region(2, 50, 0, None), Region(1, 100, 10, 'a')]),
+    ({CUE: {1: 100}, SMPL: [(1, 100, 20), (3, 0, 5)],
+      ADTL: {3: ('loop', 0)}},
+     [Region(3, 0, 5, 'loop'), Region(1, 100, 20, None)]),
+    ({CUE: {1: 100}, ADTL: {1: (None, 10)}, SMPL: [(1, 100, 20)]},
+     [Region(1, 100, 10, None)])
+])
+def test_get_regions(metadata, expected):
+    """
+    Test regions are built from cue points, labels and loops
+    """
+    assert get_regions(metadata) == expected
+
+
+REGIONS = [Region(1, 0, 10, 'a'), Region(2, 20, 0, 'b'),
+           Region(3, 50, 0, 'c'), Region(4, 90, 20, 'a')]
+
+
+@pytest.mark.parametrize('label_or_id, expected', [
+    ('a', (0, 10)),
+    (1, (0, 10)),
+    ('b', (20, 50)),
+    (3, (50, 90)),
+    (4, (90, 100))
+])
+def test_get_region_range(label_or_id, expected):
+    """
+    Test range of frames of regions and markers
+    """
+    assert get_region_range(REGIONS, label_or_id, 100) == expected
+
+
+@pytest.mark.parametrize('regions, label_or_id, message', [
+    (REGIONS, 'd', "Region 'd' not found."),
+    (REGIONS, 5, "Region 5 not found."),
+    (None, 'a', "Region 'a' not found."),
+    (REGIONS, True, "Argument 'label_or_id' must be a string or an integer."),
+    (REGIONS, 1.0, "Argument 'label_or_id' must be a string or an integer.")
+])
+def test_get_region_range_error(regions, label_or_id, message):
+    """
+    Test error is raised for regions that are not found
+    """
+    with pytest.raises(WaveValueError, match=esc(message)):
+        get_region_range(regions, label_or_id, 100)
+
+
+def test_read_stream_region():
+    """
+    Test only the frames of the region are read
+    """
+    data = numpy.arange(100, dtype='<i2')
+    adtl = b'adtl' + make_chunks([
+        (b'labl', struct.pack('<L', 7) + b'hit\x00'),
+        (b'ltxt', struct.pack('<LL4sHHHH', 7, 5, b'rgn ', 0, 0, 0, 0))])
+    stream = io.BytesIO(make_file([(b'fmt ', FMT_DATA),
+                                   (b'cue ', make_cue_data([(7, 10)])),
+                                   (b'data', data.tobytes()),
+                                   (b'LIST', adtl)]))
+
+    format, info, result = read_stream(stream, region='hit')
+    assert numpy.array_equal(result, data[10:15])
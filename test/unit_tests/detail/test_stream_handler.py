@@ -1,6 +1,8 @@
+import io
 import numpy
 import pytest
 import struct
+import wavy
 from wavy.detail import *
 
 
@@ -36,25 +38,55 @@ def test_stream_handler_read(le, prefix, mocker):
     (2, False, 'i2'),
     (4, False, 'i4'),
     (8, False, 'i8'),
-    (8, True, 'f8'),
-    (16, True, 'f16')
+    (4, True, 'f4'),
+    (8, True, 'f8')
 ])
-def test_stream_handler_read_data_simple_type(n_bytes, is_float, expected_dtype, mocker):
+def test_stream_handler_read_data_simple_type(n_bytes, is_float, expected_dtype):
     """
     Test that StreamHandler reads data correctly for 8, 16, 32, and 64 bit
     """
-    # set up mocks
-    fromstring = mocker.patch('numpy.fromstring', return_value='data')
-    stream = mocker.MagicMock()
-    stream.read.return_value = 'raw_data'
+    values = numpy.arange(10, dtype=expected_dtype)
 
     for le in [True, False]:
+        prefix = '<' if le else '>'
+        stream = io.BytesIO(values.astype(prefix + expected_dtype).tobytes())
+
         handler = StreamHandler(le)
-        assert handler.read_data(stream, 10, n_bytes, is_float) == 'data'
+        data = handler.read_data(stream, values.nbytes, n_bytes, is_float)
 
-        prefix = '<' if le else '>'
-        fromstring.assert_called_with('raw_data', dtype=prefix + expected_dtype)
-        stream.read.assert_called_with(10)
+        # data is always returned in native byte order
+        assert data.dtype == numpy.dtype(expected_dtype)
+        assert numpy.array_equal(data, values)
+
+
+@pytest.mark.parametrize('le', [True, False])
+def test_stream_handler_read_data_memory_stream(le):
+    """
+    Test that StreamHandler returns a view of in-memory data
+    """
+    dtype = ('<' if le else '>') + 'i2'
+    buffer = bytearray(numpy.arange(10, dtype=dtype).tobytes())
+
+    stream = MemoryStream(buffer)
+    stream.seek(4)
+
+    data = StreamHandler(le).read_data(stream, 8, 2, False)
+    assert data.dtype == numpy.dtype(dtype)
+    assert data.tolist() == [2, 3, 4, 5]
+    assert stream.tell() == 12
+    assert numpy.shares_memory(data, numpy.frombuffer(buffer, numpy.uint8))
+
+
+def test_stream_handler_read_data_memory_stream_truncated():
+    """
+    Test exception is raised if in-memory data is shorter than requested
+    """
+    stream = MemoryStream(numpy.arange(10, dtype='<i2').tobytes())
+    stream.seek(4)
+
+    with pytest.raises(wavy.WaveFileIsCorrupted,
+                       match='Reached end of file prematurely.'):
+        StreamHandler(True).read_data(stream, 18, 2, False)
 
 
 @pytest.mark.parametrize('le, n_bytes', [
@@ -65,16 +97,156 @@ def test_stream_handler_read_data_complex_type(le, n_bytes, mocker):
     """
     Test that StreamHandler reads data correctly for 24 and 48 bit
     """
-    # set up mocks
-    array = mocker.patch('numpy.array', return_value='data')
-    stream = mocker.MagicMock()
-    # 10 in int 24
-    padding = (n_bytes - 1) * b'\x00'
-    stream.read.return_value = b'\n' + padding if le else padding + b'\n'
+    # make sure data is unpacked in more than one block
+    mocker.patch('wavy.detail.stream_handler.UNPACK_BLOCK_SIZE', 3)
+
+    values = [10, -10, 2 ** (8 * n_bytes - 1) - 1, -2 ** (8 * n_bytes - 1),
+              0, -1, 1, 12345]
+    # encode values as n_bytes signed integers
+    raw = b''.join(value.to_bytes(n_bytes, 'little' if le else 'big',
+                                  signed=True) for value in values)
+
+    handler = StreamHandler(le)
+    data = handler.read_data(io.BytesIO(raw), len(raw), n_bytes, False)
+
+    assert data.dtype == (numpy.int32 if n_bytes == 3 else numpy.int64)
+    assert data.tolist() == values
+
+
+@pytest.mark.parametrize('n_bytes, dtype', [
+    (1, 'u1'), (2, 'i2'), (3, 'i4'), (4, 'i4'), (4, 'f4'), (6, 'i8'),
+    (8, 'f8')
+])
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('channels', [[0], [4, 1], [0, 1, 2, 3, 4]])
+def test_stream_handler_read_channels(n_bytes, dtype, le, channels, mocker):
+    """
+    Test that StreamHandler reads only the selected channels
+    """
+    # make sure data is read in more than one block
+    mocker.patch('wavy.detail.stream_handler.CHANNELS_BLOCK_SIZE', 20)
+
+    n_bits = 8 * n_bytes
+    values = numpy.arange(-35, 35).reshape(-1, 5)
+    if dtype == 'u1':
+        values += 128
+    elif dtype[0] == 'i':
+        # use the full range of the samples
+        values[0] = [2 ** (n_bits - 1) - 1, -2 ** (n_bits - 1), -1, 0, 1]
+
+    raw = b''.join(int(value).to_bytes(n_bytes, 'little' if le else 'big',
+                                       signed=dtype[0] == 'i')
+                   for value in values.ravel()) if dtype[0] != 'f' else \
+        values.astype(('<' if le else '>') + dtype).tobytes()
 
     handler = StreamHandler(le)
-    assert handler.read_data(stream, 2 * n_bytes, n_bytes, False) == 'data'
+    data = handler.read_channels(io.BytesIO(raw), 14, n_bytes, dtype[0] == 'f',
+                                 5, channels)
+
+    assert data.dtype == numpy.dtype(dtype)
+    assert data.flags.c_contiguous
+    assert data.tolist() == values[:, channels].tolist()
+
+
+def test_stream_handler_read_channels_out():
+    """
+    Test that StreamHandler reads the selected channels into out
+    """
+    values = numpy.arange(12, dtype='<i2').reshape(-1, 3)
+    out = numpy.zeros((4, 2), dtype=numpy.float32)
 
-    array.assert_called_with([10, 10], dtype=numpy.int32 if n_bytes == 3 else numpy.int64)
-    stream.read.assert_has_calls([mocker.call(n_bytes),
-                                  mocker.call(n_bytes)])
+    data = StreamHandler(True).read_channels(io.BytesIO(values.tobytes()), 4,
+                                             2, False, 3, [2, 0], out)
+    assert data is out
+    assert out.tolist() == values[:, [2, 0]].tolist()
+
+
+@pytest.mark.parametrize('values, n_bytes, is_float, dtype, expected', [
+    # 8 bit is unsigned
+    ([0, 64, 128, 255], 1, False, 'f4', [-1, -0.5, 0, 127 / 128]),
+    ([0, 64, 128, 255], 1, False, 'i2', [-32768, -16384, 0, 32512]),
+    ([-32768, -16384, 0, 32767], 2, False, 'f8',
+     [-1, -0.5, 0, 32767 / 32768]),
+    ([-2 ** 31, 2 ** 30, 2 ** 31 - 1], 4, False, 'f8',
+     [-1, 0.5, (2 ** 31 - 1) / 2 ** 31]),
+    ([-2 ** 31, 2 ** 30, 2 ** 31 - 1, 2 ** 16 - 1], 4, False, 'i2',
+     [-32768, 16384, 32767, 0]),
+    ([-1, -0.5, 0, 0.99999, 2, -2], 4, True, 'i2',
+     [-32768, -16384, 0, 32767, 32767, -32768]),
+    ([-1, 0.25, 1.5], 8, True, 'f4', [-1, 0.25, 1.5]),
+])
+def test_convert_samples(values, n_bytes, is_float, dtype, expected):
+    """
+    Test samples are scaled to the target dtype
+    """
+    raw_dtype = StreamHandler(False).get_dtype(n_bytes, is_float)
+    raw = numpy.array(values, dtype=raw_dtype)
+    out = numpy.empty(len(values), dtype=dtype)
+
+    convert_samples(raw, out, n_bytes, is_float, numpy.dtype(dtype))
+    assert out.tolist() == expected
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('dtype, expected', [
+    ('f8', [-1, -2 ** -23, 0, 0.5, 1 - 2 ** -23]),
+    ('f4', [-1, -2 ** -23, 0, 0.5, 1 - 2 ** -23]),
+    ('i2', [-32768, -1, 0, 16384, 32767])
+])
+def test_stream_handler_read_data_dtype(le, dtype, expected, mocker):
+    """
+    Test that StreamHandler converts 24 bit data while reading it
+    """
+    # make sure data is converted in more than one block
+    mocker.patch('wavy.detail.stream_handler.CHANNELS_BLOCK_SIZE', 6)
+
+    values = [-2 ** 23, -1, 0, 2 ** 22, 2 ** 23 - 1]
+    raw = b''.join(value.to_bytes(3, 'little' if le else 'big', signed=True)
+                   for value in values)
+
+    data = StreamHandler(le).read_data(io.BytesIO(raw), len(raw), 3, False,
+                                       numpy.dtype(dtype))
+
+    assert data.dtype == numpy.dtype(dtype)
+    assert data.tolist() == expected
+
+
+class MockShortReader(object):
+    """
+    Stream that returns at most two bytes per readinto.
+    """
+
+    def __init__(self, data):
+        self.stream = io.BytesIO(data)
+
+    def readinto(self, buffer):
+        return self.stream.readinto(buffer[:2])
+
+
+@pytest.mark.parametrize('stream', [
+    io.BytesIO(b'abcdefg'),
+    MockShortReader(b'abcdefg'),
+    # chunk.Chunk has no readinto
+    type('MockReader', (), {'read': io.BytesIO(b'abcdefg').read})()
+])
+def test_read_into(stream):
+    """
+    Test that buffer is filled from stream
+    """
+    buffer = bytearray(5)
+    read_into(stream, buffer)
+    assert buffer == b'abcde'
+
+
+@pytest.mark.parametrize('stream', [
+    io.BytesIO(b'abc'),
+    MockShortReader(b'abc'),
+    type('MockReader', (), {'read': io.BytesIO(b'abc').read})()
+])
+def test_read_into_eof(stream):
+    """
+    Test that exception is raised if stream is too short
+    """
+    with pytest.raises(wavy.WaveFileIsCorrupted,
+                       match='Reached end of file prematurely.'):
+        read_into(stream, bytearray(5))
@@ -0,0 +1,420 @@
+import io
+import numpy
+import pytest
+import struct
+import wavy
+from re import escape as esc
+from wavy import *
+from wavy.detail import *
+
+
+@pytest.mark.parametrize('format, sample_width, expected', [
+    ('pcm', 8, 1), ('pcm', 24, 1), ('float', 32, 3), ('float', 64, 3)
+])
+def test_get_format_tag(format, sample_width, expected):
+    """
+    Test format tag is returned for supported formats
+    """
+    assert get_format_tag(format, sample_width) == expected
+
+
+@pytest.mark.parametrize('format, sample_width, expected_msg', [
+    ('foo', 16, "Argument 'format' must be one of pcm, float."),
+    ('pcm', 64, "Sample width '64' is not supported for format 'pcm'."),
+    ('float', 16, "Sample width '16' is not supported for format 'float'.")
+])
+def test_get_format_tag_fail(format, sample_width, expected_msg):
+    """
+    Test exception is raised for formats that are not supported
+    """
+    with pytest.raises(WaveValueError, match=esc(expected_msg)):
+        get_format_tag(format, sample_width)
+
+
+@pytest.mark.parametrize('data, sample_width, format_tag, n_channels', [
+    (numpy.zeros(4, numpy.int16), 16, 1, 1),
+    (numpy.zeros((4, 1), numpy.int16), 16, 1, 1),
+    (numpy.zeros((4, 3), numpy.int32), 24, 1, 3),
+    (numpy.zeros((4, 2), '>f4'), 32, 3, 2)
+])
+def test_check_data_format(data, sample_width, format_tag, n_channels):
+    """
+    Test data that can be written passes
+    """
+    check_data_format(data, sample_width, format_tag, n_channels)
+
+
+@pytest.mark.parametrize('data, sample_width, format_tag, expected_msg', [
+    ([1, 2], 16, 1, "Argument 'data' must be of type numpy.ndarray."),
+    (numpy.zeros(4, numpy.int16), 16, 1,
+     "Argument 'data' must be of shape (n_frames, 2)."),
+    (numpy.zeros((4, 3), numpy.int16), 16, 1,
+     "Argument 'data' must be of shape (n_frames, 2)."),
+    (numpy.zeros((4, 2), numpy.int16), 24, 1,
+     "Sample width of '24' is not supported for dtype 'int16'."),
+    (numpy.zeros((4, 2), numpy.int32), 32, 3,
+     "Data array dtype 'int32' is not supported for the format."),
+    (numpy.zeros((4, 2), numpy.float32), 32, 1,
+     "Data array dtype 'float32' is not supported for the format.")
+])
+def test_check_data_format_fail(data, sample_width, format_tag, expected_msg):
+    """
+    Test exception is raised for data that cannot be written
+    """
+    with pytest.raises(WaveValueError, match=esc(expected_msg)):
+        check_data_format(data, sample_width, format_tag, 2)
+
+
+@pytest.mark.parametrize('le', [True, False])
+def test_write_header_pcm(le):
+    """
+    Test header of PCM files
+    """
+    prefix = '<' if le else '>'
+    stream = io.BytesIO()
+    stream.write(b'skip')
+
+    layout = write_header(stream, StreamHandler(le), 1, 16, 8000, 2)
+
+    assert layout == HeaderLayout(data_offset=44, ds64_offset=None,
+                                  fact_offset=None)
+    assert stream.getvalue() == b'skip' + (b'RIFF' if le else b'RIFX') + \
+        struct.pack(prefix + 'L', 0) + b'WAVEfmt ' + \
+        struct.pack(prefix + 'LHHLLHH', 16, 1, 2, 8000, 32000, 4, 16) + \
+        b'data' + struct.pack(prefix + 'L', 0)
+
+
+def test_write_header_float():
+    """
+    Test header of float files has fact chunk
+    """
+    stream = io.BytesIO()
+    layout = write_header(stream, StreamHandler(True), 3, 32, 8000, 1)
+
+    assert layout == HeaderLayout(data_offset=58, ds64_offset=None,
+                                  fact_offset=46)
+    assert stream.getvalue() == b'RIFF' + struct.pack('<L', 0) + \
+        b'WAVEfmt ' + \
+        struct.pack('<LHHLLHHH', 18, 3, 1, 8000, 32000, 4, 32, 0) + \
+        b'fact' + struct.pack('<LL', 4, 0) + b'data' + struct.pack('<L', 0)
+
+
+def test_write_header_extensible_rf64():
+    """
+    Test header of extensible RF64 files
+    """
+    stream = io.BytesIO()
+    layout = write_header(stream, StreamHandler(True), 1, 24, 8000, 2,
+                          extensible=True, rf64=True)
+
+    assert layout == HeaderLayout(data_offset=116, ds64_offset=20,
+                                  fact_offset=104)
+    assert stream.getvalue() == b'RF64' + struct.pack('<L', 0xFFFFFFFF) + \
+        b'WAVEds64' + struct.pack('<LQQQL', 28, 0, 0, 0, 0) + b'fmt ' + \
+        struct.pack('<LHHLLHHHHLH', 40, 0xFFFE, 2, 8000, 48000, 6, 24, 22,
+                    24, 0, 1) + SUB_FORMAT_GUID + \
+        b'fact' + struct.pack('<LL', 4, 0) + \
+        b'data' + struct.pack('<L', 0xFFFFFFFF)
+
+
+def test_write_header_rf64_big_endian():
+    """
+    Test exception is raised for big endian RF64 files
+    """
+    with pytest.raises(WaveValueError,
+                       match=esc("RF64 files must be little endian.")):
+        write_header(io.BytesIO(), StreamHandler(False), 1, 16, 8000, 2,
+                     rf64=True)
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('format_tag, extensible, rf64', [
+    (1, False, False), (3, False, False), (1, True, False), (3, False, True)
+])
+def test_update_header(le, format_tag, extensible, rf64):
+    """
+    Test sizes are updated in the header
+    """
+    if rf64 and not le:
+        pytest.skip('RF64 files are little endian.')
+
+    stream = io.BytesIO()
+    stream.write(b'skip')
+    handler = StreamHandler(le)
+    sample_width = 16 if format_tag == 1 else 32
+    layout = write_header(stream, handler, format_tag, sample_width, 8000, 1,
+                          extensible, rf64)
+    data = numpy.arange(5, dtype=numpy.int16 if format_tag == 1
+                        else numpy.float32)
+    write_data(stream, handler, data, sample_width)
+
+    update_header(stream, handler, layout, data.nbytes, 5, start=4)
+    # stream is moved back to the end
+    assert stream.tell() == 4 + layout.data_offset + data.nbytes
+
+    result = wavy.read(stream.getvalue()[4:])
+    assert numpy.array_equal(result.data, data)
+
+    riff_size = layout.data_offset - 8 + data.nbytes
+    if rf64:
+        assert struct.unpack_from('<QQQ', stream.getvalue(),
+                                  4 + layout.ds64_offset) == \
+            (riff_size, data.nbytes, 5)
+    else:
+        assert handler.read('L', stream.getvalue(), 8) == (riff_size,)
+    if layout.fact_offset is not None:
+        assert handler.read('L', stream.getvalue(),
+                            4 + layout.fact_offset) == (5,)
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('dtype', ['<i4', '>i4'])
+def test_pack_24_bit(le, dtype):
+    """
+    Test int32 samples are packed into 3 bytes
+    """
+    values = [0, 1, -1, 2 ** 23 - 1, -2 ** 23, 12345, -54321, 2 ** 24 + 7]
+    data = numpy.array(values, dtype=dtype).reshape(-1, 2)
+    packed = pack_24_bit(data, le)
+
+    assert packed.shape == (4, 2, 3)
+    assert packed.tobytes() == b''.join(
+        (value & 0xFFFFFF).to_bytes(3, 'little' if le else 'big')
+        for value in values)
+
+
+def test_pack_24_bit_out():
+    """
+    Test samples are packed into the given array
+    """
+    data = numpy.arange(-3, 3, dtype=numpy.int32)
+    out = numpy.empty(6, get_packed_24_bit_dtype(True))
+    packed = pack_24_bit(data[::-1], True, out)
+
+    assert numpy.shares_memory(packed, out)
+    assert packed.tobytes() == b''.join(
+        value.to_bytes(3, 'little', signed=True) for value in range(2, -4, -1))
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('shape, block_size, expected_sizes', [
+    ((10,), 12, [12, 12, 6]),
+    ((10, 2), 12, [12] * 5),
+    ((10, 2), 1, [6] * 10),
+    ((0, 2), 12, [])
+])
+def test_iter_packed_24_bit(le, shape, block_size, expected_sizes):
+    """
+    Test samples are packed one block at the time
+    """
+    data = numpy.arange(-10, -10 + numpy.prod(shape), dtype=numpy.int32) \
+        .reshape(shape) * 1001
+    blocks = [block.tobytes() for block in
+              iter_packed_24_bit(data, le, block_size)]
+
+    assert [len(block) for block in blocks] == expected_sizes
+    assert b''.join(blocks) == pack_24_bit(data, le).tobytes()
+
+
+class MockStream(object):
+    """
+    Mock stream that keeps what is written to it.
+    """
+
+    def __init__(self):
+        self.buffers = []
+
+    def write(self, buffer):
+        self.buffers.append(buffer)
+
+
+def test_write_data_zero_copy():
+    """
+    Test data in the byte order of the stream is written without copying
+    """
+    data = numpy.arange(10, dtype='<i2').reshape(-1, 2)
+    stream = MockStream()
+    write_data(stream, StreamHandler(True), data, 16)
+
+    assert len(stream.buffers) == 1
+    assert isinstance(stream.buffers[0], memoryview)
+    assert numpy.shares_memory(numpy.asarray(stream.buffers[0]), data)
+
+
+@pytest.mark.parametrize('le, dtype, sample_width', [
+    (False, '<i2', 16),
+    (True, '>i2', 16),
+    (True, '<i4', 24),
+    (False, '<i4', 24),
+    (True, '<f8', 64)
+])
+def test_write_data_blocks(le, dtype, sample_width, mocker):
+    """
+    Test data that needs converting is written in blocks
+    """
+    mocker.patch('wavy.detail.write.WRITE_BLOCK_SIZE', 16)
+
+    # not contiguous
+    data = numpy.arange(-40, 40).astype(dtype).reshape(-1, 4)[:, ::2]
+    stream = io.BytesIO()
+    write_data(stream, StreamHandler(le), data, sample_width)
+
+    if sample_width == 24:
+        expected = pack_24_bit(data, le).tobytes()
+    else:
+        expected = data.astype(data.dtype.newbyteorder('<' if le else '>')) \
+            .tobytes()
+    assert stream.getvalue() == expected
+
+
+@pytest.mark.parametrize('le', [True, False])
+def test_get_list_chunk_data(le):
+    """
+    Test tags are stored as null terminated strings of even size
+    """
+    prefix = '<' if le else '>'
+    tags = Tags(name='ab', artist='abc')
+    assert get_list_chunk_data(tags, StreamHandler(le)) == \
+        b'INFOINAM' + struct.pack(prefix + 'L', 3) + b'ab\x00\x00' + \
+        b'IART' + struct.pack(prefix + 'L', 4) + b'abc\x00'
+
+
+def test_get_list_chunk_data_empty():
+    """
+    Test no chunk data is returned when all tags are empty
+    """
+    assert get_list_chunk_data(Tags(), StreamHandler(True)) is None
+
+
+def test_write_header_tags():
+    """
+    Test tags are written in a LIST chunk before the data
+    """
+    stream = io.BytesIO()
+    layout = write_header(stream, StreamHandler(True), 1, 16, 8000, 1,
+                          tags=Tags(comment='abc'))
+
+    assert layout.data_offset == 36 + 8 + 16 + 8
+    assert stream.getvalue()[36:] == b'LIST' + struct.pack('<L', 16) + \
+        b'INFOICMT' + struct.pack('<L', 4) + b'abc\x00' + \
+        b'data' + struct.pack('<L', 0)
+
+
+def make_tags_file(chunks, le=True, header=None):
+    """
+    Encode list of (name, data) into a WAVE file.
+    """
+    prefix = '<' if le else '>'
+    content = b''.join(struct.pack(prefix + '4sL', name, len(data)) + data +
+                       b'\x00' * (len(data) % 2) for name, data in chunks)
+    return io.BytesIO((header or (b'RIFF' if le else b'RIFX')) +
+                      struct.pack(prefix + 'L', len(content) + 4) + b'WAVE' +
+                      content)
+
+
+def get_layout(stream, le=True):
+    """
+    Get (id, size) of all chunks and check the RIFF size.
+    """
+    handler = StreamHandler(le)
+    stream.seek(4)
+    assert handler.read('L', stream.read(4))[0] == len(stream.getvalue()) - 8
+    stream.seek(12)
+    return [(chunk.id, chunk.size)
+            for chunk in iter_chunks(stream, handler)]
+
+
+# format is encoded in the test, for 8 bit mono samples
+FMT = (b'fmt ', None)
+DATA = (b'data', b'd' * 11)
+
+
+@pytest.mark.parametrize('le', [True, False])
+@pytest.mark.parametrize('chunks, tags, expected', [
+    # same size
+    ([FMT, (b'LIST', dict(name='ab')), DATA], dict(name='cd'),
+     [(b'fmt ', 16), (b'LIST', 16), (b'data', 11)]),
+    # smaller, rest is filler
+    ([FMT, (b'LIST', dict(name='abcdefghijk')), DATA], dict(name='a'),
+     [(b'fmt ', 16), (b'LIST', 14), (b'JUNK', 2), (b'data', 11)]),
+    # filler around the chunk is used
+    ([FMT, (b'JUNK', b'j' * 10), (b'LIST', dict(name='a')),
+      (b'PAD ', b'p' * 20), DATA], dict(name='a' * 20),
+     [(b'fmt ', 16), (b'LIST', 34), (b'JUNK', 18), (b'data', 11)]),
+    # removed
+    ([FMT, (b'LIST', dict(name='a')), (b'JUNK', b'j' * 2), DATA], None,
+     [(b'fmt ', 16), (b'JUNK', 24), (b'data', 11)]),
+    # too small to fit the tags and a filler chunk
+    ([FMT, (b'LIST', dict(name='a')), DATA], dict(name='abc'),
+     [(b'fmt ', 16), (b'JUNK', 14), (b'data', 11), (b'LIST', 16)]),
+    # no tags
+    ([FMT, DATA], dict(name='a'),
+     [(b'fmt ', 16), (b'data', 11), (b'LIST', 14)]),
+    ([FMT, DATA, (b'JUNK', b'')], None,
+     [(b'fmt ', 16), (b'data', 11), (b'JUNK', 0)]),
+    # tags at the end are rewritten
+    ([FMT, DATA, (b'LIST', dict(name='a'))], dict(name='a' * 20),
+     [(b'fmt ', 16), (b'data', 11), (b'LIST', 34)]),
+    ([FMT, DATA, (b'LIST', dict(name='a' * 20)), (b'JUNK', b'j' * 4)],
+     dict(name='a'),
+     [(b'fmt ', 16), (b'data', 11), (b'LIST', 14)]),
+    ([FMT, DATA, (b'JUNK', b''), (b'LIST', dict(name='a'))], None,
+     [(b'fmt ', 16), (b'data', 11)]),
+    # other LIST chunks are kept
+    ([FMT, (b'LIST', b'adtl'), DATA], dict(name='a'),
+     [(b'fmt ', 16), (b'LIST', 4), (b'data', 11), (b'LIST', 14)])
+])
+def test_write_tags(le, chunks, tags, expected):
+    """
+    Test tags are replaced in place when they fit
+    """
+    handler = StreamHandler(le)
+    fmt = struct.pack(handler.endian_prefix + 'HHLLHH', 1, 1, 8000, 8000, 1,
+                      8)
+    # tags are given as dictionaries
+    stream = make_tags_file([
+        (name, fmt if data is None else
+         get_list_chunk_data(Tags(**data), handler)
+         if isinstance(data, dict) else data) for name, data in chunks], le)
+    tags = Tags(**tags) if tags else None
+
+    write_tags(stream, tags)
+
+    assert get_layout(stream, le) == expected
+    result = wavy.read(stream.getvalue())
+    assert result.tags == tags
+    assert result.data.tobytes() == b'd' * 11
+
+
+def test_write_tags_rf64():
+    """
+    Test RIFF size of RF64 files is updated in the ds64 chunk
+    """
+    stream = io.BytesIO()
+    writer_layout = write_header(stream, StreamHandler(True), 1, 8, 8000, 1,
+                                 rf64=True)
+    write_data(stream, StreamHandler(True), numpy.zeros(11, numpy.uint8), 8)
+    stream.write(b'\x00')
+    update_header(stream, StreamHandler(True), writer_layout, 11, 11)
+    stream.seek(0)
+
+    write_tags(stream, Tags(name='a'))
+
+    assert struct.unpack_from('<L', stream.getvalue(), 4) == (0xFFFFFFFF,)
+    assert struct.unpack_from('<Q', stream.getvalue(), 20) == \
+        (len(stream.getvalue()) - 8,)
+    assert wavy.read(stream.getvalue()).tags == Tags(name='a')
+
+
+def test_write_tags_too_large(mocker):
+    """
+    Test exception is raised if the file would not fit a RIFF file
+    """
+    stream = make_tags_file([(b'data', b'd' * 11)])
+    mocker.patch('wavy.detail.write.MAX_CHUNK_SIZE', 40)
+
+    with pytest.raises(WaveValueError,
+                       match=esc("Tags do not fit in a RIFF file.")):
+        write_tags(stream, Tags(name='a' * 20))
+    # nothing was written
+    assert get_layout(stream) == [(b'data', 11)]
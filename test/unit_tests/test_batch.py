@@ -0,0 +1,24 @@
+import pytest
+import wavy
+import wavy.detail
+
+
+@pytest.mark.parametrize('function, batch_function', [
+    ('read', wavy.read_many),
+    ('info', wavy.info_many)
+])
+def test_batch(function, batch_function, mocker):
+    """
+    Test function behaves as expected
+    """
+    mocker.patch(f"wavy.{function}", side_effect=lambda x, **kwargs: (x, kwargs))
+    map_files = mocker.patch('wavy.detail.map_files',
+                             return_value=iter(['result1', 'result2']))
+
+    assert list(batch_function(['a', 'b'], 3, False, foo='bar')) == \
+        ['result1', 'result2']
+
+    args = map_files.call_args[0]
+    assert args[1:] == (['a', 'b'], 3, False)
+    # function is called with the extra arguments
+    assert args[0]('a') == ('a', {'foo': 'bar'})
@@ -0,0 +1,25 @@
+import contextlib
+import io
+import wavy
+import wavy.detail
+
+
+def test_blocks(mocker):
+    """
+    Test function behaves as expected
+    """
+
+    @contextlib.contextmanager
+    def mock_manager(x, y, z):
+        yield 'stream'
+
+    get_stream_from_file = mocker.patch('wavy.detail.get_stream_from_file',
+                                        side_effect=mock_manager)
+
+    read_blocks = mocker.patch('wavy.detail.read_blocks',
+                               return_value=iter(['block1', 'block2']))
+
+    assert list(wavy.blocks('file', 10, 2, 'out', [1], 'f4')) == ['block1', 'block2']
+
+    get_stream_from_file.assert_called_with('file', 'rb', io.BufferedReader)
+    read_blocks.assert_called_with('stream', 10, 2, 'out', [1], 'f4')
@@ -0,0 +1,28 @@
+import contextlib
+import io
+import wavy
+import wavy.detail
+
+
+def test_chunks(mocker):
+    """
+    Test function behaves as expected
+    """
+    @contextlib.contextmanager
+    def mock_manager(x, y, z):
+        yield 'stream'
+
+    get_stream_from_file = mocker.patch('wavy.detail.get_stream_from_file',
+                                        side_effect=mock_manager)
+
+    prefetch = mocker.patch('wavy.detail.prefetch',
+                            return_value='header_stream')
+
+    read_chunk_table = mocker.patch('wavy.detail.read_chunk_table',
+                                    return_value='chunks')
+
+    assert wavy.chunks('file', 100) == 'chunks'
+
+    get_stream_from_file.assert_called_with('file', 'rb', io.BufferedReader)
+    prefetch.assert_called_with('stream', 100)
+    read_chunk_table.assert_called_with('header_stream')
@@ -0,0 +1,123 @@
+import os
+import pytest
+import wavy
+
+
+def mock_info(file):
+    """
+    Mock info based on the file content.
+    """
+    with open(file, 'rb') as f:
+        content = f.read()
+    if content == b'corrupted':
+        raise wavy.WaveFileIsCorrupted('Corrupted.')
+    return wavy.WaveFileInfo(sample_width=16, framerate=len(content),
+                             n_channels=1, n_frames=1, tags=None)
+
+
+@pytest.fixture
+def info(mocker):
+    return mocker.patch('wavy.info', side_effect=mock_info)
+
+
+def write(path, content, mtime_ns=None):
+    path.write_bytes(content)
+    if mtime_ns:
+        os.utime(str(path), ns=(mtime_ns, mtime_ns))
+
+
+def test_index_info(info, tmp_path):
+    """
+    Test info is cached until the file changes
+    """
+    file = tmp_path / 'a.wav'
+    write(file, b'1', 10 ** 9)
+
+    with wavy.Index(str(tmp_path / 'index.db')) as index:
+        assert index.info(str(file)).framerate == 1
+        assert index.info(str(file)).framerate == 1
+        assert info.call_count == 1
+
+        # same size, different modification time
+        write(file, b'2', 2 * 10 ** 9)
+        assert index.info(str(file)).framerate == 1
+        assert info.call_count == 2
+
+        # different size
+        write(file, b'22', 2 * 10 ** 9)
+        assert index.info(str(file)).framerate == 2
+        assert info.call_count == 3
+
+    # index persists
+    with wavy.Index(str(tmp_path / 'index.db')) as index:
+        assert index.info(str(file)).framerate == 2
+        assert info.call_count == 3
+
+
+def test_index_info_errors(info, tmp_path):
+    """
+    Test errors are raised and not cached
+    """
+    file = tmp_path / 'a.wav'
+    write(file, b'corrupted')
+
+    with wavy.Index(str(tmp_path / 'index.db')) as index:
+        with pytest.raises(FileNotFoundError):
+            index.info(str(tmp_path / 'missing.wav'))
+        for _ in range(2):
+            with pytest.raises(wavy.WaveFileIsCorrupted):
+                index.info(str(file))
+        assert info.call_count == 2
+
+
+def test_index_refresh(info, tmp_path):
+    """
+    Test refresh only parses new or changed files
+    """
+    folder = tmp_path / 'folder'
+    folder.mkdir()
+    for name in ['a.wav', 'b.wav', 'c.wav']:
+        write(folder / name, b'1')
+
+    with wavy.Index(str(tmp_path / 'index.db')) as index:
+        assert index.refresh(str(folder), workers=2) == []
+        assert info.call_count == 3
+
+        # warm refresh
+        assert index.refresh(str(folder)) == []
+        assert info.call_count == 3
+
+        # change, remove and corrupt files
+        write(folder / 'a.wav', b'11')
+        os.remove(str(folder / 'b.wav'))
+        write(folder / 'c.wav', b'corrupted')
+        errors = index.refresh(str(folder))
+        assert info.call_count == 5
+        assert [error.file for error in errors] == [str(folder / 'c.wav')]
+
+        entries = index._connection.execute(
+            wavy.detail.SELECT_INDEX_ENTRIES).fetchall()
+        assert [entry[0] for entry in entries] == \
+            [os.path.abspath(str(folder / 'a.wav'))]
+
+        # info for refreshed files is cached
+        assert index.info(str(folder / 'a.wav')).framerate == 2
+        assert info.call_count == 5
+
+
+def test_index_refresh_other_directory(info, tmp_path):
+    """
+    Test refresh keeps entries for files in other directories
+    """
+    for name in ['folder', 'folder2']:
+        (tmp_path / name).mkdir()
+        write(tmp_path / name / 'a.wav', b'1')
+
+    with wavy.Index(str(tmp_path / 'index.db')) as index:
+        index.refresh(str(tmp_path / 'folder'))
+        index.refresh(str(tmp_path / 'folder2'))
+        index.refresh(str(tmp_path / 'folder'))
+
+        assert len(index._connection.execute(
+            wavy.detail.SELECT_INDEX_ENTRIES).fetchall()) == 2
+        assert info.call_count == 2
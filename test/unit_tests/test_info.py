@@ -21,6 +21,9 @@ def test_read(mocker):
     get_stream_from_file = mocker.patch('wavy.detail.get_stream_from_file',
                                         side_effect=mock_manager)
 
+    prefetch = mocker.patch('wavy.detail.prefetch',
+                            return_value='header_stream')
+
     read_stream = mocker.patch('wavy.detail.read_stream',
                                return_value=(format, 'tags', 10))
 
@@ -28,7 +31,11 @@ def test_read(mocker):
                                                   framerate=2,
                                                   n_channels=3,
                                                   n_frames=10,
-                                                  tags='tags')
+                                                  tags='tags',
+                                                  bext=None,
+                                                  ixml=None)
 
     get_stream_from_file.assert_called_with('file', 'rb', io.BufferedReader)
-    read_stream.assert_called_with('stream', read_data=False)
+    prefetch.assert_called_with('stream', wavy.detail.HEADER_BUFFER_SIZE)
+    read_stream.assert_called_with('header_stream', read_data=False,
+                                   metadata={})
@@ -0,0 +1,70 @@
+import contextlib
+import io
+import pytest
+import wavy
+import wavy.detail
+
+
+@pytest.fixture
+def read_peaks(mocker):
+    @contextlib.contextmanager
+    def mock_manager(x, y, z):
+        yield 'stream'
+
+    mocker.patch('wavy.detail.get_stream_from_file', side_effect=mock_manager)
+    return mocker.patch('wavy.detail.read_peaks',
+                        return_value=('min', 'max', 'rms'))
+
+
+def test_peaks(read_peaks, mocker):
+    """
+    Test function behaves as expected
+    """
+    stat = mocker.patch('os.stat')
+
+    assert wavy.peaks('file', 10) == wavy.Peaks('min', 'max', 'rms')
+
+    read_peaks.assert_called_with('stream', 10)
+    stat.assert_not_called()
+
+
+@pytest.mark.parametrize('cache, cache_path', [
+    (True, 'file.peaks'),
+    ('other.peaks', 'other.peaks')
+])
+def test_peaks_cache(cache, cache_path, read_peaks, mocker):
+    """
+    Test peaks are computed and stored if not in the cache
+    """
+    mocker.patch('os.stat', return_value='stat')
+    load_peaks = mocker.patch('wavy.detail.load_peaks', return_value=None)
+    save_peaks = mocker.patch('wavy.detail.save_peaks')
+
+    assert wavy.peaks('file', 10, cache) == wavy.Peaks('min', 'max', 'rms')
+
+    load_peaks.assert_called_with(cache_path, 10, 'stat')
+    read_peaks.assert_called_with('stream', 10)
+    save_peaks.assert_called_with(cache_path, 10, 'stat',
+                                  ('min', 'max', 'rms'))
+
+
+def test_peaks_cached(read_peaks, mocker):
+    """
+    Test cached peaks are returned without reading the file
+    """
+    mocker.patch('os.stat', return_value='stat')
+    mocker.patch('wavy.detail.load_peaks', return_value=('a', 'b', 'c'))
+    save_peaks = mocker.patch('wavy.detail.save_peaks')
+
+    assert wavy.peaks('file', 10, True) == wavy.Peaks('a', 'b', 'c')
+
+    read_peaks.assert_not_called()
+    save_peaks.assert_not_called()
+
+
+def test_peaks_cache_not_path():
+    """
+    Test only peaks of files on disk can be cached
+    """
+    with pytest.raises(wavy.WaveValueError):
+        wavy.peaks(io.BytesIO(), 10, cache=True)
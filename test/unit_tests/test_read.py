@@ -1,5 +1,6 @@
 import contextlib
 import io
+import pytest
 import wavy
 import wavy.detail
 
@@ -27,8 +28,58 @@ def test_read(mocker):
     wavy.read('file')
 
     get_stream_from_file.assert_called_with('file', 'rb', io.BufferedReader)
-    read_stream.assert_called_with('stream')
+    read_stream.assert_called_with('stream', mmap=False, start=None,
+                                   stop=None, in_seconds=False, lazy=False,
+                                   channels=None, dtype=None, workers=None)
     wavy.WaveFile.__init__.assert_called_with(sample_width=1,
                                               framerate=2,
                                               data='data',
                                               tags='tags')
+
+
+def test_read_lazy(mocker):
+    """
+    Test function returns lazy file
+    """
+    format = mocker.MagicMock()
+    format.wBitsPerSample = 16
+    format.nSamplesPerSec = 2
+    format.nChannels = 3
+
+    @contextlib.contextmanager
+    def mock_manager(x, y, z):
+        yield 'stream'
+
+    mocker.patch('wavy.detail.get_stream_from_file', side_effect=mock_manager)
+
+    data_range = wavy.detail.DataRange(chunk='chunk', handler='handler',
+                                       start=2, stop=7, mmap=False,
+                                       channels=None, dtype=None, workers=None)
+
+    read_stream = mocker.patch('wavy.detail.read_stream',
+                               return_value=(format, None, data_range))
+
+    read_file_data_range = mocker.patch('wavy.detail.read_file_data_range',
+                                        return_value='data')
+
+    result = wavy.read('file', lazy=True)
+
+    read_stream.assert_called_with('stream', mmap=False, start=None,
+                                   stop=None, in_seconds=False, lazy=True,
+                                   channels=None, dtype=None, workers=None)
+
+    assert isinstance(result, wavy.LazyWaveFile)
+    assert result.n_channels == 3
+    assert result.n_frames == 5
+    read_file_data_range.assert_not_called()
+
+    assert result.data == 'data'
+    read_file_data_range.assert_called_with('file', format, data_range)
+
+
+def test_read_lazy_stream():
+    """
+    Test lazy reading is not supported for streams
+    """
+    with pytest.raises(wavy.WaveValueError, match="lazy reading"):
+        wavy.read(io.BytesIO(), lazy=True)
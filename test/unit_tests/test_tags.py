@@ -0,0 +1,45 @@
+import io
+import numpy
+import pytest
+import wavy
+from re import escape as esc
+
+
+def make_file(tags=None):
+    stream = io.BytesIO()
+    wavy.write(stream, wavy.WaveFile(16, 8000, numpy.zeros(5, numpy.int16),
+                                     tags))
+    return stream.getvalue()
+
+
+def test_update_tags_fail():
+    """
+    Test exception is raised if tags are not valid
+    """
+    with pytest.raises(wavy.WaveValueError, match=esc(
+            "Argument 'tags' must be of type 'wavy.Tags'.")):
+        wavy.update_tags(io.BytesIO(), 'tags')
+
+
+def test_update_tags_path(tmp_path):
+    """
+    Test tags of a file are updated and the file is closed
+    """
+    file_path = tmp_path / 'test.wav'
+    file_path.write_bytes(make_file(wavy.Tags(name='a')))
+
+    wavy.update_tags(str(file_path), wavy.Tags(name='b'))
+    assert wavy.info(str(file_path)).tags == wavy.Tags(name='b')
+
+
+def test_update_tags_stream(tmp_path):
+    """
+    Test streams passed by the user are not closed
+    """
+    file_path = tmp_path / 'test.wav'
+    file_path.write_bytes(make_file())
+
+    with open(str(file_path), 'r+b') as file:
+        wavy.update_tags(file, wavy.Tags(name='b'))
+        assert not file.closed
+    assert wavy.info(str(file_path)).tags == wavy.Tags(name='b')
@@ -41,3 +41,45 @@ def test_wave_file_invalid_args(sample_width, data, tags, error):
     """
     with pytest.raises(wavy.WaveValueError, match=esc(error)):
         WaveFile(sample_width, 100, data, tags)
+
+
+def test_lazy_wave_file(mocker):
+    """
+    Test that LazyWaveFile reads data on first access.
+    """
+    data = numpy.array([1, 2, 3, 4], dtype=numpy.int16).reshape(-1, 2)
+    read_data = mocker.MagicMock(return_value=data)
+
+    wav_file = LazyWaveFile(16, 100, 2, 2, read_data, Tags())
+
+    assert wav_file.sample_width == 16
+    assert wav_file.framerate == 100
+    assert wav_file.n_channels == 2
+    assert wav_file.n_frames == 2
+    assert wav_file.tags == Tags()
+    assert not wav_file.is_loaded
+    read_data.assert_not_called()
+
+    # data is read once
+    assert wav_file.data is data
+    assert wav_file.data is data
+    assert wav_file.is_loaded
+    assert read_data.call_count == 1
+
+    # data is read again after release
+    wav_file.release()
+    assert not wav_file.is_loaded
+    assert wav_file.data is data
+    assert read_data.call_count == 2
+
+
+@pytest.mark.parametrize('n_frames, tags, expected_msg', [
+    (0, None, "Data array cannot be empty."),
+    (1, 'tags', "Argument 'tags' must be of type 'wavy.Tags'."),
+])
+def test_lazy_wave_file_fail(n_frames, tags, expected_msg):
+    """
+    Test that LazyWaveFile raises exceptions for invalid arguments.
+    """
+    with pytest.raises(WaveValueError, match=esc(expected_msg)):
+        LazyWaveFile(16, 100, 1, n_frames, lambda: None, tags)
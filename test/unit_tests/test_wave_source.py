@@ -0,0 +1,124 @@
+import io
+import numpy
+import os
+import pytest
+import wavy
+from re import escape as esc
+
+
+def make_file(data, sample_width=16, tags=None):
+    stream = io.BytesIO()
+    wavy.write(stream, wavy.WaveFile(sample_width, 8000, data, tags))
+    return stream.getvalue()
+
+
+def test_wave_source_properties():
+    """
+    Test properties of the source
+    """
+    tags = wavy.Tags(name='name')
+    data = numpy.zeros((5, 2), numpy.int16)
+    with wavy.WaveSource(make_file(data, tags=tags)) as source:
+        assert source.sample_width == 16
+        assert source.framerate == 8000
+        assert source.n_channels == 2
+        assert source.n_frames == 5
+        assert source.tags == tags
+        assert not source.closed
+        assert str(source) == "WaveSource(sample_width=16, framerate=8000, " \
+                              "n_channels=2, n_frames=5)"
+    assert source.closed
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    (dict(), slice(None)),
+    (dict(start=2, stop=-1), slice(2, -1)),
+    (dict(start=1 / 8000, stop=3 / 8000, in_seconds=True), slice(1, 3)),
+    (dict(stop=100), slice(None))
+])
+def test_wave_source_read_frames(kwargs, expected):
+    """
+    Test ranges of frames are read
+    """
+    data = numpy.arange(20, dtype=numpy.int16).reshape(-1, 2)
+    with wavy.WaveSource(make_file(data)) as source:
+        assert numpy.array_equal(source.read_frames(**kwargs), data[expected])
+        # reading again gives the same frames
+        assert numpy.array_equal(source.read_frames(**kwargs), data[expected])
+
+
+def test_wave_source_read_frames_convert():
+    """
+    Test channels and dtype are passed on
+    """
+    data = numpy.arange(20, dtype=numpy.int16).reshape(-1, 2)
+    with wavy.WaveSource(make_file(data)) as source:
+        assert numpy.array_equal(source.read_frames(channels=[1]), data[:, 1])
+        assert numpy.array_equal(source.read_frames(dtype='float32'),
+                                 data / 2 ** 15)
+
+
+@pytest.mark.parametrize('kwargs, expected_msg', [
+    (dict(channels=[2]), "Argument 'channels' must be a list of channel "
+                         "indexes lower than 2."),
+    (dict(dtype='int8'), "Argument 'dtype' must be one of float32, float64, "
+                         "int16."),
+    (dict(start='a'), "Arguments 'start' and 'stop' must be integers or "
+                      "None.")
+])
+def test_wave_source_read_frames_fail(kwargs, expected_msg):
+    """
+    Test exception is raised for invalid arguments
+    """
+    data = numpy.zeros((5, 2), numpy.int16)
+    with wavy.WaveSource(make_file(data)) as source:
+        with pytest.raises(wavy.WaveValueError, match=esc(expected_msg)):
+            source.read_frames(**kwargs)
+
+
+def test_wave_source_closed():
+    """
+    Test exception is raised when reading from a closed source
+    """
+    source = wavy.WaveSource(make_file(numpy.zeros(5, numpy.int16)))
+    source.close()
+    source.close()
+    with pytest.raises(wavy.WaveValueError,
+                       match=esc("Cannot read from a closed source.")):
+        source.read_frames()
+
+
+def test_wave_source_corrupted():
+    """
+    Test exception is raised for files that cannot be parsed
+    """
+    content = make_file(numpy.zeros(5, numpy.int16))[:30]
+    with pytest.raises(wavy.WaveFileIsCorrupted):
+        wavy.WaveSource(content)
+
+
+@pytest.mark.parametrize('pread', [True, False])
+def test_wave_source_file(pread, tmp_path, mocker, monkeypatch):
+    """
+    Test files on disk are read with positional reads where supported and
+    streams passed by the user are not closed
+    """
+    if not pread:
+        monkeypatch.delattr(os, 'pread', raising=False)
+
+    file_path = tmp_path / 'test.wav'
+    data = numpy.arange(10, dtype=numpy.int16)
+    file_path.write_bytes(make_file(data))
+    positional_stream = mocker.spy(wavy.detail, 'PositionalStream')
+
+    with open(str(file_path), 'rb') as file:
+        with wavy.WaveSource(file) as source:
+            assert numpy.array_equal(source.read_frames(2, 4), data[2:4])
+        assert not file.closed
+    # platforms without os.pread (e.g. Windows) read under a lock instead
+    assert positional_stream.call_count == int(hasattr(os, 'pread'))
+
+    with wavy.WaveSource(str(file_path)) as source:
+        stream = source._stream
+        assert numpy.array_equal(source.read_frames(), data)
+    assert stream.closed
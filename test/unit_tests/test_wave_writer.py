@@ -0,0 +1,135 @@
+import io
+import numpy
+import pytest
+import wavy
+from re import escape as esc
+
+
+@pytest.mark.parametrize('kwargs, expected_msg', [
+    (dict(format='foo'), "Argument 'format' must be one of pcm, float."),
+    (dict(sample_width=12), "Sample width '12' is not supported for format "
+                            "'pcm'."),
+    (dict(n_channels=0), "Argument 'n_channels' must be positive."),
+    (dict(flush_every=0), "Argument 'flush_every' must be positive."),
+    (dict(little_endian=False, rf64=True), "RF64 files must be little "
+                                           "endian.")
+])
+def test_wave_writer_fail(kwargs, expected_msg):
+    """
+    Test exception is raised for invalid arguments
+    """
+    args = dict(sample_width=16, framerate=8000, n_channels=2)
+    args.update(kwargs)
+    with pytest.raises(wavy.WaveValueError, match=esc(expected_msg)):
+        wavy.WaveWriter(io.BytesIO(), **args)
+
+
+def test_wave_writer_properties():
+    """
+    Test properties of the writer
+    """
+    with wavy.WaveWriter(io.BytesIO(), 16, 8000, 2) as writer:
+        writer.write(numpy.zeros((5, 2), numpy.int16))
+        writer.write(numpy.zeros((3, 2), numpy.int16))
+        assert writer.sample_width == 16
+        assert writer.framerate == 8000
+        assert writer.n_channels == 2
+        assert writer.n_frames == 8
+        assert not writer.closed
+        assert str(writer) == "WaveWriter(sample_width=16, framerate=8000, " \
+                              "n_channels=2, n_frames=8)"
+    assert writer.closed
+
+
+def test_wave_writer_closed():
+    """
+    Test exception is raised when writing to a closed writer
+    """
+    writer = wavy.WaveWriter(io.BytesIO(), 16, 8000, 1)
+    writer.close()
+    # closing twice does nothing
+    writer.close()
+    with pytest.raises(wavy.WaveValueError,
+                       match=esc("Cannot write to a closed writer.")):
+        writer.write(numpy.zeros(5, numpy.int16))
+
+
+def test_wave_writer_invalid_data():
+    """
+    Test exception is raised for data that does not match the file
+    """
+    with wavy.WaveWriter(io.BytesIO(), 16, 8000, 2) as writer:
+        with pytest.raises(wavy.WaveValueError, match=esc(
+                "Argument 'data' must be of shape (n_frames, 2).")):
+            writer.write(numpy.zeros(5, numpy.int16))
+        assert writer.n_frames == 0
+
+
+def test_wave_writer_stream():
+    """
+    Test streams passed by the user are not closed
+    """
+    stream = io.BytesIO()
+    stream.write(b'skip')
+    data = numpy.arange(10, dtype=numpy.int16)
+    with wavy.WaveWriter(stream, 16, 8000, 1) as writer:
+        writer.write(data)
+    assert not stream.closed
+    assert numpy.array_equal(wavy.read(stream.getvalue()[4:]).data, data)
+
+
+def test_wave_writer_path(tmp_path):
+    """
+    Test files opened from a path are closed
+    """
+    file_path = str(tmp_path / 'test.wav')
+    data = numpy.arange(10, dtype=numpy.int16)
+    with wavy.WaveWriter(file_path, 16, 8000, 1) as writer:
+        writer.write(data)
+    assert writer.closed
+    assert numpy.array_equal(wavy.read(file_path).data, data)
+
+
+def test_wave_writer_padding():
+    """
+    Test data with an odd size is padded
+    """
+    stream = io.BytesIO()
+    data = numpy.arange(5, dtype=numpy.uint8)
+    with wavy.WaveWriter(stream, 8, 8000, 1) as writer:
+        writer.write(data)
+    assert len(stream.getvalue()) == 44 + 6
+    assert numpy.array_equal(wavy.read(stream.getvalue()).data, data)
+
+
+def test_wave_writer_flush_every():
+    """
+    Test the header is updated while writing
+    """
+    stream = io.BytesIO()
+    data = numpy.arange(10, dtype=numpy.int16)
+    writer = wavy.WaveWriter(stream, 16, 8000, 1, flush_every=8)
+
+    writer.write(data[:5])
+    assert wavy.info(stream.getvalue()).n_frames == 0
+
+    writer.write(data[5:])
+    assert numpy.array_equal(wavy.read(stream.getvalue()).data, data)
+    writer.close()
+
+
+def test_wave_writer_too_large(mocker):
+    """
+    Test exception is raised when the data does not fit in a RIFF file
+    """
+    mocker.patch('wavy.detail.MAX_CHUNK_SIZE', 64)
+
+    with wavy.WaveWriter(io.BytesIO(), 16, 8000, 1) as writer:
+        writer.write(numpy.zeros(10, numpy.int16))
+        with pytest.raises(wavy.WaveValueError, match=esc(
+                "Data is too large for a RIFF file, use rf64=True instead.")):
+            writer.write(numpy.zeros(1, numpy.int16))
+        assert writer.n_frames == 10
+
+    with wavy.WaveWriter(io.BytesIO(), 16, 8000, 1, rf64=True) as writer:
+        writer.write(numpy.zeros(20, numpy.int16))
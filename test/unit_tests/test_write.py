@@ -0,0 +1,37 @@
+import io
+import numpy
+import pytest
+import wavy
+from re import escape as esc
+
+
+def test_write_fail():
+    """
+    Test exception is raised if the argument is not a WaveFile
+    """
+    with pytest.raises(wavy.WaveValueError, match=esc(
+            "Argument 'wave_file' must be of type 'wavy.WaveFile'.")):
+        wavy.write(io.BytesIO(), numpy.zeros(10, numpy.int16))
+
+
+@pytest.mark.parametrize('sample_width, dtype, format', [
+    (8, numpy.uint8, 'pcm'), (24, numpy.int32, 'pcm'),
+    (32, numpy.float32, 'float'), (64, numpy.float64, 'float')
+])
+def test_write(sample_width, dtype, format, mocker):
+    """
+    Test the format is chosen from the data dtype
+    """
+    writer = mocker.patch('wavy.WaveWriter')
+    file = io.BytesIO()
+    tags = wavy.Tags(name='name')
+    wave_file = wavy.WaveFile(sample_width, 8000, numpy.zeros((5, 2), dtype),
+                              tags)
+
+    wavy.write(file, wave_file, little_endian=False)
+
+    writer.assert_called_once_with(file, sample_width, 8000, 2, format=format,
+                                   extensible=False, little_endian=False,
+                                   rf64=False, tags=tags)
+    writer.return_value.__enter__.return_value.write.assert_called_once_with(
+        wave_file.data)
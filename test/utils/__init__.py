@@ -1 +1,3 @@
 from .get_audio_files import *
+from .create_audio_file import *
+from .mock_pipe import *
@@ -0,0 +1,90 @@
+import numpy
+import struct
+
+
+def create_wave_file(file_path, data, sample_width, framerate=8000,
+                     little_endian=True, header=None):
+    """
+    Write data to a simple WAVE file for tests.
+
+    Args:
+        file_path: Where to write the file.
+        data: Data array, either one dimensional or (n_frames, n_channels).
+        sample_width: Sample width in bits.
+        framerate: Sampling frequency in Hz.
+        little_endian: Whether to write a RIFF (True) or RIFX (False) file.
+        header: Master chunk id of 64 bit files (b'RF64' or b'BW64'), whose
+            sizes are written in a ds64 chunk.
+
+    """
+    prefix = '<' if little_endian else '>'
+    n_channels = 1 if data.ndim == 1 else data.shape[1]
+    block_align = sample_width // 8 * n_channels
+    format_tag = 3 if data.dtype.kind == 'f' else 1
+
+    if sample_width == 24:
+        # keep the three least significant bytes of each int
+        raw = data.astype(prefix + 'i4').view(numpy.uint8).reshape(-1, 4)
+        raw = raw[:, :3] if little_endian else raw[:, 1:]
+    else:
+        raw = data.astype(data.dtype.newbyteorder(prefix))
+    raw = raw.tobytes()
+
+    with open(file_path, 'wb') as file:
+        write_header(file, len(raw), n_channels, sample_width, framerate,
+                     format_tag, little_endian, header)
+        file.write(raw)
+
+
+def write_header(file, size, n_channels, sample_width, framerate, format_tag,
+                 little_endian=True, header=None):
+    """
+    Write the chunks of a simple WAVE file up to the data.
+    """
+    prefix = '<' if little_endian else '>'
+    block_align = sample_width // 8 * n_channels
+
+    if header:
+        # 64 bit sizes are in the ds64 chunk
+        file.write(header)
+        file.write(struct.pack('<L', 0xFFFFFFFF))
+        file.write(b'WAVE')
+        file.write(b'ds64')
+        file.write(struct.pack('<LQQQL', 28, 72 + size, size,
+                               size // block_align, 0))
+    else:
+        file.write(b'RIFF' if little_endian else b'RIFX')
+        file.write(struct.pack(prefix + 'L', 36 + size))
+        file.write(b'WAVE')
+    file.write(b'fmt ')
+    file.write(struct.pack(prefix + 'LHHLLHH', 16, format_tag, n_channels,
+                           framerate, framerate * block_align,
+                           block_align, sample_width))
+    file.write(b'data')
+    file.write(struct.pack(prefix + 'L', 0xFFFFFFFF if header else size))
+
+
+def create_sparse_wave_file(file_path, n_frames, tail, sample_width,
+                            framerate=8000, header=b'RF64'):
+    """
+    Write a large 64 bit WAVE file for tests. Only the last frames are
+    written, the data before them is a hole of the file (read as zeros).
+
+    Args:
+        file_path: Where to write the file.
+        n_frames: Number of frames in the file.
+        tail: Data array of the last frames, of shape (n_tail, n_channels).
+        sample_width: Sample width in bits (not 24).
+        framerate: Sampling frequency in Hz.
+        header: Master chunk id (b'RF64' or b'BW64').
+
+    """
+    block_align = sample_width // 8 * tail.shape[1]
+    size = n_frames * block_align
+    format_tag = 3 if tail.dtype.kind == 'f' else 1
+
+    with open(file_path, 'wb') as file:
+        write_header(file, size, tail.shape[1], sample_width, framerate,
+                     format_tag, header=header)
+        file.seek(size - tail.nbytes, 1)
+        file.write(tail.astype(tail.dtype.newbyteorder('<')).tobytes())
@@ -9,6 +9,19 @@ AUDIO_FILES_FOLDER = 'test/integration/data'
 # extract info from file name
 AUDIO_FILES_REGEX = r"(\d+)bit_(\d+)Hz_(\d+)ch_(\d+)fr_([a-z]+)"
 
+# files whose tags are after the data, by number of frames
+TAGS_AFTER_DATA = [23493]
+
+# creation time of files with tags after the data, by sample width and format
+CREATION_TIMES = {
+    (8, 'pcm'): '03:28:45', (8, 'pcm_ext'): '03:28:45',
+    (16, 'pcm'): '03:28:46', (16, 'pcm_ext'): '03:28:47',
+    (24, 'pcm'): '03:28:47', (24, 'pcm_ext'): '03:28:48',
+    (32, 'pcm'): '03:28:48', (32, 'pcm_ext'): '03:28:48',
+    (32, 'float'): '03:28:49', (32, 'float_ext'): '03:28:49',
+    (64, 'float'): '03:28:50', (64, 'float_ext'): '03:28:50'
+}
+
 # identify files by number of frames
 TAGS = {
     # file used for testing in cpython builtin.wave module
@@ -17,7 +30,8 @@ TAGS = {
                software='', engineer='', technician='',
                creation_date='2013', genre='', copyright=''),
     # sample from http://www-mmsp.ece.mcgill.ca/Documents/AudioFormats/WAVE/Samples.html M1F1 file
-    23493: None
+    # (tags are in a LIST chunk after the data, creation date is per file)
+    23493: Tags(comment='kabal@CAPELLA', software='CopyAudio')
 }
 
 
@@ -39,6 +53,14 @@ class TestAudioFile(object):
 
         self.tags = TAGS[self.n_frames]
 
+        # tags after the data are not found in streams that cannot seek
+        self.tags_after_data = self.n_frames in TAGS_AFTER_DATA
+        if self.tags_after_data:
+            kind = os.path.basename(file_path)[:-4].split('fr_')[1]
+            self.tags = self.tags._replace(
+                creation_date='2003-01-30 {} UTC'.format(
+                    CREATION_TIMES[self.sample_width, kind]))
+
         # work out dtype for data
         if dtype == 'pcm':
             if self.sample_width == 8:
@@ -46,8 +68,8 @@ class TestAudioFile(object):
             elif self.sample_width == 24:
                 self.dtype = 'i4'
                 # when converting to this one to extensible sox removed
-                # the tag
-                if '_ext' in self.file_path:
+                # the tag (but not the one after the data)
+                if '_ext' in self.file_path and not self.tags_after_data:
                     self.tags = None
             else:
                 self.dtype = 'i{}'.format(self.sample_width // 8)
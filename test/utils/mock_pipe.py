@@ -0,0 +1,16 @@
+import io
+
+
+class MockPipe(io.RawIOBase):
+    """
+    Raw stream that cannot seek.
+    """
+
+    def __init__(self, data):
+        self.stream = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self.stream.readinto(buffer)
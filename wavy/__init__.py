@@ -3,10 +3,19 @@ A pure python module for working with WAVE files with support for all common fil
 """
 
 from .exceptions import *
+from .batch import *
+from .blocks import *
+from .chunks import *
+from .index import *
 from .info import *
+from .peaks import *
 from .read import *
+from .regions import *
 from .tags import *
 from .wave_file import *
+from .wave_source import *
+from .wave_writer import *
+from .write import *
 
 from ._version import get_versions
 
@@ -0,0 +1,75 @@
+import collections
+import functools
+import wavy
+import wavy.detail
+
+BatchResult = collections.namedtuple('BatchResult', [
+    'file',
+    'result',
+    'error'
+])
+"""
+Named tuple that represents the result for one file of a batch.
+
+Attributes:
+    file: The file, as passed to the batch function.
+    result: The result for the file (None if it failed).
+    error (Exception): The error raised for the file (None if it succeeded).
+"""
+
+
+def read_many(files, workers=None, ordered=True, **kwargs):
+    """
+    Read many audio files in parallel using a pool of threads. Errors for a
+    file (corrupted or not supported files, I/O errors or any other error)
+    are returned with the results and do not stop the batch, invalid
+    arguments are raised before any file is read.
+
+    Args:
+        files (iterable): Files to read, of any type accepted by wavy.read.
+        workers (int): Number of threads, None for the default.
+        ordered (bool): If True, results are returned in the same order as
+            files. Otherwise, they are returned as soon as they are ready.
+        **kwargs: Optional arguments for wavy.read.
+
+    Yields:
+        BatchResult: The WaveFile (or error) for each file.
+
+    Raises:
+        TypeError: If an argument is not accepted by wavy.read.
+        WaveValueError: If an argument is not valid whatever the file, or
+            workers is not positive.
+
+    """
+    # mistakes in the arguments are raised once, not for every file
+    wavy.detail.check_read_arguments(kwargs)
+    yield from wavy.detail.map_files(functools.partial(wavy.read, **kwargs),
+                                     files, workers, ordered)
+
+
+def info_many(files, workers=None, ordered=True, **kwargs):
+    """
+    Read information about many audio files in parallel using a pool of
+    threads. Errors for a file (corrupted or not supported files, I/O errors
+    or any other error) are returned with the results and do not stop the
+    batch, invalid arguments are raised before any file is read.
+
+    Args:
+        files (iterable): Files to read, of any type accepted by wavy.info.
+        workers (int): Number of threads, None for the default.
+        ordered (bool): If True, results are returned in the same order as
+            files. Otherwise, they are returned as soon as they are ready.
+        **kwargs: Optional arguments for wavy.info.
+
+    Yields:
+        BatchResult: The WaveFileInfo (or error) for each file.
+
+    Raises:
+        TypeError: If an argument is not accepted by wavy.info.
+        WaveValueError: If workers is not positive.
+
+    """
+    # mistakes in the arguments are raised once, not for every file
+    wavy.detail.check_arguments(wavy.info, kwargs)
+    yield from wavy.detail.map_files(functools.partial(wavy.info, **kwargs),
+                                     files, workers, ordered)
@@ -0,0 +1,36 @@
+import io
+import wavy
+import wavy.detail
+
+
+def blocks(file, blocksize, overlap=0, out=None, channels=None,
+           dtype=None):
+    """
+    Read the audio file one block at the time, only one block is kept in
+    memory so files of any length can be processed.
+
+    Args:
+        file (str or File): Either the path to the file or an instance of File.
+        blocksize (int): Number of frames in each block.
+        overlap (int): Number of frames shared by consecutive blocks.
+        out (numpy.ndarray): Array where to store each block. If given, the
+            same array is yielded for every block, otherwise a new array is
+            created for each one. The shape must match the yielded blocks.
+        channels (list): Indexes of the channels to read, only these channels
+            are decoded and stored. Negative values count from the last
+            channel. If None, all channels are read.
+        dtype (str or numpy.dtype): If given ('float32', 'float64' or
+            'int16'), samples are converted while they are read, as for
+            wavy.read.
+
+    Yields:
+        numpy.ndarray: Block of audio data of shape (blocksize, n_channels), or
+            one dimensional if the number of (selected) channels is one. The last block is
+            padded with zeros.
+
+    """
+    # get buffer reader, already opened for us
+    with wavy.detail.get_stream_from_file(file, 'rb', io.BufferedReader) as \
+            stream:
+        yield from wavy.detail.read_blocks(stream, blocksize, overlap, out,
+                                           channels, dtype)
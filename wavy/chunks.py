@@ -0,0 +1,30 @@
+import io
+import wavy.detail
+
+ChunkInfo = wavy.detail.ChunkInfo
+
+
+def chunks(file, buffer_size=wavy.detail.HEADER_BUFFER_SIZE):
+    """
+    Returns the layout of the audio file, without reading the data of any
+    chunk.
+
+    Args:
+        file (str, File or bytes-like): Either the path to the file, an
+            instance of File or an in-memory file (bytes, bytearray,
+            memoryview or mmap), which is read without copying.
+        buffer_size (int): Number of bytes fetched with the first read. Chunks
+            past them are found by seeking, so only their headers are read.
+
+    Returns:
+        list: ChunkInfo (id, offset and size of the data) for every top-level
+        chunk in the file, in order (up to the data chunk for streams that
+        cannot seek).
+
+    """
+    # get buffer reader, already opened for us
+    with wavy.detail.get_stream_from_file(file, 'rb', io.BufferedReader) as \
+            stream:
+        # fetch the header with a single read
+        header_stream = wavy.detail.prefetch(stream, buffer_size)
+        return wavy.detail.read_chunk_table(header_stream)
@@ -1,3 +1,12 @@
+from .batch import *
 from .common import *
+from .chunks import *
+from .forward_stream import *
+from .index import *
+from .memory_stream import *
+from .peaks import *
+from .positional_stream import *
+from .prefetch_stream import *
 from .read import *
 from .stream_handler import *
+from .write import *
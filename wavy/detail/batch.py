@@ -0,0 +1,111 @@
+import collections
+import concurrent.futures
+import inspect
+import itertools
+import os
+import wavy
+
+# number of files submitted per worker ahead of the results being consumed
+N_PENDING_PER_WORKER = 2
+
+
+def get_n_workers(workers):
+    """
+    Get the number of workers to use.
+
+    Args:
+        workers: Requested number of workers, None for the default.
+
+    Returns:
+        int: Number of workers.
+
+    Raises:
+        wavy.WaveValueError: If the number of workers is not positive.
+
+    """
+    if workers is None:
+        # same default as concurrent.futures.ThreadPoolExecutor
+        return min(32, (os.cpu_count() or 1) + 4)
+    if workers <= 0:
+        raise wavy.WaveValueError("Argument 'workers' must be positive.")
+    return workers
+
+
+def check_arguments(function, kwargs):
+    """
+    Check that the optional arguments are accepted by the function, so that
+    a batch raises the mistake once instead of returning it for every file.
+
+    Args:
+        function: Function called for each file.
+        kwargs: Dictionary of optional arguments for the function.
+
+    Raises:
+        TypeError: If an argument is not accepted by the function.
+
+    """
+    # the file is the first argument of the function
+    inspect.signature(function).bind(None, **kwargs)
+
+
+def call_for_file(function, file):
+    """
+    Call function for file, catching any error raised for the file so that
+    it does not stop the batch.
+
+    Args:
+        function: Function to call.
+        file: Argument for the function.
+
+    Returns:
+        BatchResult: The result of the function or the error raised.
+
+    """
+    try:
+        return wavy.BatchResult(file=file, result=function(file), error=None)
+    except Exception as error:
+        return wavy.BatchResult(file=file, result=None, error=error)
+
+
+def map_files(function, files, workers=None, ordered=True):
+    """
+    Call function for each file using a pool of threads. Only a few files per
+    worker are submitted ahead of the results being consumed, so that memory
+    stays bounded for any number of files.
+
+    Args:
+        function: Function to call for each file.
+        files: Iterable of files.
+        workers: Number of threads, None for the default.
+        ordered: Whether to yield results in the same order as files, or as
+            soon as they are ready.
+
+    Yields:
+        BatchResult: Result for each file.
+
+    """
+    n_workers = get_n_workers(workers)
+    files = iter(files)
+
+    with concurrent.futures.ThreadPoolExecutor(n_workers) as executor:
+
+        def submit(n):
+            # submit up to n of the remaining files
+            return [executor.submit(call_for_file, function, file)
+                    for file in itertools.islice(files, n)]
+
+        if ordered:
+            pending = collections.deque(
+                submit(n_workers * N_PENDING_PER_WORKER))
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(submit(1))
+                yield result
+        else:
+            pending = set(submit(n_workers * N_PENDING_PER_WORKER))
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                pending.update(submit(len(done)))
+                for future in done:
+                    yield future.result()
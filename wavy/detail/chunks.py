@@ -0,0 +1,63 @@
+import collections
+import wavy
+
+ChunkInfo = collections.namedtuple('ChunkInfo', [
+    'id',
+    'offset',
+    'size'
+])
+"""
+Named tuple that represents a chunk in the stream.
+
+Attributes:
+    id (bytes): The chunk id (FOURCC).
+    offset (int): Position of the chunk data in the stream.
+    size (int): Size of the chunk data (without padding).
+"""
+
+# size of id + size of chunk
+CHUNK_HEADER_SIZE = 8
+
+# size of chunks whose actual size is stored in the ds64 chunk
+MAX_CHUNK_SIZE = 0xFFFFFFFF
+
+
+def iter_chunks(stream, handler):
+    """
+    Iterate over the chunks in the stream, starting at the current position.
+    Each chunk header is read with a single read, and the stream is moved to
+    the next chunk whatever was read from the chunk in the meantime.
+
+    Args:
+        stream: The stream to read (seekable or ForwardStream).
+        handler: StreamHandler with the endianness of the chunk sizes (and
+            the 64 bit sizes of large chunks).
+
+    Yields:
+        ChunkInfo: The next chunk, the stream is positioned at its data.
+
+    Raises:
+        wavy.WaveFileIsCorrupted: If a chunk header is truncated.
+
+    """
+    position = stream.tell()
+    while True:
+        header = stream.read(CHUNK_HEADER_SIZE)
+        # end of stream
+        if not header:
+            return
+        if len(header) < CHUNK_HEADER_SIZE:
+            raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
+
+        id, size = handler.chunk_header.unpack(header)
+        offset = position + CHUNK_HEADER_SIZE
+
+        # size does not fit 32 bits, the actual one is in the ds64 chunk
+        if size == MAX_CHUNK_SIZE:
+            size = handler.chunk_sizes.get(id, size)
+
+        yield ChunkInfo(id, offset, size)
+
+        # chunks are padded to an even number of bytes
+        position = offset + size + size % 2
+        stream.seek(position)
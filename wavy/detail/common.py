@@ -1,11 +1,14 @@
-import chunk
-import contextlib
 import io
+import mmap
 import numpy
 import wavy
+from .forward_stream import *
+from .memory_stream import *
 
 RIFF = b'RIFF'
 RIFX = b'RIFX'
+RF64 = b'RF64'
+BW64 = b'BW64'
 
 WAVE = b'WAVE'
 FMT = b'fmt '
@@ -13,8 +16,32 @@ DATA = b'data'
 FACT = b'fact'
 LIST = b'LIST'
 INFO = b'INFO'
+DS64 = b'ds64'
+JUNK = b'JUNK'
+BEXT = b'bext'
+IXML = b'iXML'
+CUE = b'cue '
+ADTL = b'adtl'
+LABL = b'labl'
+LTXT = b'ltxt'
+SMPL = b'smpl'
+PAD = b'PAD '
 
-SUPPORTED_HEADERS = [RIFF, RIFX]
+SUPPORTED_HEADERS = [RIFF, RIFX, RF64, BW64]
+
+# size of master chunk header (id, size and WAVE id)
+MASTER_CHUNK_SIZE = 12
+
+# chunks that only reserve space, and can be overwritten
+FILLER_CHUNKS = [JUNK, PAD]
+
+# headers of files with 64 bit sizes stored in the ds64 chunk
+DS64_HEADERS = [RF64, BW64]
+
+# size of the ds64 chunk without its table
+DS64_SIZE = 28
+# size of each entry in the ds64 table (id + size)
+DS64_TABLE_ENTRY_SIZE = 12
 
 WAVE_FORMAT_PCM = 0x0001
 WAVE_FORMAT_IEEE_FLOAT = 0x0003
@@ -38,6 +65,15 @@ SUPPORTED_SAMPLE_WIDTH_FOR_FORMAT = {
     0x0003: [32, 64],
 }
 
+# dtypes the data can be converted to while reading
+SUPPORTED_DTYPES_FOR_CONVERSION = ['float32', 'float64', 'int16']
+
+# bytes fetched at once when only reading the header
+HEADER_BUFFER_SIZE = 2 ** 16
+
+# in-memory files that can be read without copying
+BYTES_LIKE_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
 TAGS_TO_PROPS = {
     'INAM': 'name',  # The name of the file (or "project").
     'ISBJ': 'subject',  # The subject.
@@ -52,6 +88,29 @@ TAGS_TO_PROPS = {
     'ICOP': 'copyright'  # The copyright information.
 }
 
+# fixed fields of the bext chunk (EBU Tech 3285), followed by the coding
+# history
+BEXT_FORMAT = '256s32s32s10s8sLLH64shhhhh180x'
+BEXT_SIZE = 602
+
+# version of the bext chunk that added the loudness fields
+BEXT_LOUDNESS_VERSION = 2
+
+# cue point (id, position, chunk id, chunk start, block start, frame)
+CUE_POINT_FORMAT = 'LL4sLLL'
+CUE_POINT_SIZE = 24
+
+# labelled text of the adtl list (id, length), before the text itself
+LTXT_FORMAT = 'LL'
+
+# fixed fields of the smpl chunk, the number of loops is the eighth one
+SMPL_FORMAT = '9L'
+SMPL_SIZE = 36
+
+# sample loop (cue point id, type, start, end, fraction, play count)
+SAMPLE_LOOP_FORMAT = '6L'
+SAMPLE_LOOP_SIZE = 24
+
 TAG_PROPS = [
     'name',
     'subject',
@@ -68,8 +127,9 @@ TAG_PROPS = [
 
 
 def check_sample_width_supported(sample_width, dtype):
-    # get supported width for dtype
-    supported_sample_width = SUPPORTED_SAMPLE_WIDTH_FOR_DTYPE.get(str(dtype), None)
+    # get supported width for dtype (regardless of its byte order)
+    supported_sample_width = SUPPORTED_SAMPLE_WIDTH_FOR_DTYPE.get(
+        str(numpy.dtype(dtype).newbyteorder('=')), None)
 
     # dtype is not supported
     if not supported_sample_width:
@@ -84,16 +144,18 @@ def check_sample_width_supported(sample_width, dtype):
 
 def get_stream_from_file(file, flag, stream_class):
     """
-    Checks that file is either a string or the stream returned by
-    builtins.open. If it's string, it opens the stream and returns it.
+    Checks that file is either a string, a bytes-like object or the stream
+    returned by builtins.open. If it's string, it opens the stream and returns
+    it. If it's a bytes-like object, it returns a stream that reads from it
+    without copying.
 
     Args:
-        file: File can be str or <file_class>
+        file: File can be str, bytes-like object or <file_class>
         flag: flag to be used for opening file ('rb' or 'wb')
         stream_class: Class type for stream obj
 
     Returns:
-        stream_class: Instance of <stream_class>
+        stream_class: Instance of <stream_class> (or MemoryStream)
 
     Raises:
         WaveFileNotSupported: If the file is not of either type.
@@ -104,8 +166,14 @@ def get_stream_from_file(file, flag, stream_class):
         return open(file, flag)
     # then it must be already open
     if isinstance(file, stream_class):
+        # keep track of the position in streams that cannot seek
+        if flag == 'rb' and not file.seekable():
+            return ForwardStream(file)
         return file
+    # in-memory files can only be read
+    if flag == 'rb' and isinstance(file, BYTES_LIKE_TYPES):
+        return MemoryStream(file)
     # raise exception with expected arg types
     raise wavy.WaveFileNotSupported(
-        "'file' argument must be a string or <{}> instance, {} given instead."
-            .format(stream_class.__name__, type(file)))
+        "'file' argument must be a string, bytes-like object or <{}> "
+        "instance, {} given instead.".format(stream_class.__name__, type(file)))
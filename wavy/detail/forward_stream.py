@@ -0,0 +1,77 @@
+import io
+import wavy
+
+
+class ForwardStream(io.RawIOBase):
+    """
+    Read-only stream over a non-seekable stream (e.g. a pipe), that keeps
+    track of the position and emulates forward seeks by reading.
+    """
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: Non-seekable stream to read from.
+        """
+        self._stream = stream
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        """
+        Read bytes into a pre-allocated buffer.
+
+        Args:
+            buffer: Writable object supporting the buffer protocol.
+
+        Returns:
+            int: Number of bytes read (0 at end of stream).
+
+        """
+        n_read = self._stream.readinto(buffer) or 0
+        self._position += n_read
+        return n_read
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Move forward in the stream, by reading and discarding data.
+
+        Args:
+            offset: Offset relative to the position indicated by whence.
+            whence: Either io.SEEK_SET or io.SEEK_CUR.
+
+        Returns:
+            int: The new absolute position.
+
+        Raises:
+            wavy.WaveValueError: If seeking backwards.
+
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        if offset < self._position:
+            raise wavy.WaveValueError(
+                'Cannot seek backwards in a non-seekable stream.')
+
+        # discard data until we get to the position
+        while self._position < offset:
+            size = min(offset - self._position, io.DEFAULT_BUFFER_SIZE)
+            if not self.read(size):
+                break
+
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        self._stream.close()
+        super().close()
@@ -0,0 +1,121 @@
+import json
+import os
+import wavy
+
+# bump when the stored info changes, existing indexes are then rebuilt
+INDEX_VERSION = 3
+
+CREATE_INDEX_TABLE = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    info TEXT NOT NULL
+)
+"""
+
+SELECT_INDEX_ENTRY = "SELECT size, mtime_ns, info FROM files WHERE path = ?"
+
+SELECT_INDEX_ENTRIES = "SELECT path, size, mtime_ns FROM files"
+
+INSERT_INDEX_ENTRY = \
+    "INSERT OR REPLACE INTO files (path, size, mtime_ns, info) " \
+    "VALUES (?, ?, ?, ?)"
+
+DELETE_INDEX_ENTRY = "DELETE FROM files WHERE path = ?"
+
+WAVE_FILE_EXTENSIONS = ('.wav', '.wave')
+
+
+def init_index(connection):
+    """
+    Create the index table, dropping entries stored by other versions.
+
+    Args:
+        connection: The sqlite3 connection.
+
+    """
+    version, = connection.execute('PRAGMA user_version').fetchone()
+    with connection:
+        if version != INDEX_VERSION:
+            connection.execute('DROP TABLE IF EXISTS files')
+            connection.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        connection.execute(CREATE_INDEX_TABLE)
+
+
+def get_file_key(file_path, stat):
+    """
+    Get the index key of a file.
+
+    Args:
+        file_path: Path to the file.
+        stat: Result of os.stat for the file.
+
+    Returns:
+        tuple: Absolute path, size and modification time of the file.
+
+    """
+    return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+
+def dump_info(info):
+    """
+    Serialize WaveFileInfo for the index.
+
+    Args:
+        info: The WaveFileInfo.
+
+    Returns:
+        str: JSON representation of info.
+
+    """
+    values = info._asdict()
+    if info.tags:
+        values['tags'] = info.tags._asdict()
+    if info.bext:
+        values['bext'] = info.bext._asdict()
+        values['bext']['umid'] = info.bext.umid.hex()
+    if info.regions:
+        values['regions'] = [list(region) for region in info.regions]
+    return json.dumps(values)
+
+
+def load_info(data):
+    """
+    Deserialize WaveFileInfo stored in the index.
+
+    Args:
+        data: JSON representation of the info.
+
+    Returns:
+        WaveFileInfo: The info.
+
+    """
+    values = json.loads(data)
+    if values['tags']:
+        values['tags'] = wavy.Tags(**values['tags'])
+    if values['bext']:
+        values['bext']['umid'] = bytes.fromhex(values['bext']['umid'])
+        values['bext'] = wavy.Bext(**values['bext'])
+    if values['regions']:
+        values['regions'] = [wavy.Region(*region)
+                             for region in values['regions']]
+    return wavy.WaveFileInfo(**values)
+
+
+def iter_wave_files(directory):
+    """
+    Iterate over all WAVE files in a directory and its sub-directories.
+
+    Args:
+        directory: Path to the directory.
+
+    Yields:
+        os.DirEntry: Entry for each file.
+
+    """
+    for entry in os.scandir(directory):
+        if entry.is_dir():
+            yield from iter_wave_files(entry.path)
+        elif entry.name.lower().endswith(WAVE_FILE_EXTENSIONS):
+            yield entry
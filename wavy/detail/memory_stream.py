@@ -0,0 +1,78 @@
+import io
+
+
+class MemoryStream(io.RawIOBase):
+    """
+    Read-only stream over an in-memory buffer (bytes, bytearray, memoryview,
+    mmap...) that gives access to its content without copying it.
+    """
+
+    def __init__(self, buffer):
+        """
+        Args:
+            buffer: Object supporting the buffer protocol.
+        """
+        # flat view of the bytes, no copy is made
+        self._buffer = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        Read bytes into a pre-allocated buffer.
+
+        Args:
+            buffer: Writable object supporting the buffer protocol.
+
+        Returns:
+            int: Number of bytes read (0 at end of stream).
+
+        """
+        view = memoryview(buffer).cast('B')
+        data = self._buffer[self._position:self._position + len(view)]
+        view[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Change stream position.
+
+        Args:
+            offset: Offset relative to the position indicated by whence.
+            whence: Either io.SEEK_SET, io.SEEK_CUR or io.SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}.")
+
+        self._position = offset
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def getbuffer(self):
+        """
+        Get the underlying buffer.
+
+        Returns:
+            memoryview: Flat view of the whole buffer.
+
+        """
+        return self._buffer
@@ -0,0 +1,231 @@
+import numpy
+import os
+import tempfile
+import wavy
+import zipfile
+from .common import *
+from .read import check_data_size, read_frames_into, read_header, \
+    reshape_data
+
+# bytes of data decoded at the time when computing peaks
+PEAKS_BLOCK_SIZE = 2 ** 20
+
+# bump when the cached peaks change, existing caches are then recomputed
+PEAKS_CACHE_VERSION = 2
+
+# suffix of the sidecar cache file
+PEAKS_CACHE_SUFFIX = '.peaks'
+
+# errors raised by numpy.load for missing or damaged cache files
+PEAKS_CACHE_ERRORS = (OSError, EOFError, KeyError, ValueError,
+                      zipfile.BadZipFile)
+
+
+def check_samples_per_bucket(samples_per_bucket):
+    """
+    Check the number of frames in each bucket.
+
+    Args:
+        samples_per_bucket: Number of frames in each bucket.
+
+    Raises:
+        wavy.WaveValueError: If samples_per_bucket is not a positive integer.
+
+    """
+    if not isinstance(samples_per_bucket, int) or \
+            isinstance(samples_per_bucket, bool) or samples_per_bucket <= 0:
+        raise wavy.WaveValueError(
+            "Argument 'samples_per_bucket' must be a positive integer.")
+
+
+def reduce_block(samples, start, samples_per_bucket, squares, out_min,
+                 out_max, out_squares, zero=0):
+    """
+    Reduce a block of samples of each channel into the buckets it overlaps.
+    Buckets split across blocks are combined with the values already stored
+    for them, so blocks can be of any size.
+
+    Args:
+        samples: Array of shape (n_channels, n_samples). Each channel must be
+            contiguous, so that buckets are reduced along contiguous memory.
+        start: Index of the first sample of the block in the file.
+        samples_per_bucket: Number of samples in each bucket.
+        squares: Float64 array at least as large as samples, used to compute
+            the squares.
+        out_min: Array of shape (n_channels, n_buckets) where to accumulate
+            min.
+        out_max: Array of shape (n_channels, n_buckets) where to accumulate
+            max.
+        out_squares: Array of shape (n_channels, n_buckets) where to
+            accumulate the sum of squares.
+        zero: Value of silence, subtracted before squaring.
+
+    """
+    n_samples = samples.shape[1]
+    squares = squares[:, :n_samples]
+
+    # first sample of each bucket in the block, the first bucket can have
+    # started in the previous block
+    offsets = numpy.arange(-start % samples_per_bucket, n_samples,
+                           samples_per_bucket)
+    if not offsets.size or offsets[0]:
+        offsets = numpy.concatenate(([0], offsets))
+
+    buckets = slice(start // samples_per_bucket,
+                    start // samples_per_bucket + len(offsets))
+
+    numpy.subtract(samples, zero, out=squares, dtype=numpy.float64)
+    numpy.square(squares, out=squares)
+
+    numpy.minimum(out_min[:, buckets],
+                  numpy.minimum.reduceat(samples, offsets, axis=1),
+                  out=out_min[:, buckets])
+    numpy.maximum(out_max[:, buckets],
+                  numpy.maximum.reduceat(samples, offsets, axis=1),
+                  out=out_max[:, buckets])
+    numpy.add(out_squares[:, buckets],
+              numpy.add.reduceat(squares, offsets, axis=1),
+              out=out_squares[:, buckets])
+
+
+def read_peaks(stream, samples_per_bucket):
+    """
+    Compute the min, max and RMS of each channel for buckets of frames,
+    decoding the data chunk one block of fixed size at the time.
+
+    Args:
+        stream: Byte stream.
+        samples_per_bucket: Number of frames in each bucket.
+
+    Returns:
+        tuple: (min, max, rms) arrays of shape (n_buckets, n_channels), or
+        one dimensional if there is only one channel. Min and max have the
+        dtype of the data, RMS is float64 and relative to silence (128 for
+        8 bit samples).
+
+    Raises:
+        wavy.WaveValueError: If samples_per_bucket is not a positive integer.
+
+    """
+    check_samples_per_bucket(samples_per_bucket)
+
+    # data is read from the current position, tags are not needed
+    handler, format, info, data_chunk = read_header(stream,
+                                                    trailing_chunks=False)
+
+    # this gives us the number of frames
+    check_data_size(data_chunk.size, format)
+
+    n_bytes = format.wBitsPerSample // 8
+    is_float = format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT
+    n_channels = format.nChannels
+    n_frames = data_chunk.size // format.nBlockAlign
+    n_buckets = -(-n_frames // samples_per_bucket)
+
+    # 8 bit samples are unsigned, centered at 128
+    zero = 128 if n_bytes == 1 else 0
+
+    # peaks are accumulated channel by channel, and transposed at the end
+    dtype = numpy.dtype(handler.get_data_dtype(n_bytes, is_float))
+    low, high = (-numpy.inf, numpy.inf) if is_float else \
+        (numpy.iinfo(dtype).min, numpy.iinfo(dtype).max)
+    shape = (n_channels, n_buckets)
+    out_min = numpy.full(shape, high, dtype)
+    out_max = numpy.full(shape, low, dtype)
+    out_squares = numpy.zeros(shape, numpy.float64)
+
+    # blocks have a fixed size, so memory does not depend on bucket size
+    n_block_frames = max(min(PEAKS_BLOCK_SIZE // format.nBlockAlign,
+                             n_frames), 1)
+
+    # reuse the same buffers for every block
+    frames = numpy.empty((n_block_frames, n_channels), dtype)
+    samples = numpy.empty((n_channels, n_block_frames), dtype)
+    squares = numpy.empty(samples.shape, numpy.float64)
+
+    for start in range(0, n_frames, n_block_frames):
+        n = min(n_block_frames, n_frames - start)
+        read_frames_into(stream, format, handler, n, frames[:n])
+        # reducing along contiguous samples is much faster than across
+        # interleaved frames, and worth the copy
+        numpy.copyto(samples[:, :n], frames[:n].T)
+        reduce_block(samples[:, :n], start, samples_per_bucket, squares,
+                     out_min, out_max, out_squares, zero)
+
+    # the last bucket holds the remaining frames
+    counts = numpy.full(n_buckets, samples_per_bucket, numpy.float64)
+    if n_buckets:
+        counts[-1] = n_frames - (n_buckets - 1) * samples_per_bucket
+    out_rms = numpy.sqrt(out_squares / counts)
+
+    return tuple(reshape_data(numpy.ascontiguousarray(data.T).reshape(-1),
+                              format)
+                 for data in (out_min, out_max, out_rms))
+
+
+def get_peaks_cache_path(file_path):
+    """
+    Get the path to the sidecar cache of the peaks of a file.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        str: Path to the cache file.
+
+    """
+    return file_path + PEAKS_CACHE_SUFFIX
+
+
+def load_peaks(cache_path, samples_per_bucket, stat):
+    """
+    Load peaks from the cache, if they were computed for the same version of
+    the file.
+
+    Args:
+        cache_path: Path to the cache file.
+        samples_per_bucket: Number of frames in each bucket.
+        stat: Result of os.stat for the file.
+
+    Returns:
+        tuple: (min, max, rms) arrays, or None if the cache is missing or
+        out of date.
+
+    """
+    try:
+        with numpy.load(cache_path) as cache:
+            key = tuple(cache['key'])
+            if key != (PEAKS_CACHE_VERSION, samples_per_bucket,
+                       stat.st_size, stat.st_mtime_ns):
+                return None
+            return cache['min'], cache['max'], cache['rms']
+    except PEAKS_CACHE_ERRORS:
+        return None
+
+
+def save_peaks(cache_path, samples_per_bucket, stat, peaks):
+    """
+    Store peaks in the cache, replacing the cache file at once so that
+    concurrent readers never see a partial file.
+
+    Args:
+        cache_path: Path to the cache file.
+        samples_per_bucket: Number of frames in each bucket.
+        stat: Result of os.stat for the file, before the peaks were computed.
+        peaks: (min, max, rms) arrays.
+
+    """
+    key = numpy.array([PEAKS_CACHE_VERSION, samples_per_bucket, stat.st_size,
+                       stat.st_mtime_ns], dtype=numpy.int64)
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(cache_path)),
+        prefix=os.path.basename(cache_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            numpy.savez(file, key=key, min=peaks[0], max=peaks[1],
+                        rms=peaks[2])
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
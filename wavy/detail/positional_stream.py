@@ -0,0 +1,92 @@
+import io
+import os
+import stat
+
+
+class PositionalStream(io.RawIOBase):
+    """
+    Read-only stream over a file descriptor that reads with positional reads
+    (os.pread), so that many streams can read the same file concurrently
+    without sharing a file position.
+    """
+
+    def __init__(self, fd, position=0):
+        """
+        Args:
+            fd: File descriptor to read from (not closed by the stream).
+            position: Position in the file where to start reading.
+        """
+        self._fd = fd
+        self._position = position
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        """
+        Read bytes into a pre-allocated buffer.
+
+        Args:
+            buffer: Writable object supporting the buffer protocol.
+
+        Returns:
+            int: Number of bytes read (0 at end of file).
+
+        """
+        view = memoryview(buffer).cast('B')
+        if hasattr(os, 'preadv'):
+            # read straight into the buffer
+            n_read = os.preadv(self._fd, [view], self._position)
+        else:
+            data = os.pread(self._fd, len(view), self._position)
+            n_read = len(data)
+            view[:n_read] = data
+        self._position += n_read
+        return n_read
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Change the position in the file, no data is read.
+
+        Args:
+            offset: Offset relative to the position indicated by whence.
+            whence: Either io.SEEK_SET or io.SEEK_CUR.
+
+        Returns:
+            int: The new absolute position.
+
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence}).")
+        self._position = offset
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+def get_file_descriptor(stream):
+    """
+    Get the file descriptor of a stream for positional reads.
+
+    Args:
+        stream: Byte stream.
+
+    Returns:
+        int: The file descriptor, or None if the stream is not a regular file
+        or positional reads are not supported.
+
+    """
+    if not hasattr(os, 'pread') or not isinstance(stream, io.BufferedReader):
+        return None
+    try:
+        fd = stream.fileno()
+        # pipes and other streams cannot be read at a position
+        return fd if stat.S_ISREG(os.fstat(fd).st_mode) else None
+    except OSError:
+        return None
@@ -0,0 +1,116 @@
+import io
+from .memory_stream import *
+
+
+class PrefetchStream(io.RawIOBase):
+    """
+    Read-only stream that fetches the beginning of another stream with a
+    single read and serves reads and seeks from it. Anything past the
+    prefetched bytes is read from the underlying stream on demand.
+    """
+
+    def __init__(self, stream, size):
+        """
+        Args:
+            stream: Seekable stream to read from.
+            size: Number of bytes to prefetch.
+        """
+        self._stream = stream
+        self._start = stream.tell()
+        # read1 does at most one read on the raw stream
+        read = getattr(stream, 'read1', stream.read)
+        # a short read does not mean end of file (buffered streams only
+        # return what they already hold), so the rest is always read from
+        # the stream
+        self._buffer = read(size)
+        # position of this stream and of the underlying one
+        self._position = self._start
+        self._stream_position = self._start + len(self._buffer)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        # seeks within the prefetched bytes always work, but the chunks past
+        # them can only be reached if the underlying stream can seek
+        return self._stream.seekable()
+
+    def readinto(self, buffer):
+        """
+        Read bytes into a pre-allocated buffer.
+
+        Args:
+            buffer: Writable object supporting the buffer protocol.
+
+        Returns:
+            int: Number of bytes read (0 at end of stream).
+
+        """
+        view = memoryview(buffer).cast('B')
+        offset = self._position - self._start
+
+        # serve as much as possible from the prefetched bytes
+        data = self._buffer[offset:offset + len(view)]
+        view[:len(data)] = data
+        n_read = len(data)
+
+        # fetch the rest from the underlying stream
+        if n_read < len(view):
+            position = self._position + n_read
+            if position != self._stream_position:
+                self._stream.seek(position)
+            n = self._stream.readinto(view[n_read:]) or 0
+            self._stream_position = position + n
+            n_read += n
+
+        self._position += n_read
+        return n_read
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Change stream position, no seek is done on the underlying stream
+        until it needs to be read.
+
+        Args:
+            offset: Offset relative to the position indicated by whence.
+            whence: Either io.SEEK_SET, io.SEEK_CUR or io.SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+
+        """
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._stream.seek(0, io.SEEK_END)
+            self._stream_position = None
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}.")
+
+        self._position = offset
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+def prefetch(stream, size):
+    """
+    Wrap stream so that its first bytes are fetched with a single read.
+
+    Args:
+        stream: Stream to read from.
+        size: Number of bytes to prefetch.
+
+    Returns:
+        PrefetchStream: The wrapped stream, or the stream itself if it is
+        already in memory.
+
+    """
+    # nothing to gain for data already in memory
+    if isinstance(stream, MemoryStream):
+        return stream
+    return PrefetchStream(stream, size)
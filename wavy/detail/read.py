@@ -1,8 +1,17 @@
 import collections
+import concurrent.futures
+import io
 import numpy
+import operator
+import os
+import stat
 import struct
 import wavy
+from .batch import check_arguments, get_n_workers
+from .chunks import *
 from .common import *
+from .memory_stream import *
+from .positional_stream import *
 from .stream_handler import *
 
 FormatInfo = collections.namedtuple('FormatInfo', [
@@ -14,22 +23,31 @@ FormatInfo = collections.namedtuple('FormatInfo', [
     'wBitsPerSample'
 ])
 
+DataRange = collections.namedtuple('DataRange', [
+    'chunk',
+    'handler',
+    'start',
+    'stop',
+    'mmap',
+    'channels',
+    'dtype',
+    'workers'
+])
 
-def get_chunk(stream):
-    """
-    Get chunk for wave file (always little endian)
-    """
-    try:
-        return chunk.Chunk(stream, bigendian=False)
-    except EOFError:
-        raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
+# number of ranges of frames read by each worker, so that workers finishing
+# early pick up more of the data
+N_RANGES_PER_WORKER = 4
+
+# minimum number of bytes read by each worker at the time
+MIN_RANGE_SIZE = 2 ** 20
 
 
 def get_stream_handler(stream):
     """
     Reads the master chunk from the stream and checks that it matches the
     specifications for Wave files. Returns StreamHandler with the correct
-    endianness set based on file header (RIFF or RIFX).
+    endianness set based on file header (RIFF or RIFX). For RF64 and BW64
+    files, the ds64 chunk is read as well to get the 64 bit chunk sizes.
 
     Args:
         stream: The stream to read.
@@ -49,7 +67,7 @@ def get_stream_handler(stream):
         raise wavy.WaveFileNotSupported("Unsupported header for "
                                         "file '{}'.".format(header.decode()))
 
-    handler = StreamHandler(little_endian=header == RIFF)
+    handler = StreamHandler(little_endian=header != RIFX)
     # this will be the size of the chunk
     stream.read(4)
     # WAVEID should always be WAVE
@@ -57,30 +75,94 @@ def get_stream_handler(stream):
         raise wavy.WaveFileNotSupported('File does not appear to be a WAVE '
                                         'file.')
 
+    if header in DS64_HEADERS:
+        read_ds64_chunk(stream, handler)
+
     return handler
 
 
-def get_sub_format(fmt_chunk, handler):
+def read_ds64_chunk(stream, handler):
+    """
+    Reads the ds64 chunk, that must follow the master chunk of RF64 and BW64
+    files, and stores the 64 bit chunk sizes in the handler.
+
+    Args:
+        stream: The stream to read.
+        handler: StreamHandler for the stream.
+
+    Raises:
+        wavy.WaveFileIsCorrupted: If the ds64 chunk is missing or truncated.
+
+    """
+    header = stream.read(CHUNK_HEADER_SIZE)
+    if len(header) < CHUNK_HEADER_SIZE:
+        raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
+
+    id, size = handler.chunk_header.unpack(header)
+    if id != DS64:
+        raise wavy.WaveFileIsCorrupted("Chunk 'ds64' is missing.")
+
+    # read whole chunk (and its padding) in one go
+    data = stream.read(size + size % 2)
+    if len(data) < size or size < DS64_SIZE:
+        raise wavy.WaveFileIsCorrupted("Chunk 'ds64' is truncated.")
+
+    # RIFF size and sample count are not needed
+    _, data_size, _, table_length = handler.read('QQQL', data)
+    handler.chunk_sizes[DATA] = data_size
+
+    # table with the sizes of other large chunks
+    if DS64_SIZE + table_length * DS64_TABLE_ENTRY_SIZE > size:
+        raise wavy.WaveFileIsCorrupted("Chunk 'ds64' is truncated.")
+
+    for i in range(table_length):
+        id, chunk_size = handler.read(
+            '4sQ', data, DS64_SIZE + i * DS64_TABLE_ENTRY_SIZE)
+        handler.chunk_sizes[id] = chunk_size
+
+
+def get_sub_format(fmt_data, handler):
     """
-    Read first two bytes of subFormat tag from fmt_chunk (indicates the actual
-    format for extended encoding).
+    Read first two bytes of subFormat tag from fmt chunk data (indicates the
+    actual format for extended encoding).
     Args:
-        fmt_chunk: The format chunk.
+        fmt_data: The format chunk data.
 
     Returns:
         int: First two bytes of subFormat tag.
     """
-    fmt_chunk.seek(24)
-    return handler.read('H', fmt_chunk.read(2))[0]
+    return handler.read('H', fmt_data, 24)[0]
 
 
-def get_fmt_chunk(stream, handler):
+def get_next_chunk(chunks):
+    """
+    Get next chunk from chunk iterator.
+
+    Args:
+        chunks: Chunk iterator.
+
+    Returns:
+        ChunkInfo: The next chunk.
+
+    Raises:
+        wavy.WaveFileIsCorrupted: If there are no more chunks.
+
+    """
+    try:
+        return next(chunks)
+    except StopIteration:
+        raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
+
+
+def get_fmt_chunk(stream, handler, chunks):
     """
     Reads the format chunk from the stream, checks that it matches the
     specifications for Wave files and returns format information.
 
     Args:
         stream: The stream to read.
+        handler: StreamHandler for the stream.
+        chunks: Iterator over the chunks of the stream.
 
     Returns:
         FormatInfo: Format info from fmt chunk.
@@ -92,32 +174,35 @@ def get_fmt_chunk(stream, handler):
     """
     # iterate through chunks until we find format
     while True:
-        chunk = get_chunk(stream)
-        name = chunk.getname()
+        chunk = get_next_chunk(chunks)
         # found format
-        if name == FMT:
+        if chunk.id == FMT:
             break
         # we got to the data chunks, something is wrong
-        if name == DATA:
+        if chunk.id == DATA:
             raise wavy.WaveFileIsCorrupted('Found data chunk before fmt chunk.')
-        chunk.skip()
 
     # chunk size is not supported
-    if chunk.getsize() not in FMT_CHUNK_SIZES:
+    if chunk.size not in FMT_CHUNK_SIZES:
         raise wavy.WaveFileIsCorrupted(
-            'Format chunk is of unexpected size: {}.'.format(chunk.getsize()))
+            'Format chunk is of unexpected size: {}.'.format(chunk.size))
+
+    # read the whole chunk at once
+    data = stream.read(chunk.size)
+    if len(data) != chunk.size:
+        raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
 
     # extract common chunk info into tuple
-    info = FormatInfo(*handler.read('HHLLHH', chunk.read(16)))
+    info = FormatInfo(*handler.read('HHLLHH', data))
 
     format_tag = info.wFormatTag
 
     # if format extensible is used, the format tag
     # will be specified in the sub format
     if format_tag == WAVE_FORMAT_EXTENSIBLE and \
-            chunk.getsize() == 40:
+            chunk.size == 40:
         # get format tag
-        format_tag = get_sub_format(chunk, handler)
+        format_tag = get_sub_format(data, handler)
         # replace tag in FormatInfo
         info = FormatInfo(format_tag, *list(info)[1:])
 
@@ -131,7 +216,6 @@ def get_fmt_chunk(stream, handler):
                 "Sample width '{}' is not supported for "
                 "given type.".format(info.wBitsPerSample))
 
-        chunk.skip()
         return info
 
     raise wavy.WaveFileNotSupported('The wave format is not of supported type.')
@@ -148,8 +232,8 @@ def check_format_info(info):
         wavy.WaveFileIsCorrupted: If format info is incorrect.
 
     """
-    # check that block align matches bits per sample
-    block_align = int(info.wBitsPerSample / 4)
+    # check that block align matches bits per sample and channels
+    block_align = info.nChannels * info.wBitsPerSample // 8
     if block_align != info.nBlockAlign:
         raise wavy.WaveFileIsCorrupted(
             f"Block align is incorrect for {info.wBitsPerSample} bits. "
@@ -165,15 +249,20 @@ def check_format_info(info):
             f"Actual: {info.nAvgBytesPerSec}.")
 
 
-def get_data_chunk(stream, info_tags={}):
+def get_data_chunk(stream, handler, chunks, info_tags={}, metadata=None):
     """
     Reads the data chunk from the stream.
 
     Args:
         stream: The stream to read.
+        handler: StreamHandler for the stream.
+        chunks: Iterator over the chunks of the stream.
+        info_tags: Dictionary where to store tags found on the way.
+        metadata: Dictionary where to store the bext, iXML, cue, adtl and
+            smpl chunks found on the way, by chunk id (None to skip them).
 
     Returns:
-        chunk: Data chunk.
+        ChunkInfo: Data chunk, the stream is positioned at its data.
 
     Raises:
         wavy.WaveFileIsCorrupted: If file is corrupted.
@@ -181,20 +270,66 @@ def get_data_chunk(stream, info_tags={}):
     """
     # iterate through chunks until we find data
     while True:
-        chunk = get_chunk(stream)
-        name = chunk.getname()
+        chunk = get_next_chunk(chunks)
         # found data
-        if name == DATA:
+        if chunk.id == DATA:
             return chunk
-        elif name == LIST:
-            read_list_chunk(stream, chunk, info_tags)
-        else:
-            chunk.skip()
+        read_metadata_chunk(stream, chunk, handler, info_tags, metadata)
+
+
+def read_trailing_chunks(stream, handler, chunks, info_tags, metadata=None):
+    """
+    Reads the chunks after the data chunk, that are reached by seeking past
+    the data without reading it.
+
+    Args:
+        stream: The stream to read (must be seekable).
+        handler: StreamHandler for the stream.
+        chunks: Iterator over the chunks of the stream, after the data chunk.
+        info_tags: Dictionary where to store tags found on the way.
+        metadata: Dictionary where to store the bext, iXML, cue, adtl and
+            smpl chunks found on the way, by chunk id (None to skip them).
+
+    """
+    try:
+        for chunk in chunks:
+            read_metadata_chunk(stream, chunk, handler, info_tags, metadata)
+    except wavy.WaveFileIsCorrupted:
+        # bytes after the data that are not a whole chunk are ignored
+        pass
+
+
+def read_metadata_chunk(stream, chunk, handler, info_tags, metadata=None):
+    """
+    Parse the chunk if it stores information about the file.
+
+    Args:
+        stream: Byte stream, positioned at the chunk data.
+        chunk: The chunk.
+        handler: StreamHandler for the stream.
+        info_tags: Dictionary where to store parsed tags.
+        metadata: Dictionary where to store the parsed bext, iXML, cue, adtl
+            and smpl chunks, by chunk id (None to skip them).
+
+    """
+    if chunk.id == LIST:
+        read_list_chunk(stream, chunk, handler, info_tags, metadata)
+    elif metadata is None:
+        return
+    elif chunk.id == BEXT:
+        metadata[BEXT] = read_bext_chunk(stream, chunk, handler)
+    elif chunk.id == IXML:
+        metadata[IXML] = get_string_from_c_string(stream.read(chunk.size))
+    elif chunk.id == CUE:
+        metadata[CUE] = read_cue_chunk(stream, chunk, handler)
+    elif chunk.id == SMPL:
+        metadata[SMPL] = read_smpl_chunk(stream, chunk, handler)
 
 
 def get_string_from_bytes(bytes_list):
     """
-    Get string from bytes list.
+    Get string from bytes list, characters that cannot be decoded (e.g. tags
+    written in a Windows code page) are replaced.
 
     Args:
         bytes_list: Bytes list.
@@ -204,7 +339,64 @@ def get_string_from_bytes(bytes_list):
 
     """
     # remove padding at the end
-    return bytes_list.decode().rstrip('\x00')
+    return bytes_list.decode(errors='replace').rstrip('\x00')
+
+
+def get_string_from_c_string(bytes_list):
+    """
+    Get string from null terminated bytes, characters that cannot be decoded
+    are replaced.
+
+    Args:
+        bytes_list: Bytes list.
+
+    Returns:
+        str: The string up to the first null character.
+
+    """
+    return bytes_list.split(b'\x00', 1)[0].decode(errors='replace')
+
+
+def read_bext_chunk(stream, bext_chunk, handler):
+    """
+    Parse the bext chunk of Broadcast Wave files.
+
+    Args:
+        stream: Byte stream, positioned at the bext chunk data.
+        bext_chunk: The bext chunk.
+        handler: StreamHandler for the stream.
+
+    Returns:
+        Bext: The parsed chunk.
+
+    """
+    data = stream.read(bext_chunk.size)
+    # fields missing from short chunks are left empty
+    fields = handler.read(BEXT_FORMAT, data.ljust(BEXT_SIZE, b'\x00'))
+
+    description, originator, originator_reference, origination_date, \
+        origination_time, time_reference_low, time_reference_high, version, \
+        umid = fields[:9]
+
+    # loudness values are stored multiplied by 100
+    loudness = [value / 100 if version >= BEXT_LOUDNESS_VERSION else None
+                for value in fields[9:]]
+
+    return wavy.Bext(
+        description=get_string_from_c_string(description),
+        originator=get_string_from_c_string(originator),
+        originator_reference=get_string_from_c_string(originator_reference),
+        origination_date=get_string_from_c_string(origination_date),
+        origination_time=get_string_from_c_string(origination_time),
+        time_reference=time_reference_high << 32 | time_reference_low,
+        version=version,
+        umid=umid,
+        loudness_value=loudness[0],
+        loudness_range=loudness[1],
+        max_true_peak_level=loudness[2],
+        max_momentary_loudness=loudness[3],
+        max_short_term_loudness=loudness[4],
+        coding_history=get_string_from_c_string(data[BEXT_SIZE:]))
 
 
 def get_info_from_tags_dict(tags_dict):
@@ -224,96 +416,941 @@ def get_info_from_tags_dict(tags_dict):
     })
 
 
-def read_list_chunk(stream, list_chunk, info_tags):
+def read_list_chunk(stream, list_chunk, handler, info_tags, metadata=None):
     """
     Parse LIST chunk information into provided dictionary.
 
     Args:
-        stream: Byte stream.
+        stream: Byte stream, positioned at the LIST chunk data.
         list_chunk: The LIST chunk.
+        handler: StreamHandler for the stream.
         info_tags: Dictionary where to store parsed tags.
+        metadata: Dictionary where to store the parsed adtl list (None to
+            skip it).
 
     """
+    if list_chunk.size < 4:
+        return
+
+    list_type = stream.read(4)
+
+    if list_type == ADTL and metadata is not None:
+        metadata[ADTL] = read_adtl_list(stream.read(list_chunk.size - 4),
+                                        handler)
+
     # if sub header is not info, skip chunk
-    if INFO != list_chunk.read(4):
-        list_chunk.skip()
+    if list_type != INFO:
         return
 
-    # get size of chunk to parse (size - sub-header)
-    bytes_to_parse = list_chunk.getsize() - 4
+    # read the whole chunk at once (size - sub-header)
+    data = stream.read(list_chunk.size - 4)
 
-    # parse whole chunk one at the time
-    while bytes_to_parse:
-        chunk = get_chunk(stream)
-        # remove chunk size from bytes to parse (size + chunk header)
-        bytes_to_parse -= chunk.getsize() + 8
+    # parse each sub chunk from memory
+    for chunk in iter_chunks(MemoryStream(data), handler):
         # insert tag, value into dictionary
-        tag = get_string_from_bytes(chunk.getname())
-        info_tags[tag] = get_string_from_bytes(chunk.read())
+        tag = get_string_from_bytes(chunk.id)
+        info_tags[tag] = get_string_from_bytes(
+            data[chunk.offset:chunk.offset + chunk.size])
+
+
+def read_cue_chunk(stream, cue_chunk, handler):
+    """
+    Parse the cue points of the cue chunk.
+
+    Args:
+        stream: Byte stream, positioned at the cue chunk data.
+        cue_chunk: The cue chunk.
+        handler: StreamHandler for the stream.
+
+    Returns:
+        dict: Frame of each cue point, by cue point id.
+
+    """
+    data = stream.read(cue_chunk.size)
+    if len(data) < 4:
+        return {}
+
+    # ignore cue points past the end of the chunk
+    n_points = min(handler.read('L', data)[0],
+                   (len(data) - 4) // CUE_POINT_SIZE)
+
+    cue_points = {}
+    for offset in range(4, 4 + n_points * CUE_POINT_SIZE, CUE_POINT_SIZE):
+        id, _, _, _, _, frame = handler.read(CUE_POINT_FORMAT, data, offset)
+        cue_points[id] = frame
+    return cue_points
+
 
+def read_adtl_list(data, handler):
+    """
+    Parse the labels and lengths of the cue points of an adtl list.
+
+    Args:
+        data: Data of the LIST chunk, after the list type.
+        handler: StreamHandler for the stream.
+
+    Returns:
+        dict: (label, length) of the cue points, by cue point id. Label is
+        None if the cue point has no label, length is 0 for markers.
+
+    """
+    adtl = {}
+
+    # parse each sub chunk from memory
+    for chunk in iter_chunks(MemoryStream(data), handler):
+        chunk_data = data[chunk.offset:chunk.offset + chunk.size]
+        if chunk.id == LABL and len(chunk_data) >= 4:
+            id, = handler.read('L', chunk_data)
+            label = get_string_from_c_string(chunk_data[4:])
+            adtl[id] = (label, adtl.get(id, (None, 0))[1])
+        elif chunk.id == LTXT and len(chunk_data) >= 8:
+            id, length = handler.read(LTXT_FORMAT, chunk_data)
+            adtl[id] = (adtl.get(id, (None, 0))[0], length)
+    return adtl
+
+
+def read_smpl_chunk(stream, smpl_chunk, handler):
+    """
+    Parse the sample loops of the smpl chunk.
+
+    Args:
+        stream: Byte stream, positioned at the smpl chunk data.
+        smpl_chunk: The smpl chunk.
+        handler: StreamHandler for the stream.
+
+    Returns:
+        list: (cue point id, start, length) of each loop.
 
-def get_data_from_chunk(chunk, format, handler):
+    """
+    data = stream.read(smpl_chunk.size)
+    if len(data) < SMPL_SIZE:
+        return []
+
+    # ignore loops past the end of the chunk
+    n_loops = min(handler.read(SMPL_FORMAT, data)[7],
+                  (len(data) - SMPL_SIZE) // SAMPLE_LOOP_SIZE)
+
+    loops = []
+    for offset in range(SMPL_SIZE, SMPL_SIZE + n_loops * SAMPLE_LOOP_SIZE,
+                        SAMPLE_LOOP_SIZE):
+        id, _, start, end, _, _ = handler.read(SAMPLE_LOOP_FORMAT, data,
+                                               offset)
+        # the end of loops is the last frame played
+        loops.append((id, start, max(end - start + 1, 0)))
+    return loops
+
+
+def get_regions(metadata):
+    """
+    Build the regions of the file from its cue, adtl and smpl chunks.
+
+    Args:
+        metadata: Dictionary of the parsed chunks, by chunk id.
+
+    Returns:
+        list: Region for each cue point and loop, ordered by frame, or None
+        if the file has neither.
+
+    """
+    cue_points = metadata.get(CUE, {})
+    loops = metadata.get(SMPL, [])
+    if not cue_points and not loops:
+        return None
+
+    adtl = metadata.get(ADTL, {})
+    regions = {id: [frame, adtl.get(id, (None, 0))[1]]
+               for id, frame in cue_points.items()}
+
+    # loops usually point to a cue point, which they give a length to
+    for id, start, length in loops:
+        region = regions.setdefault(id, [start, 0])
+        if not region[1]:
+            region[1] = length
+
+    return sorted((wavy.Region(id=id, frame=frame, length=length,
+                               label=adtl.get(id, (None, 0))[0])
+                   for id, (frame, length) in regions.items()),
+                  key=lambda region: (region.frame, region.id))
+
+
+def get_region_range(regions, label_or_id, n_frames):
+    """
+    Get the range of frames of a region.
+
+    Args:
+        regions: Regions of the file (None if it has none).
+        label_or_id: Label (str) or cue point id (int) of the region.
+        n_frames: Number of frames in the data chunk.
+
+    Returns:
+        tuple: (start, stop) frames, clipped to the data. Markers (regions
+        without length) stop at the next region, or at the end of the data.
+
+    Raises:
+        wavy.WaveValueError: If the region is not found.
+
+    """
+    if isinstance(label_or_id, str):
+        field = 'label'
+    elif isinstance(label_or_id, int) and not isinstance(label_or_id, bool):
+        field = 'id'
+    else:
+        raise wavy.WaveValueError(
+            "Argument 'label_or_id' must be a string or an integer.")
+
+    regions = regions or []
+    region = next((region for region in regions
+                   if getattr(region, field) == label_or_id), None)
+    if region is None:
+        raise wavy.WaveValueError(f"Region {label_or_id!r} not found.")
+
+    start = min(region.frame, n_frames)
+    if region.length:
+        stop = region.frame + region.length
+    else:
+        stop = min([other.frame for other in regions
+                    if other.frame > region.frame], default=n_frames)
+
+    return start, max(start, min(stop, n_frames))
+
+
+def check_data_size(size, format):
+    """
+    Check that the data size is a whole number of frames.
+
+    Args:
+        size: Size of the data chunk.
+        format: File format information.
+
+    Raises:
+        wavy.WaveFileIsCorrupted: If the size does not match the frame size.
+
+    """
+    if size % format.nBlockAlign != 0:
+        # something is wrong here, size should be a multiple
+        raise wavy.WaveFileIsCorrupted("Data size does not match frame size of"
+                                       f" {format.wBitsPerSample} bits")
+
+
+def reshape_data(data, format):
+    """
+    Reshape flat data into frames.
+
+    Args:
+        data: Flat data array.
+        format: File format information.
+
+    Returns:
+        numpy.array: Data array of shape (n_frames, n_channels), or one
+        dimensional if there is only one channel.
+
+    """
+    # check if there is more than one channel, if so reshape
+    return data if format.nChannels == 1 \
+        else data.reshape(-1, format.nChannels)
+
+
+def get_channels(format, channels=None):
+    """
+    Check the channels to read.
+
+    Args:
+        format: File format information.
+        channels: Indexes of the channels to read (None for all of them).
+            Negative values count from the last channel.
+
+    Returns:
+        list: Indexes of the channels to read, or None to read all of them.
+
+    Raises:
+        wavy.WaveValueError: If the channels are not valid.
+
+    """
+    if channels is None:
+        return None
+
+    try:
+        channels = [range(format.nChannels)[channel] for channel in channels]
+    except (TypeError, IndexError):
+        raise wavy.WaveValueError(
+            f"Argument 'channels' must be a list of channel indexes lower "
+            f"than {format.nChannels}.")
+
+    if not channels:
+        raise wavy.WaveValueError("Argument 'channels' cannot be empty.")
+
+    # all channels in order can be read the usual way
+    return None if channels == list(range(format.nChannels)) else channels
+
+
+def check_dtype(dtype):
+    """
+    Check the dtype is supported for conversion.
+
+    Args:
+        dtype: The dtype to convert the data to.
+
+    Returns:
+        numpy.dtype: The dtype in native byte order.
+
+    Raises:
+        wavy.WaveValueError: If the dtype is not supported.
+
+    """
+    try:
+        dtype = numpy.dtype(dtype).newbyteorder('=')
+    except TypeError:
+        dtype = None
+
+    if dtype is None or dtype.name not in SUPPORTED_DTYPES_FOR_CONVERSION:
+        raise wavy.WaveValueError(
+            f"Argument 'dtype' must be one of "
+            f"{', '.join(SUPPORTED_DTYPES_FOR_CONVERSION)}.")
+
+    return dtype
+
+
+def get_conversion_dtype(format, handler, dtype=None):
+    """
+    Check the dtype to convert the data to.
+
+    Args:
+        format: File format information.
+        handler: StreamHandler for the stream.
+        dtype: The dtype to convert the data to (None to keep it as it is).
+
+    Returns:
+        numpy.dtype: The dtype (in native byte order) to convert the data to,
+        or None if the data does not need converting.
+
+    Raises:
+        wavy.WaveValueError: If the dtype is not supported.
+
+    """
+    if dtype is None:
+        return None
+
+    dtype = check_dtype(dtype)
+
+    data_dtype = handler.get_data_dtype(
+        format.wBitsPerSample // 8,
+        format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT)
+
+    return None if dtype == data_dtype else dtype
+
+
+def get_parallel_workers(workers=None):
+    """
+    Check the number of threads reading the data.
+
+    Args:
+        workers: Requested number of threads (None to read the data in the
+            calling thread).
+
+    Returns:
+        int: Number of threads, or None if the data is read in the calling
+        thread.
+
+    Raises:
+        wavy.WaveValueError: If the number of workers is not positive.
+
+    """
+    if workers is None:
+        return None
+    workers = get_n_workers(workers)
+    # a single worker is the same as reading in the calling thread
+    return workers if workers > 1 else None
+
+
+def get_frame_range(format, size, start=None, stop=None, in_seconds=False):
+    """
+    Get the range of frames to read from the data chunk.
+
+    Args:
+        format: File format information.
+        size: Size of the data chunk.
+        start: First frame to read (None for the start of the data). Negative
+            values count from the end, like for slices.
+        stop: Frame at which to stop reading (None for the end of the data).
+            Negative values count from the end, like for slices.
+        in_seconds: Whether start and stop are given in seconds.
+
+    Returns:
+        tuple: (start, stop) frames, clipped to the data.
+
+    Raises:
+        wavy.WaveValueError: If start or stop is not a valid index.
+
+    """
+    try:
+        # convert seconds to frames using the sampling frequency
+        if in_seconds:
+            start, stop = [None if x is None else
+                           round(x * format.nSamplesPerSec)
+                           for x in (start, stop)]
+        # follow slice semantics for negative and out of bounds values
+        start, stop, _ = slice(start, stop).indices(size // format.nBlockAlign)
+    except TypeError:
+        raise wavy.WaveValueError(
+            "Arguments 'start' and 'stop' must be "
+            f"{'numbers' if in_seconds else 'integers'} or None.")
+
+    return start, max(start, stop)
+
+
+def check_read_arguments(kwargs):
+    """
+    Check the optional arguments of wavy.read that do not depend on the file,
+    so that a batch raises mistakes once instead of returning them for every
+    file. Arguments that depend on the file (e.g. channel indexes out of
+    range) are still checked for each file.
+
+    Args:
+        kwargs: Dictionary of optional arguments for wavy.read.
+
+    Raises:
+        TypeError: If an argument is not accepted by wavy.read.
+        wavy.WaveValueError: If an argument is not valid.
+
+    """
+    check_arguments(wavy.read, kwargs)
+
+    in_seconds = kwargs.get('in_seconds', False)
+    try:
+        for value in (kwargs.get('start'), kwargs.get('stop')):
+            # same conversion as get_frame_range, at any sampling frequency
+            if value is not None:
+                operator.index(round(value * 1) if in_seconds else value)
+    except TypeError:
+        raise wavy.WaveValueError(
+            "Arguments 'start' and 'stop' must be "
+            f"{'numbers' if in_seconds else 'integers'} or None.")
+
+    channels = kwargs.get('channels')
+    if channels is not None:
+        try:
+            channels = [operator.index(channel) for channel in channels]
+        except TypeError:
+            raise wavy.WaveValueError(
+                "Argument 'channels' must be a list of channel indexes.")
+        if not channels:
+            raise wavy.WaveValueError("Argument 'channels' cannot be empty.")
+
+    if kwargs.get('dtype') is not None:
+        check_dtype(kwargs['dtype'])
+
+    get_parallel_workers(kwargs.get('workers'))
+
+
+def get_data_from_chunk(stream, chunk, format, handler, start=0, stop=None,
+                        channels=None, dtype=None):
     """
     Read data from data chunk.
     Args:
+        stream: Byte stream.
         chunk: Data chunk.
         format: File format information.
+        start: First frame to read.
+        stop: Frame at which to stop reading (None for the end of the data).
+        channels: Indexes of the channels to read (None for all of them).
+        dtype: The dtype to convert the data to (None to keep it as it is).
 
     Returns:
         numpy.array: Data read from chunk.
     """
     # get size of data
-    size = chunk.getsize()
+    size = chunk.size
 
     # this gives us the number of frames
-    if size % format.nBlockAlign != 0:
-        # something is wrong here, size should be a multiple
-        raise wavy.WaveFileIsCorrupted("Data size does not match frame size of"
-                                       f" {format.wBitsPerSample} bits")
+    check_data_size(size, format)
+
+    # only read the requested frames
+    if stop is None:
+        stop = size // format.nBlockAlign
+    size = (stop - start) * format.nBlockAlign
+
+    # skip straight to the first frame
+    stream.seek(chunk.offset + start * format.nBlockAlign)
 
     # number of bytes for data type to be parsed
     n_bytes = format.wBitsPerSample // 8
+    is_float = format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT
+
+    if channels is not None:
+        # only decode the selected channels
+        data = handler.read_channels(stream, stop - start, n_bytes, is_float,
+                                     format.nChannels, channels, dtype=dtype)
+        return data.reshape(-1) if len(channels) == 1 else data
 
     # read data from raw
-    data = handler.read_data(chunk, size, n_bytes,
-                             format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT)
+    data = handler.read_data(stream, size, n_bytes, is_float, dtype)
 
-    # check if there is more than one channel, if so reshape
-    return data if format.nChannels == 1 \
-        else data.reshape(-1, format.nChannels)
+    return reshape_data(data, format)
 
 
-def read_stream(stream, read_data=True):
+def get_mapped_size(stream):
+    """
+    Get the size of the file that a stream would be mapped from.
+
+    Args:
+        stream: Byte stream.
+
+    Returns:
+        int: Size of the in-memory data or of the file on disk.
+
+    Raises:
+        wavy.WaveValueError: If the stream is neither a file on disk nor in
+            memory.
+
+    """
+    if isinstance(stream, MemoryStream):
+        return len(stream.getbuffer())
+    try:
+        file_stat = os.fstat(stream.fileno())
+    except (OSError, ValueError):
+        # pipes wrapped in a ForwardStream have no file descriptor
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+        raise wavy.WaveValueError(
+            'mmap requires a file on disk or in memory.')
+    return file_stat.st_size
+
+
+def map_data_from_chunk(stream, chunk, format, handler, start=0, stop=None,
+                        channels=None, dtype=None):
     """
+    Map data from data chunk into memory without reading it.
+
+    Args:
+        stream: Byte stream (must be a file on disk or in memory).
+        chunk: Data chunk.
+        format: File format information.
+        start: First frame to map.
+        stop: Frame at which to stop mapping (None for the end of the data).
+        channels: Indexes of the channels to read (None for all of them).
+        dtype: The dtype to convert the data to (None to keep it as it is).
+
+    Returns:
+        numpy.memmap: Read-only data mapped from the file (or a view of the
+        data for in-memory streams). If channels or dtype are given, the
+        selected channels are converted from the mapped data into a new array
+        instead.
+
+    Raises:
+        wavy.WaveFileNotSupported: If the sample width cannot be mapped.
+        wavy.WaveValueError: If the stream is neither a file on disk nor in
+            memory.
+        wavy.WaveFileIsCorrupted: If the file (or in-memory file) is shorter
+            than the data chunk.
+
+    """
+    # get size of data
+    size = chunk.size
+
+    # this gives us the number of frames
+    check_data_size(size, format)
+
+    # number of bytes for data type to be mapped
+    n_bytes = format.wBitsPerSample // 8
+
+    # 24 bit samples need decoding so cannot be used as they are on disk
+    if n_bytes % 3 == 0:
+        raise wavy.WaveFileNotSupported(
+            f"Memory mapping is not supported for {format.wBitsPerSample} "
+            f"bits.")
+
+    # only files on disk or in memory can be mapped
+    file_size = get_mapped_size(stream)
+
+    is_float = format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT
+    file_dtype = handler.get_dtype(n_bytes, is_float)
+
+    # restrict the mapped region to the requested frames
+    if stop is None:
+        stop = size // format.nBlockAlign
+    size = (stop - start) * format.nBlockAlign
+
+    # numpy cannot map an empty region
+    if not size:
+        return numpy.empty(0, dtype=file_dtype)
+
+    offset = chunk.offset + start * format.nBlockAlign
+
+    # files cut short (e.g. by a crashed recorder) cannot be mapped
+    if offset + size > file_size:
+        raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
+
+    if isinstance(stream, MemoryStream):
+        # in-memory data is already mapped, just use it
+        data = numpy.frombuffer(stream.getbuffer(), dtype=file_dtype,
+                                count=size // n_bytes, offset=offset)
+    else:
+        data = numpy.memmap(stream, dtype=file_dtype, mode='r', offset=offset,
+                            shape=(size // n_bytes,))
+
+    if channels is not None:
+        # copy the selected channels with strided views of the map
+        data = data.reshape(-1, format.nChannels)
+        out = numpy.empty((data.shape[0], len(channels)),
+                          dtype=handler.get_data_dtype(n_bytes, is_float)
+                          if dtype is None else dtype)
+        for i, channel in enumerate(channels):
+            convert_samples(data[:, channel], out[:, i], n_bytes, is_float,
+                            dtype)
+        return out.reshape(-1) if len(channels) == 1 else out
+
+    if dtype is not None:
+        out = numpy.empty(data.shape, dtype=dtype)
+        convert_samples(data, out, n_bytes, is_float, dtype)
+        data = out
+
+    return reshape_data(data, format)
+
+
+def read_frames_into(stream, format, handler, n_frames, out, channels=None,
+                     dtype=None):
+    """
+    Read frames from the stream into an existing array.
+
+    Args:
+        stream: Byte stream, positioned at the first frame.
+        format: File format information.
+        handler: StreamHandler for the stream.
+        n_frames: Number of frames to read.
+        out: Contiguous array of shape (n_frames, n_channels) where to store
+            the data, with n_channels the number of selected channels.
+        channels: Indexes of the channels to read (None for all of them).
+        dtype: The dtype to convert the data to (None to keep it as it is).
+
+    """
+    n_bytes = format.wBitsPerSample // 8
+    is_float = format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT
+
+    if channels is not None:
+        handler.read_channels(stream, n_frames, n_bytes, is_float,
+                              format.nChannels, channels, out, dtype)
+    elif dtype is None and n_bytes % 3 != 0:
+        # samples are read as they are, then swapped in place if needed
+        read_into(stream, out)
+        if not numpy.dtype(handler.get_dtype(n_bytes, is_float)).isnative:
+            out.byteswap(inplace=True)
+    else:
+        # all samples are decoded as if they were a single channel
+        handler.read_channels(stream, out.size, n_bytes, is_float, 1, [0],
+                              out.reshape(-1, 1), dtype)
+
+
+def read_data_parallel(fd, format, data_range):
+    """
+    Read a range of frames from the data chunk using a pool of threads. The
+    frames are split into ranges, each one read with positional reads into
+    its slice of the output array and decoded by one of the workers.
+
+    Args:
+        fd: File descriptor of the file.
+        format: File format information.
+        data_range: Data chunk and range of frames to read.
+
+    Returns:
+        numpy.array: Data read from chunk.
+
+    """
+    chunk, handler = data_range.chunk, data_range.handler
+    channels, dtype = data_range.channels, data_range.dtype
+
+    # this gives us the number of frames
+    check_data_size(chunk.size, format)
+
+    n_bytes = format.wBitsPerSample // 8
+    is_float = format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT
+    n_channels = format.nChannels if channels is None else len(channels)
+    n_frames = data_range.stop - data_range.start
+
+    out = numpy.empty((n_frames, n_channels),
+                      dtype=handler.get_data_dtype(n_bytes, is_float)
+                      if dtype is None else dtype)
+
+    # split frames into ranges, large enough to keep the reads efficient
+    n_range = max(
+        -(-n_frames // (data_range.workers * N_RANGES_PER_WORKER)),
+        MIN_RANGE_SIZE // format.nBlockAlign, 1)
+
+    def read_range(start):
+        stop = min(start + n_range, n_frames)
+        stream = PositionalStream(fd, chunk.offset + (data_range.start +
+                                                      start) *
+                                  format.nBlockAlign)
+        read_frames_into(stream, format, handler, stop - start,
+                         out[start:stop], channels, dtype)
+
+    starts = range(0, n_frames, n_range)
+    if len(starts) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+                min(data_range.workers, len(starts))) as executor:
+            # consume the results to raise any error
+            for _ in executor.map(read_range, starts):
+                pass
+    elif starts:
+        read_range(0)
+
+    return out.reshape(-1) if n_channels == 1 else out
+
+
+def read_data_range(stream, format, data_range):
+    """
+    Read (or map) a range of frames from the data chunk.
+
+    Args:
+        stream: Byte stream.
+        format: File format information.
+        data_range: Data chunk and range of frames to read.
+
+    Returns:
+        numpy.array: Data read from chunk.
+
+    """
+    if data_range.mmap:
+        return map_data_from_chunk(stream, data_range.chunk, format,
+                                   data_range.handler, data_range.start,
+                                   data_range.stop, data_range.channels,
+                                   data_range.dtype)
+    # files on disk can be read by many workers at once
+    fd = get_file_descriptor(stream) if data_range.workers else None
+    if fd is not None:
+        return read_data_parallel(fd, format, data_range)
+    return get_data_from_chunk(stream, data_range.chunk, format,
+                               data_range.handler, data_range.start,
+                               data_range.stop, data_range.channels,
+                               data_range.dtype)
+
+
+def read_file_data_range(file, format, data_range):
+    """
+    Open the file again to read a range of frames from its data chunk.
+
+    Args:
+        file: Path to the file or in-memory file.
+        format: File format information.
+        data_range: Data chunk and range of frames to read.
+
+    Returns:
+        numpy.array: Data read from chunk.
+
+    """
+    with get_stream_from_file(file, 'rb', io.BufferedReader) as stream:
+        return read_data_range(stream, format, data_range)
+
+
+def read_header(stream, trailing_chunks=True, metadata=None):
+    """
+    Read the stream up to the start of the data chunk, and the chunks after
+    the data chunk if the stream is seekable.
 
     Args:
         stream: Byte stream
-        read_data: Whether to read the file data or stop at the header.
+        trailing_chunks: Whether to read the chunks after the data chunk, the
+            stream is then not positioned at the data.
+        metadata: Dictionary where to store the bext, iXML, cue, adtl and
+            smpl chunks, by chunk id (None to skip them).
 
     Returns:
-        tuple: (format, info, data) if read_data is True.
-        Otherwise (format, info, n_frames)
+        tuple: (handler, format, info, data_chunk)
 
     """
     # check head chunk is valid
     handler = get_stream_handler(stream)
+    # walk through the chunks after the head chunk
+    chunks = iter_chunks(stream, handler)
     # get file format from chunk
-    format = get_fmt_chunk(stream, handler)
+    format = get_fmt_chunk(stream, handler, chunks)
     # make sure format info is correct
     check_format_info(format)
     # create info dict to store optional info
     info_tags = {}
     # get data chunk
-    data_chunk = get_data_chunk(stream, info_tags)
+    data_chunk = get_data_chunk(stream, handler, chunks, info_tags, metadata)
+    # tags are often written after the data, skip it to find them
+    if trailing_chunks and stream.seekable():
+        read_trailing_chunks(stream, handler, chunks, info_tags, metadata)
     # build info obj from tags (if any was found)
     info = get_info_from_tags_dict(info_tags) \
         if info_tags else None
 
+    return handler, format, info, data_chunk
+
+
+def read_chunk_table(stream):
+    """
+    Read the id, offset and size of all top-level chunks in the stream. Only
+    the chunk headers are read, the stream is moved past the data of each
+    chunk by seeking.
+
+    Args:
+        stream: Byte stream.
+
+    Returns:
+        list: ChunkInfo for each chunk (including ds64 for RF64 and BW64
+        files and the chunks after the data chunk if the stream is
+        seekable).
+
+    """
+    start = stream.tell()
+    # check head chunk is valid (and read the 64 bit sizes, if any)
+    handler = get_stream_handler(stream)
+    # go back to the first chunk, so that ds64 is listed as well
+    stream.seek(start + MASTER_CHUNK_SIZE)
+
+    table = []
+    for chunk in iter_chunks(stream, handler):
+        table.append(chunk)
+        # chunks after the data cannot be reached without reading it all
+        if chunk.id == DATA and not stream.seekable():
+            break
+    return table
+
+
+def read_blocks(stream, blocksize, overlap=0, out=None, channels=None,
+                dtype=None):
+    """
+    Read the data chunk one block of frames at the time.
+
+    Args:
+        stream: Byte stream
+        blocksize: Number of frames in each block.
+        overlap: Number of frames shared by consecutive blocks.
+        out: Array where to store each block, a new array is created for
+            each block if None.
+        channels: Indexes of the channels to read (None for all of them).
+        dtype: The dtype to convert the data to (None to keep it as it is).
+
+    Yields:
+        numpy.array: Block of data, the last one is padded with zeros.
+
+    Raises:
+        wavy.WaveValueError: If the block arguments are not valid.
+
+    """
+    if blocksize <= 0 or not 0 <= overlap < blocksize:
+        raise wavy.WaveValueError(
+            "Argument 'blocksize' must be positive and greater than "
+            "'overlap'.")
+
+    # data is read from the current position, tags are not needed
+    handler, format, info, data_chunk = read_header(stream,
+                                                    trailing_chunks=False)
+
+    # get size of data
+    size = data_chunk.size
+
+    # this gives us the number of frames
+    check_data_size(size, format)
+
+    # number of bytes for data type to be parsed
+    n_bytes = format.wBitsPerSample // 8
+    is_float = format.wFormatTag == WAVE_FORMAT_IEEE_FLOAT
+
+    channels = get_channels(format, channels)
+    n_channels = format.nChannels if channels is None else len(channels)
+    dtype = get_conversion_dtype(format, handler, dtype)
+
+    shape = (blocksize,) if n_channels == 1 else (blocksize, n_channels)
+
+    if out is None:
+        # reuse one buffer and return copies of it
+        buffer = numpy.empty(shape, handler.get_data_dtype(n_bytes, is_float)
+                             if dtype is None else dtype)
+    elif out.shape == shape:
+        buffer = out
+    else:
+        raise wavy.WaveValueError(
+            f"Argument 'out' must be of shape {shape}.")
+
+    n_frames = size // format.nBlockAlign
+    # number of frames already read and currently stored in buffer
+    n_read, n_filled = 0, 0
+
+    while n_read < n_frames:
+        # only read the frames that are not carried over from last block
+        n = min(blocksize - n_filled, n_frames - n_read)
+        if channels is not None:
+            # decode the selected channels straight into the buffer
+            block = buffer[n_filled:n_filled + n]
+            handler.read_channels(stream, n, n_bytes, is_float,
+                                  format.nChannels, channels,
+                                  block if block.ndim == 2 else block[:, None],
+                                  dtype)
+        else:
+            data = handler.read_data(stream, n * format.nBlockAlign, n_bytes,
+                                     is_float, dtype)
+            buffer[n_filled:n_filled + n] = reshape_data(data, format)
+        n_read += n
+        n_filled += n
+        # pad the last block
+        buffer[n_filled:] = 0
+
+        yield buffer if out is not None else buffer.copy()
+
+        # carry over the overlap to the next block
+        buffer[:overlap] = buffer[blocksize - overlap:]
+        n_filled = overlap
+
+
+def read_stream(stream, read_data=True, mmap=False, start=None, stop=None,
+                in_seconds=False, lazy=False, channels=None, dtype=None,
+                workers=None, metadata=None, region=None):
+    """
+
+    Args:
+        stream: Byte stream
+        read_data: Whether to read the file data or stop at the header.
+        mmap: Whether to map the file data into memory instead of reading it.
+        start: First frame (or second) to read, None to read from the start.
+        stop: Frame (or second) at which to stop reading, None to read to the
+            end.
+        in_seconds: Whether start and stop are given in seconds.
+        lazy: Whether to return the range of data to read instead of the
+            data itself.
+        channels: Indexes of the channels to read, None to read all of them.
+        dtype: The dtype to convert the data to, None to keep it as it is.
+        workers: Number of threads reading the data, None to read it in the
+            calling thread.
+        metadata: Dictionary where to store the bext, iXML, cue, adtl and
+            smpl chunks, by chunk id (None to skip them).
+        region: Label (str) or cue point id (int) of the region to read,
+            instead of start and stop.
+
+    Returns:
+        tuple: (format, info, data) if read_data is True, (format, info,
+        data_range) if lazy is True. Otherwise (format, info, n_frames)
+
+    """
+    # regions are found with the cue points
+    if region is not None and metadata is None:
+        metadata = {}
+
+    handler, format, info, data_chunk = read_header(stream, metadata=metadata)
+
     if not read_data:
         # stop here and return info
-        return format, info, data_chunk.getsize()
+        return format, info, data_chunk.size
+
+    # work out which frames to read
+    if region is not None:
+        start, stop = get_region_range(get_regions(metadata), region,
+                                       data_chunk.size // format.nBlockAlign)
+    else:
+        start, stop = get_frame_range(format, data_chunk.size, start, stop,
+                                      in_seconds)
+
+    data_range = DataRange(chunk=data_chunk, handler=handler, start=start,
+                           stop=stop, mmap=mmap,
+                           channels=get_channels(format, channels),
+                           dtype=get_conversion_dtype(format, handler, dtype),
+                           workers=get_parallel_workers(workers))
+
+    if lazy:
+        # data is read later on
+        return format, info, data_range
 
     # parse data from chunk
-    data = get_data_from_chunk(data_chunk, format, handler)
-
-    return format, info, data
+    return format, info, read_data_range(stream, format, data_range)
@@ -1,5 +1,8 @@
+import io
 import numpy
 import struct
+import wavy
+from .memory_stream import *
 
 # prefixes for flagging endianness to struct reader/writer
 # little endian
@@ -7,6 +10,18 @@ LE_PREFIX = '<'
 # big endian
 BE_PREFIX = '>'
 
+# chunk headers (id and size) for each endianness
+CHUNK_HEADERS = {
+    LE_PREFIX: struct.Struct(LE_PREFIX + '4sL'),
+    BE_PREFIX: struct.Struct(BE_PREFIX + '4sL')
+}
+
+# number of samples unpacked at the time for 24 and 48 bit
+UNPACK_BLOCK_SIZE = 16384
+
+# number of bytes read at the time when selecting channels
+CHANNELS_BLOCK_SIZE = 2 ** 20
+
 
 class StreamHandler(object):
     """
@@ -23,6 +38,10 @@ class StreamHandler(object):
         # set prefix for read / write
         self.endian_prefix = \
             LE_PREFIX if little_endian else BE_PREFIX
+        # precompiled struct for chunk headers
+        self.chunk_header = CHUNK_HEADERS[self.endian_prefix]
+        # 64 bit sizes of the chunks that do not fit 32 bits (RF64 / BW64)
+        self.chunk_sizes = {}
 
     def read(self, format, stream, offset=0):
         """
@@ -39,33 +58,105 @@ class StreamHandler(object):
         """
         return struct.unpack_from(self.endian_prefix + format, stream, offset)
 
-    def read_data(self, stream, size, n_bytes, is_float):
+    def write(self, format, stream, *values):
         """
-        Read data from stream as a numpy array.
+        Write values to stream using builtins.struct.pack.
+
+        Args:
+            format: The format of the values.
+            stream: The stream to write to.
+            *values: The values to write.
+
+        """
+        stream.write(struct.pack(self.endian_prefix + format, *values))
+
+    def read_data(self, stream, size, n_bytes, is_float, dtype=None):
+        """
+        Read data from stream as a numpy array. The data is read straight into
+        the returned array and converted in place, without intermediate
+        copies.
+
         Args:
             stream: Stream to read from.
             size: Size of the data to read.
             n_bytes: The number of bytes for each data chunk.
+            is_float: Whether the samples are floating point.
+            dtype: The numpy dtype to convert the samples to (see
+                convert_samples), None to keep them as they are.
 
         Returns:
-            numpy.array: Array containing the read data.
+            numpy.array: Array containing the read data (native byte order,
+            unless it is a view of an in-memory stream).
 
         """
+        if dtype is not None:
+            # samples are converted block by block into the returned array
+            return self.read_channels(stream, size // n_bytes, n_bytes,
+                                      is_float, 1, [0], dtype=dtype) \
+                .reshape(-1)
         # the byte size is supported so we use numpy
-        if n_bytes % 3 != 0:
-            # float is always f
-            if is_float:
-                type = 'f'
-            else:
-                # if 8 bits is unsigned, otherwise signed
-                type = 'i' if n_bytes > 1 else 'u'
-            # compose dtype for parsing data
-            dtype = f"{self.endian_prefix}{type}{n_bytes}"
-            # use numpy from string to read data
-            return numpy.fromstring(stream.read(size), dtype=dtype)
+        if n_bytes % 3 != 0 and isinstance(stream, MemoryStream):
+            if stream.tell() + size > len(stream.getbuffer()):
+                raise wavy.WaveFileIsCorrupted(
+                    'Reached end of file prematurely.')
+            # in-memory data can be used as it is, without copying
+            data = numpy.frombuffer(stream.getbuffer(),
+                                    dtype=self.get_dtype(n_bytes, is_float),
+                                    count=size // n_bytes,
+                                    offset=stream.tell())
+            stream.seek(size, io.SEEK_CUR)
+            return data
+        elif n_bytes % 3 != 0:
+            data = numpy.empty(size // n_bytes,
+                               dtype=self.get_dtype(n_bytes, is_float))
+            read_into(stream, data)
+            # swap bytes in place to get native byte order
+            if not data.dtype.isnative:
+                data = data.byteswap(inplace=True) \
+                    .view(data.dtype.newbyteorder('='))
+            return data
         else:
             return self.read_data_for_unsupported_dtype(stream, size, n_bytes)
 
+    def get_dtype(self, n_bytes, is_float):
+        """
+        Get the numpy dtype matching the samples in the stream.
+
+        Args:
+            n_bytes: The number of bytes for each data chunk.
+            is_float: Whether the samples are floating point.
+
+        Returns:
+            str: The numpy dtype (with endianness) for the samples.
+
+        """
+        # float is always f
+        if is_float:
+            type = 'f'
+        else:
+            # if 8 bits is unsigned, otherwise signed
+            type = 'i' if n_bytes > 1 else 'u'
+        # compose dtype for parsing data
+        return f"{self.endian_prefix}{type}{n_bytes}"
+
+    def get_data_dtype(self, n_bytes, is_float):
+        """
+        Get the numpy dtype of the data returned by read_data, in native byte
+        order.
+
+        Args:
+            n_bytes: The number of bytes for each data chunk.
+            is_float: Whether the samples are floating point.
+
+        Returns:
+            numpy.dtype: The numpy dtype for the read data.
+
+        """
+        # 24 and 48 bit are stored in the next int supported by numpy
+        if n_bytes % 3 == 0:
+            return numpy.dtype(f"i{n_bytes + 4 - n_bytes % 4}")
+        return numpy.dtype(self.get_dtype(n_bytes, is_float)).newbyteorder('=')
+
     def read_data_for_unsupported_dtype(self, stream, size, n_bytes):
         """
         Read data from stream as a numpy array for 24 and 48 bit int
@@ -80,15 +171,167 @@ class StreamHandler(object):
             numpy.array: Array containing the read data.
 
         """
-        # we need to add some padding so that we can read the bytes
+        # we need to add some padding so that each sample fits a numpy int
         n_padding = (4 - n_bytes % 4)
-        padding = n_padding * b'\x00'
-        # go through the data manually with for loop
-        data = []
-        for _ in range(size // n_bytes):
-            # need to pad depending on the endianness
-            data += self.read('i' if n_bytes == 3 else 'q',
-                              stream.read(n_bytes) + padding if self.little_endian else
-                              padding + stream.read(n_bytes))
-        # convert to numpy array
-        return numpy.array(data, dtype=numpy.dtype('i{}'.format(n_bytes + n_padding)))
+        width = n_bytes + n_padding
+        n_samples = size // n_bytes
+
+        data = numpy.empty(n_samples, dtype=f"i{width}")
+        if not n_samples:
+            return data
+
+        # read the data into the output array itself, leaving room for the
+        # padding either before (little endian) or after (big endian)
+        buffer = data.view(numpy.uint8)
+        start = n_padding if self.little_endian else 0
+        read_into(stream, buffer[start:start + size])
+
+        # view the bytes as overlapping wider ints, one every n_bytes, so that
+        # each sample ends up in the most significant bytes of its int
+        raw = numpy.ndarray(shape=(n_samples,),
+                            dtype=f"{self.endian_prefix}i{width}",
+                            buffer=buffer, strides=(n_bytes,))
+
+        # unpack from the end, each block only overwrites bytes of samples
+        # already unpacked, and arithmetic shift sign extends each sample
+        for stop in range(n_samples, 0, -UNPACK_BLOCK_SIZE):
+            start = max(0, stop - UNPACK_BLOCK_SIZE)
+            data[start:stop] = raw[start:stop] >> (8 * n_padding)
+
+        return data
+
+    def read_channels(self, stream, n_frames, n_bytes, is_float, n_channels,
+                      channels, out=None, dtype=None):
+        """
+        Read only some of the channels of the data from stream as a numpy
+        array. Frames are read one block at the time and the selected samples
+        are copied out of each block with strided views, so that only the
+        selected channels are decoded and stored.
+
+        Args:
+            stream: Stream to read from.
+            n_frames: Number of frames to read.
+            n_bytes: The number of bytes for each data chunk.
+            is_float: Whether the samples are floating point.
+            n_channels: Number of channels in each frame.
+            channels: Indexes of the channels to read.
+            out: Array of shape (n_frames, len(channels)) where to store the
+                data, a new array is created if None.
+            dtype: The numpy dtype to convert the samples to (see
+                convert_samples), None to keep them as they are.
+
+        Returns:
+            numpy.array: Array of shape (n_frames, len(channels)) containing
+            the read data (native byte order).
+
+        """
+        if out is None:
+            out = numpy.empty((n_frames, len(channels)),
+                              dtype=self.get_data_dtype(n_bytes, is_float)
+                              if dtype is None else dtype)
+
+        # 24 and 48 bit samples are viewed as wider ints, as when reading all
+        # channels, which needs some spare bytes around the frames
+        n_padding = (4 - n_bytes % 4) if n_bytes % 3 == 0 else 0
+        raw_dtype = self.get_dtype(n_bytes + n_padding, is_float)
+
+        block_align = n_bytes * n_channels
+        n_block = max(1, CHANNELS_BLOCK_SIZE // block_align)
+        buffer = numpy.zeros(min(n_block, n_frames) * block_align +
+                             2 * n_padding, dtype=numpy.uint8)
+
+        # offset of each sample in its frame, the padding bytes are before
+        # the sample (little endian) or after it (big endian)
+        offsets = [n_padding + channel * n_bytes -
+                   (n_padding if self.little_endian else 0)
+                   for channel in channels]
+
+        for start in range(0, n_frames, n_block):
+            n = min(n_block, n_frames - start)
+            read_into(stream, buffer[n_padding:n_padding + n * block_align])
+
+            for i, offset in enumerate(offsets):
+                raw = numpy.ndarray(shape=(n,), dtype=raw_dtype,
+                                    buffer=buffer, offset=offset,
+                                    strides=(block_align,))
+                convert_samples(raw, out[start:start + n, i], n_bytes,
+                                is_float, dtype, n_padding)
+
+        return out
+
+
+def convert_samples(raw, out, n_bytes, is_float, dtype=None, n_padding=0):
+    """
+    Convert samples into out. Integer samples converted to float are scaled
+    to [-1, 1) and integer samples converted to int16 keep their most
+    significant bits. Float samples converted to int16 are scaled from
+    [-1, 1) and clipped.
+
+    Args:
+        raw: Samples as stored in the stream, in any byte order. Samples of
+            24 and 48 bit are stored in the most significant bytes of wider
+            ints, followed by n_padding bytes of garbage.
+        out: Array where to store the samples.
+        n_bytes: The number of bytes for each sample.
+        is_float: Whether the samples are floating point.
+        dtype: The numpy dtype to convert the samples to, None to keep them
+            as they are (only removing the padding).
+        n_padding: Number of bytes of garbage after each sample.
+
+    """
+    if dtype is None:
+        # assignment also converts to native byte order
+        out[...] = raw >> (8 * n_padding) if n_padding else raw
+    elif is_float and dtype.kind == 'f':
+        out[...] = raw
+    elif is_float:
+        out[...] = numpy.clip(raw * 2 ** 15, -2 ** 15, 2 ** 15 - 1)
+    elif n_bytes == 1:
+        # 8 bit samples are unsigned, centered at 128
+        numpy.subtract(raw, 128, out=out, dtype=dtype)
+        if dtype.kind == 'f':
+            out *= 2.0 ** -7
+        else:
+            out <<= 8
+    elif dtype.kind == 'f':
+        if n_padding:
+            raw = raw >> (8 * n_padding)
+        numpy.multiply(raw, 2.0 ** (1 - 8 * n_bytes), out=out, dtype=dtype)
+    else:
+        # padding is also shifted out
+        numpy.right_shift(raw, 8 * (n_bytes + n_padding) - 16, out=out,
+                          casting='unsafe')
+
+
+def read_into(stream, buffer):
+    """
+    Fill buffer with data read from stream, without intermediate copies if
+    the stream supports readinto.
+
+    Args:
+        stream: Stream to read from.
+        buffer: Buffer (or numpy.array) to fill.
+
+    Raises:
+        wavy.WaveFileIsCorrupted: If the stream ends before buffer is full.
+
+    """
+    view = memoryview(buffer).cast('B')
+    size = len(view)
+
+    # fall back to read for streams that do not support readinto
+    if not hasattr(stream, 'readinto'):
+        data = stream.read(size)
+        view[:len(data)] = data
+        n_read = len(data)
+    else:
+        n_read = 0
+        # readinto can return less than requested
+        while n_read < size:
+            n = stream.readinto(view[n_read:])
+            if not n:
+                break
+            n_read += n
+
+    if n_read != size:
+        raise wavy.WaveFileIsCorrupted('Reached end of file prematurely.')
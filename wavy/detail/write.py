@@ -0,0 +1,488 @@
+import collections
+import io
+import numpy
+import wavy
+from .chunks import *
+from .common import *
+from .read import get_stream_handler
+
+HeaderLayout = collections.namedtuple('HeaderLayout', [
+    'data_offset',
+    'ds64_offset',
+    'fact_offset'
+])
+
+# formats that can be written
+FORMAT_TAGS = {
+    'pcm': WAVE_FORMAT_PCM,
+    'float': WAVE_FORMAT_IEEE_FLOAT
+}
+
+# sub format GUID of extensible files, after the format tag
+SUB_FORMAT_GUID = b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+# size of fmt chunk for each kind of format
+FMT_PCM_SIZE = 16
+FMT_NON_PCM_SIZE = 18
+FMT_EXTENSIBLE_SIZE = 40
+
+# number of bytes converted at the time when data cannot be written as it is
+WRITE_BLOCK_SIZE = 2 ** 20
+
+
+def get_format_tag(format, sample_width):
+    """
+    Get the format tag for the format name.
+
+    Args:
+        format: Name of the format ('pcm' or 'float').
+        sample_width: Sample width in bits.
+
+    Returns:
+        int: The format tag.
+
+    Raises:
+        wavy.WaveValueError: If the format or sample width is not supported.
+
+    """
+    if format not in FORMAT_TAGS:
+        raise wavy.WaveValueError(
+            f"Argument 'format' must be one of {', '.join(FORMAT_TAGS)}.")
+
+    format_tag = FORMAT_TAGS[format]
+
+    if sample_width not in SUPPORTED_SAMPLE_WIDTH_FOR_FORMAT[format_tag]:
+        raise wavy.WaveValueError(
+            f"Sample width '{sample_width}' is not supported for format "
+            f"'{format}'.")
+
+    return format_tag
+
+
+def check_data_format(data, sample_width, format_tag, n_channels):
+    """
+    Check that the data can be written to a file.
+
+    Args:
+        data: The data array.
+        sample_width: Sample width in bits.
+        format_tag: Format tag of the file.
+        n_channels: Number of channels of the file.
+
+    Raises:
+        wavy.WaveValueError: If the data cannot be written to the file.
+
+    """
+    # check data is numpy array
+    if not isinstance(data, numpy.ndarray):
+        raise wavy.WaveValueError(
+            "Argument 'data' must be of type numpy.ndarray.")
+
+    # mono data can also be one dimensional
+    if data.shape[1:] != (n_channels,) and \
+            (data.ndim != 1 or n_channels != 1):
+        raise wavy.WaveValueError(
+            f"Argument 'data' must be of shape (n_frames, {n_channels}).")
+
+    # check that sample width is supported for data dtype
+    check_sample_width_supported(sample_width, data.dtype)
+
+    # float data is only written as float
+    if (data.dtype.kind == 'f') != (format_tag == WAVE_FORMAT_IEEE_FLOAT):
+        raise wavy.WaveValueError(
+            f"Data array dtype '{data.dtype}' is not supported for the "
+            f"format.")
+
+
+def get_list_chunk_data(tags, handler):
+    """
+    Get the content of the LIST chunk storing the tags.
+
+    Args:
+        tags: The Tags.
+        handler: StreamHandler for the stream.
+
+    Returns:
+        bytes: The chunk data (after its size), or None if all tags are empty.
+
+    """
+    data = io.BytesIO()
+    data.write(INFO)
+
+    for key, prop in TAGS_TO_PROPS.items():
+        value = getattr(tags, prop)
+        if not value:
+            continue
+        # strings are null terminated and padded to an even size
+        value = value.encode() + b'\x00'
+        handler.write('4sL', data, key.encode(), len(value))
+        data.write(value + b'\x00' * (len(value) % 2))
+
+    return data.getvalue() if data.tell() > len(INFO) else None
+
+
+def write_header(stream, handler, format_tag, sample_width, framerate,
+                 n_channels, extensible=False, rf64=False, tags=None):
+    """
+    Write the chunks of the file up to the data, with all sizes set to zero.
+
+    Args:
+        stream: The stream to write to.
+        handler: StreamHandler for the stream.
+        format_tag: Format tag of the samples.
+        sample_width: Sample width in bits.
+        framerate: Sampling frequency in Hz.
+        n_channels: Number of channels.
+        extensible: Whether to write the extensible format.
+        rf64: Whether to write a RF64 file, with sizes in a ds64 chunk.
+        tags: Tags written in a LIST chunk before the data.
+
+    Returns:
+        HeaderLayout: Position of the chunks with sizes to update.
+
+    Raises:
+        wavy.WaveValueError: If a RF64 file is not little endian.
+
+    """
+    if rf64 and not handler.little_endian:
+        raise wavy.WaveValueError("RF64 files must be little endian.")
+
+    block_align = n_channels * sample_width // 8
+    position = stream.tell()
+
+    # sizes of RF64 files are in the ds64 chunk
+    size = MAX_CHUNK_SIZE if rf64 else 0
+
+    stream.write(RF64 if rf64 else RIFF if handler.little_endian else RIFX)
+    handler.write('L', stream, size)
+    stream.write(WAVE)
+
+    ds64_offset = None
+    if rf64:
+        handler.write('4sL', stream, DS64, DS64_SIZE)
+        ds64_offset = stream.tell()
+        handler.write('QQQL', stream, 0, 0, 0, 0)
+
+    if extensible:
+        fmt_size = FMT_EXTENSIBLE_SIZE
+    elif format_tag == WAVE_FORMAT_PCM:
+        fmt_size = FMT_PCM_SIZE
+    else:
+        fmt_size = FMT_NON_PCM_SIZE
+
+    handler.write('4sLHHLLHH', stream, FMT, fmt_size,
+                  WAVE_FORMAT_EXTENSIBLE if extensible else format_tag,
+                  n_channels, framerate, framerate * block_align, block_align,
+                  sample_width)
+
+    if extensible:
+        # all bits are valid, no channel mask
+        handler.write('HHLH', stream, 22, sample_width, 0, format_tag)
+        stream.write(SUB_FORMAT_GUID)
+    elif format_tag != WAVE_FORMAT_PCM:
+        handler.write('H', stream, 0)
+
+    # formats other than PCM need the number of frames in a fact chunk
+    fact_offset = None
+    if extensible or format_tag != WAVE_FORMAT_PCM:
+        handler.write('4sL', stream, FACT, 4)
+        fact_offset = stream.tell()
+        handler.write('L', stream, 0)
+
+    list_data = get_list_chunk_data(tags, handler) if tags else None
+    if list_data:
+        handler.write('4sL', stream, LIST, len(list_data))
+        stream.write(list_data)
+
+    handler.write('4sL', stream, DATA, size)
+
+    # offsets are relative to the start of the file
+    return HeaderLayout(
+        data_offset=stream.tell() - position,
+        ds64_offset=None if ds64_offset is None else ds64_offset - position,
+        fact_offset=None if fact_offset is None else fact_offset - position)
+
+
+def update_header(stream, handler, layout, data_size, n_frames, start=0):
+    """
+    Update the sizes in the header, the stream is then moved back to its
+    position.
+
+    Args:
+        stream: The stream to write to (must be seekable).
+        handler: StreamHandler for the stream.
+        layout: Position of the chunks with sizes to update.
+        data_size: Size of the data written so far.
+        n_frames: Number of frames written so far.
+        start: Position of the file in the stream.
+
+    """
+    position = stream.tell()
+
+    # size after RIFF id and size, including the padding of the data
+    riff_size = layout.data_offset - CHUNK_HEADER_SIZE + data_size + \
+        data_size % 2
+
+    if layout.ds64_offset is not None:
+        stream.seek(start + layout.ds64_offset)
+        handler.write('QQQ', stream, riff_size, data_size, n_frames)
+    else:
+        stream.seek(start + 4)
+        handler.write('L', stream, riff_size)
+        stream.seek(start + layout.data_offset - 4)
+        handler.write('L', stream, data_size)
+
+    if layout.fact_offset is not None:
+        stream.seek(start + layout.fact_offset)
+        handler.write('L', stream, min(n_frames, MAX_CHUNK_SIZE))
+
+    stream.seek(position)
+
+
+def get_packed_24_bit_dtype(little_endian):
+    """
+    Get the dtype of packed 24 bit samples, made of the two least significant
+    bytes and the most significant byte of each sample.
+
+    Args:
+        little_endian: Whether the samples are little endian.
+
+    Returns:
+        numpy.dtype: Structured dtype with an itemsize of 3 bytes.
+
+    """
+    return numpy.dtype({
+        'names': ['low', 'high'],
+        'formats': ['<u2' if little_endian else '>u2', 'i1'],
+        'offsets': [0, 2] if little_endian else [1, 0],
+        'itemsize': 3
+    })
+
+
+def pack_24_bit(data, little_endian, out=None):
+    """
+    Pack int32 samples into 3 bytes each, only the 24 least significant bits
+    of each sample are kept.
+
+    Args:
+        data: Array of int32 samples.
+        little_endian: Whether to pack the samples as little endian.
+        out: Array where to store the packed samples, of the same shape as
+            data and dtype returned by get_packed_24_bit_dtype.
+
+    Returns:
+        numpy.array: Array of the packed bytes, of shape data.shape + (3,).
+
+    """
+    if out is None:
+        out = numpy.empty(data.shape, get_packed_24_bit_dtype(little_endian))
+
+    # each field is a plain strided view, so both copies are vectorized
+    numpy.copyto(out['low'], data, casting='unsafe')
+    numpy.right_shift(data, 16, out=out['high'], casting='unsafe')
+
+    return out.view(numpy.uint8).reshape(data.shape + (3,))
+
+
+def iter_packed_24_bit(data, little_endian, block_size=WRITE_BLOCK_SIZE):
+    """
+    Pack int32 samples into 3 bytes each, one block of frames at the time.
+    The same buffer is reused for every block, so memory is bounded by the
+    block size.
+
+    Args:
+        data: Array of int32 samples.
+        little_endian: Whether to pack the samples as little endian.
+        block_size: Maximum size in bytes of each packed block.
+
+    Yields:
+        memoryview: The packed bytes of each block, only valid until the next
+            block is requested.
+
+    """
+    n_frames = len(data)
+    frame_size = 3 * (data.size // n_frames) if n_frames else 1
+    n_block = max(1, block_size // frame_size)
+
+    buffer = numpy.empty(min(n_block, n_frames) * (frame_size // 3),
+                         get_packed_24_bit_dtype(little_endian))
+
+    for start in range(0, n_frames, n_block):
+        block = data[start:start + n_block]
+        out = buffer[:block.size].reshape(block.shape)
+        yield memoryview(pack_24_bit(block, little_endian, out)).cast('B')
+
+
+def write_data(stream, handler, data, sample_width):
+    """
+    Write data to the stream. Contiguous data with the byte order of the
+    stream is written straight from the array buffer, other data is
+    converted one block at the time.
+
+    Args:
+        stream: The stream to write to.
+        handler: StreamHandler for the stream.
+        data: The data array.
+        sample_width: Sample width in bits.
+
+    """
+    if sample_width == 24:
+        for block in iter_packed_24_bit(data, handler.little_endian):
+            stream.write(block)
+        return
+
+    dtype = data.dtype.newbyteorder(handler.endian_prefix)
+
+    if data.dtype == dtype and data.flags.c_contiguous:
+        # no copy needed
+        stream.write(memoryview(data).cast('B'))
+        return
+
+    n_frames = len(data)
+    frame_size = data.itemsize * (data.size // n_frames) if n_frames else 1
+    n_block = max(1, WRITE_BLOCK_SIZE // frame_size)
+
+    for start in range(0, n_frames, n_block):
+        block = numpy.ascontiguousarray(data[start:start + n_block], dtype)
+        stream.write(memoryview(block).cast('B'))
+
+
+def get_chunk_end(chunk):
+    """
+    Get the position after a chunk, including its padding.
+
+    Args:
+        chunk: The chunk.
+
+    Returns:
+        int: Position of the next chunk.
+
+    """
+    return chunk.offset + chunk.size + chunk.size % 2
+
+
+def find_info_chunks(stream, chunks):
+    """
+    Find the LIST chunks that store tags.
+
+    Args:
+        stream: The stream to read.
+        chunks: List of the chunks in the stream.
+
+    Returns:
+        list: Indexes of the LIST/INFO chunks.
+
+    """
+    indexes = []
+    for index, chunk in enumerate(chunks):
+        if chunk.id == LIST and chunk.size >= 4:
+            stream.seek(chunk.offset)
+            if stream.read(4) == INFO:
+                indexes.append(index)
+    return indexes
+
+
+def get_tags_region(chunks, index):
+    """
+    Get the region taken by a LIST chunk and the filler chunks around it.
+
+    Args:
+        chunks: List of the chunks in the stream.
+        index: Index of the LIST chunk.
+
+    Returns:
+        tuple: (start, end) positions of the region.
+
+    """
+    first = last = index
+    while first > 0 and chunks[first - 1].id in FILLER_CHUNKS:
+        first -= 1
+    while last + 1 < len(chunks) and chunks[last + 1].id in FILLER_CHUNKS:
+        last += 1
+    return chunks[first].offset - CHUNK_HEADER_SIZE, get_chunk_end(chunks[last])
+
+
+def write_tags(stream, tags):
+    """
+    Replace the tags of the file in place. The new LIST chunk is written
+    over the existing one (and the filler chunks around it) if it fits, the
+    space left is then taken by a JUNK chunk. Otherwise the existing one is
+    turned into a JUNK chunk and the new one is appended at the end of the
+    file. The data is never read or moved.
+
+    Args:
+        stream: The stream to update (must be readable, writable and
+            seekable), positioned at the start of the file.
+        tags: The new Tags, None to remove them.
+
+    Raises:
+        wavy.WaveValueError: If the file would be too large for a RIFF file.
+
+    """
+    start = stream.tell()
+    handler = get_stream_handler(stream)
+
+    # go back to the first chunk, so that ds64 is listed as well
+    stream.seek(start + MASTER_CHUNK_SIZE)
+    chunks = list(iter_chunks(stream, handler))
+    end = get_chunk_end(chunks[-1]) if chunks else start + MASTER_CHUNK_SIZE
+
+    list_data = get_list_chunk_data(tags, handler) if tags else None
+    size = CHUNK_HEADER_SIZE + len(list_data) if list_data else 0
+
+    indexes = find_info_chunks(stream, chunks)
+    # no tags to remove
+    if not indexes and not size:
+        return
+
+    region = get_tags_region(chunks, indexes[0]) if indexes else None
+
+    if region and region[1] >= end:
+        # tags at the end of the file are rewritten whatever their size
+        position = end = region[0]
+    elif region and (size == region[1] - region[0] or
+                     size + CHUNK_HEADER_SIZE <= region[1] - region[0]):
+        position = region[0]
+    else:
+        position = None
+
+    # size of the file after the update
+    new_end = end + (size if position in (None, end) else 0)
+    riff_size = new_end - start - CHUNK_HEADER_SIZE
+    is_rf64 = bool(chunks) and chunks[0].id == DS64
+    if not is_rf64 and riff_size > MAX_CHUNK_SIZE:
+        raise wavy.WaveValueError("Tags do not fit in a RIFF file.")
+
+    # old tags are kept as filler chunks (of the same size)
+    for index in indexes:
+        stream.seek(chunks[index].offset - CHUNK_HEADER_SIZE)
+        stream.write(JUNK)
+
+    if position is not None and position != end:
+        # whole region becomes filler, the new tags are written over it
+        stream.seek(region[0])
+        handler.write('4sL', stream, JUNK,
+                      region[1] - region[0] - CHUNK_HEADER_SIZE)
+        if size:
+            stream.seek(region[0])
+            handler.write('4sL', stream, LIST, len(list_data))
+            stream.write(list_data)
+            if size < region[1] - region[0]:
+                handler.write('4sL', stream, JUNK,
+                              region[1] - region[0] - size -
+                              CHUNK_HEADER_SIZE)
+        return
+
+    stream.seek(end)
+    if size:
+        handler.write('4sL', stream, LIST, len(list_data))
+        stream.write(list_data)
+    stream.truncate(new_end)
+
+    # the file size changed
+    if is_rf64:
+        stream.seek(chunks[0].offset)
+        handler.write('Q', stream, riff_size)
+    else:
+        stream.seek(start + 4)
+        handler.write('L', stream, riff_size)
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import threading
+import wavy
+import wavy.detail
+
+
+class Index(object):
+    """
+    Class that caches information about WAVE files in an SQLite database.
+
+    Entries are keyed by the absolute path, size and modification time of
+    each file, so that they are invalidated as soon as the file changes. For
+    files already in the index, getting their information only costs a
+    call to os.stat.
+    """
+
+    @property
+    def path(self):
+        """
+        str: Path to the index file.
+        """
+        return self._path
+
+    def __init__(self, path):
+        """
+
+        Args:
+            path (str): Path to the index file, created if it does not exist.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        wavy.detail.init_index(self._connection)
+
+    def info(self, file):
+        """
+        Returns information about the audio file, from the index if the file
+        has not changed since it was stored.
+
+        Args:
+            file (str): Path to the file.
+
+        Returns:
+            WaveFileInfo: Information about the file.
+
+        """
+        path, size, mtime_ns = wavy.detail.get_file_key(file, os.stat(file))
+
+        with self._lock:
+            entry = self._connection.execute(
+                wavy.detail.SELECT_INDEX_ENTRY, (path,)).fetchone()
+
+        if entry and entry[:2] == (size, mtime_ns):
+            return wavy.detail.load_info(entry[2])
+
+        info = wavy.info(file)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                wavy.detail.INSERT_INDEX_ENTRY,
+                (path, size, mtime_ns, wavy.detail.dump_info(info)))
+
+        return info
+
+    def refresh(self, directory, workers=None):
+        """
+        Update the index for all WAVE files (.wav or .wave) in the directory
+        and its sub-directories. Only new or changed files are parsed, entries
+        for files that no longer exist in the directory are removed.
+
+        Args:
+            directory (str): Path to the directory.
+            workers (int): Number of threads used to parse the files, None
+                for the default.
+
+        Returns:
+            list: BatchResult for each file that could not be parsed.
+
+        """
+        prefix = os.path.join(os.path.abspath(directory), '')
+
+        with self._lock:
+            entries = {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in self._connection.execute(
+                    wavy.detail.SELECT_INDEX_ENTRIES)
+                if path.startswith(prefix)
+            }
+
+        # find new or changed files, one stat per file
+        changed = {}
+        for entry in wavy.detail.iter_wave_files(directory):
+            path, size, mtime_ns = \
+                wavy.detail.get_file_key(entry.path, entry.stat())
+            if entries.pop(path, None) != (size, mtime_ns):
+                changed[entry.path] = (path, size, mtime_ns)
+
+        # remaining entries are for deleted files
+        deleted = [(path,) for path in entries]
+
+        rows, errors = [], []
+        for result in wavy.info_many(changed, workers, ordered=False):
+            if result.error:
+                deleted.append(changed[result.file][:1])
+                errors.append(result)
+            else:
+                rows.append(changed[result.file] +
+                            (wavy.detail.dump_info(result.result),))
+
+        with self._lock, self._connection:
+            self._connection.executemany(wavy.detail.DELETE_INDEX_ENTRY,
+                                         deleted)
+            self._connection.executemany(wavy.detail.INSERT_INDEX_ENTRY, rows)
+
+        return errors
+
+    def close(self):
+        """
+        Close the index file.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"Index(path={self.path!r})"
@@ -7,33 +7,106 @@ WaveFileInfo = collections.namedtuple('WaveFileInfo', [
     'framerate',
     'n_channels',
     'n_frames',
-    'tags'
+    'tags',
+    'bext',
+    'ixml',
+    'regions'
 ])
 """
 Named tuple that represent information about the WAVE file.
+
+Attributes:
+    sample_width (int): Sample width in bits.
+    framerate (int): Sampling frequency (Hz).
+    n_channels (int): Number of audio channels.
+    n_frames (int): Number of audio frames.
+    tags (Tags): Tags of the file, None if it has none.
+    bext (Bext): Broadcast extension chunk, None if it has none.
+    ixml (str): Raw XML text of the iXML chunk, None if it has none.
+    regions (list): Region for each cue point and sample loop, ordered by
+        frame, None if it has none.
+"""
+
+# files without bext, iXML, cue and smpl chunks
+WaveFileInfo.__new__.__defaults__ = (None, None, None)
+
+Bext = collections.namedtuple('Bext', [
+    'description',
+    'originator',
+    'originator_reference',
+    'origination_date',
+    'origination_time',
+    'time_reference',
+    'version',
+    'umid',
+    'loudness_value',
+    'loudness_range',
+    'max_true_peak_level',
+    'max_momentary_loudness',
+    'max_short_term_loudness',
+    'coding_history'
+])
+"""
+Stores the broadcast extension (bext) chunk of Broadcast WAVE files.
+
+Attributes:
+    description (str): Description of the sound sequence.
+    originator (str): Name of the originator.
+    originator_reference (str): Unambiguous reference of the originator.
+    origination_date (str): Date of creation (yyyy-mm-dd).
+    origination_time (str): Time of creation (hh:mm:ss).
+    time_reference (int): Timecode of the first sample, as the number of
+        samples since midnight.
+    version (int): Version of the bext chunk.
+    umid (bytes): SMPTE Unique Material Identifier (64 bytes).
+    loudness_value (float): Integrated loudness (LUFS), None before
+        version 2.
+    loudness_range (float): Loudness range (LU), None before version 2.
+    max_true_peak_level (float): Maximum true peak level (dBTP), None
+        before version 2.
+    max_momentary_loudness (float): Maximum momentary loudness (LUFS), None
+        before version 2.
+    max_short_term_loudness (float): Maximum short term loudness (LUFS),
+        None before version 2.
+    coding_history (str): History of the coding of the sound.
 """
 
 
-def info(file):
+def info(file, buffer_size=wavy.detail.HEADER_BUFFER_SIZE):
     """
     Returns information about the audio file.
 
     Args:
-        file (str or File): Either the path to the file or an instance of File.
+        file (str, File or bytes-like): Either the path to the file, an
+            instance of File or an in-memory file (bytes, bytearray,
+            memoryview or mmap), which is read without copying.
+        buffer_size (int): Number of bytes fetched with the first read. The
+            whole header is usually parsed from them, more is only read if
+            the header extends past it.
 
     Returns:
-        WaveFileInfo: Information about the file.
+        WaveFileInfo: Information about the file, including the bext and
+        iXML chunks and the regions, which are parsed in the same pass as
+        the tags.
 
     """
     # get buffer reader, already opened for us
     with wavy.detail.get_stream_from_file(file, 'rb', io.BufferedReader) as \
             stream:
-        # get file format & data
-        format, tags, size = wavy.detail.read_stream(stream, read_data=False)
+        # fetch the header with a single read
+        header_stream = wavy.detail.prefetch(stream, buffer_size)
+        # get file format & data, collecting bext, iXML & regions on the way
+        metadata = {}
+        format, tags, size = wavy.detail.read_stream(header_stream,
+                                                     read_data=False,
+                                                     metadata=metadata)
 
     # return WaveFile obj
     return WaveFileInfo(sample_width=format.wBitsPerSample,
                         framerate=format.nSamplesPerSec,
                         n_channels=format.nChannels,
                         n_frames=size // format.nBlockAlign,
-                        tags=tags)
+                        tags=tags,
+                        bext=metadata.get(wavy.detail.BEXT),
+                        ixml=metadata.get(wavy.detail.IXML),
+                        regions=wavy.detail.get_regions(metadata))
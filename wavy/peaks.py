@@ -0,0 +1,76 @@
+import collections
+import io
+import os
+import wavy
+import wavy.detail
+
+Peaks = collections.namedtuple('Peaks', [
+    'min',
+    'max',
+    'rms'
+])
+"""
+Stores the min, max and RMS of each channel for buckets of frames.
+
+Attributes:
+    min (numpy.ndarray): Minimum sample of each bucket, of shape (n_buckets,
+        n_channels) or one dimensional if there is only one channel, with the
+        dtype of the data.
+    max (numpy.ndarray): Maximum sample of each bucket, like min.
+    rms (numpy.ndarray): Root mean square of the samples of each bucket,
+        relative to silence (128 for 8 bit samples), like min but float64.
+"""
+
+
+def peaks(file, samples_per_bucket, cache=False):
+    """
+    Compute the min, max and RMS of each channel for buckets of frames, to
+    draw an overview of the audio file. The data is decoded one block of
+    fixed size at the time, so memory use does not depend on the length of
+    the file or on the number of samples per bucket.
+
+    Args:
+        file (str, File or bytes-like): Either the path to the file, an
+            instance of File or an in-memory file (bytes, bytearray,
+            memoryview or mmap), which is read without copying.
+        samples_per_bucket (int): Number of frames in each bucket, the last
+            bucket holds the remaining frames.
+        cache (bool or str): If True, the peaks are stored in a sidecar file
+            next to the file (its path followed by '.peaks'), or in the given
+            path if it is a string. The cache is used as long as the size and
+            modification time of the file do not change, and is overwritten
+            if it was computed for another number of samples per bucket.
+
+    Returns:
+        Peaks: The min, max and RMS arrays.
+
+    Raises:
+        WaveValueError: If samples_per_bucket is not a positive integer, or
+            cache is used and file is not a path.
+
+    """
+    # checked before the cache, which would match 10.0 with 10
+    wavy.detail.check_samples_per_bucket(samples_per_bucket)
+
+    if cache and not isinstance(file, str):
+        raise wavy.WaveValueError(
+            "Argument 'file' must be a string to cache the peaks.")
+
+    if cache:
+        cache_path = cache if isinstance(cache, str) \
+            else wavy.detail.get_peaks_cache_path(file)
+        # stat before reading, so that changes while reading invalidate it
+        stat = os.stat(file)
+        result = wavy.detail.load_peaks(cache_path, samples_per_bucket, stat)
+        if result is not None:
+            return Peaks(*result)
+
+    # get buffer reader, already opened for us
+    with wavy.detail.get_stream_from_file(file, 'rb', io.BufferedReader) as \
+            stream:
+        result = wavy.detail.read_peaks(stream, samples_per_bucket)
+
+    if cache:
+        wavy.detail.save_peaks(cache_path, samples_per_bucket, stat, result)
+
+    return Peaks(*result)
@@ -1,27 +1,85 @@
+import functools
 import io
+import numpy
 import wavy
 import wavy.detail
 
 
-def read(file):
+def read(file, mmap=False, start=None, stop=None, in_seconds=False,
+         lazy=False, channels=None, dtype=None, workers=None):
     """
     Read the the audio file.
 
     Args:
-        file (str or File): Either the path to the file or an instance of File.
+        file (str, File or bytes-like): Either the path to the file, an
+            instance of File or an in-memory file (bytes, bytearray,
+            memoryview or mmap), which is read without copying.
+        mmap (bool): If True, the data is not read but mapped into memory as a
+            read-only numpy.memmap, pages are then loaded on demand and
+            shared with other processes reading the same file. Not supported
+            for 24 bit files.
+        start (int or float): First frame to read, the data before it is
+            skipped without being read. Negative values count from the end.
+        stop (int or float): Frame at which to stop reading. Negative values
+            count from the end.
+        in_seconds (bool): If True, start and stop are given in seconds
+            instead of frames.
+        lazy (bool): If True, only the header is read and the data is read
+            when first accessed. The file must then be a path or an in-memory
+            file, and must not change until the data is read.
+        channels (list): Indexes of the channels to read, only these channels
+            are decoded and stored. Negative values count from the last
+            channel. If None, all channels are read.
+        dtype (str or numpy.dtype): If given ('float32', 'float64' or
+            'int16'), samples are converted while they are read. Integer
+            samples converted to float are scaled to [-1, 1), samples
+            converted to int16 keep their 16 most significant bits and float
+            samples converted to int16 are scaled from [-1, 1) and clipped.
+            The sample width of the returned file is the one of dtype.
+        workers (int): If given, the data is split into ranges of frames that
+            are read and decoded concurrently by this number of threads. Only
+            used for files on disk, and ignored if mmap is True.
 
     Returns:
-        WaveFile: An object that represents the file.
+        WaveFile: An object that represents the file (LazyWaveFile if lazy is
+        True).
+
+    Raises:
+        WaveValueError: If lazy or mmap is True and file is not on disk or in
+            memory, or workers is not positive.
 
     """
+    # file is opened again to read the data
+    if lazy and not isinstance(file, (str,) + wavy.detail.BYTES_LIKE_TYPES):
+        raise wavy.WaveValueError(
+            "Argument 'file' must be a string or bytes-like object for lazy "
+            "reading.")
+
     # get buffer reader, already opened for us
     with wavy.detail.get_stream_from_file(file, 'rb', io.BufferedReader) as \
             stream:
         # get file format & data
-        format, tags, data = wavy.detail.read_stream(stream)
+        format, tags, data = wavy.detail.read_stream(
+            stream, mmap=mmap, start=start, stop=stop, in_seconds=in_seconds,
+            lazy=lazy, channels=channels, dtype=dtype, workers=workers)
+
+    # converted data has the sample width of its dtype
+    sample_width = format.wBitsPerSample if dtype is None \
+        else numpy.dtype(dtype).itemsize * 8
+
+    if lazy:
+        return wavy.LazyWaveFile(
+            sample_width=sample_width,
+            framerate=format.nSamplesPerSec,
+            n_channels=format.nChannels if data.channels is None
+            else len(data.channels),
+            n_frames=data.stop - data.start,
+            read_data=functools.partial(wavy.detail.read_file_data_range,
+                                        file, format, data),
+            tags=tags)
 
     # return WaveFile obj
-    return wavy.WaveFile(sample_width=format.wBitsPerSample,
+    return wavy.WaveFile(sample_width=sample_width,
                          framerate=format.nSamplesPerSec,
                          data=data,
                          tags=tags)
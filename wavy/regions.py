@@ -0,0 +1,66 @@
+import collections
+import io
+import numpy
+import wavy
+import wavy.detail
+
+Region = collections.namedtuple('Region', [
+    'id',
+    'frame',
+    'length',
+    'label'
+])
+"""
+Stores a cue point (or sample loop) of a file.
+
+Attributes:
+    id (int): Id of the cue point.
+    frame (int): First frame of the region.
+    length (int): Number of frames in the region, 0 for markers.
+    label (str): Label of the cue point, None if it has none.
+"""
+
+
+def read_region(file, label_or_id, mmap=False, channels=None, dtype=None):
+    """
+    Read the frames of a region of the audio file, found by its label or
+    cue point id. Only the frames of the region are read from disk.
+
+    Args:
+        file (str, File or bytes-like): Either the path to the file, an
+            instance of File or an in-memory file (bytes, bytearray,
+            memoryview or mmap), which is read without copying.
+        label_or_id (str or int): Label or cue point id of the region. If
+            many regions share the label, the first one is read. Markers
+            (regions without length) extend to the next region, or to the
+            end of the data.
+        mmap (bool): If True, the data is mapped into memory instead of read,
+            as for wavy.read.
+        channels (list): Indexes of the channels to read, as for wavy.read.
+        dtype (str or numpy.dtype): If given, samples are converted while
+            they are read, as for wavy.read.
+
+    Returns:
+        WaveFile: An object that represents the region.
+
+    Raises:
+        WaveValueError: If the region is not found.
+
+    """
+    # get buffer reader, already opened for us
+    with wavy.detail.get_stream_from_file(file, 'rb', io.BufferedReader) as \
+            stream:
+        # get file format & data of the region
+        format, tags, data = wavy.detail.read_stream(
+            stream, mmap=mmap, channels=channels, dtype=dtype,
+            region=label_or_id)
+
+    # converted data has the sample width of its dtype
+    sample_width = format.wBitsPerSample if dtype is None \
+        else numpy.dtype(dtype).itemsize * 8
+
+    # return WaveFile obj
+    return wavy.WaveFile(sample_width=sample_width,
+                         framerate=format.nSamplesPerSec,
+                         data=data,
+                         tags=tags)
@@ -1,4 +1,6 @@
 import collections
+import io
+import wavy
 import wavy.detail
 
 Tags = collections.namedtuple('Tags', wavy.detail.TAG_PROPS)
@@ -21,3 +23,32 @@ Attributes:
 
 # set all defaults to empty string
 Tags.__new__.__defaults__ = ('',) * len(wavy.detail.TAG_PROPS)
+
+
+def update_tags(file, tags):
+    """
+    Replace the tags of the audio file in place, without reading or moving
+    the audio data. The new tags are written over the existing ones (and any
+    JUNK or PAD chunk next to them) if they fit, otherwise they are appended
+    at the end of the file.
+
+    Args:
+        file (str or File): Either the path to the file or an instance of
+            File opened for reading and writing ('r+b').
+        tags (Tags): The new tags, None to remove them.
+
+    Raises:
+        WaveValueError: If tags is not valid.
+
+    """
+    # if we have tags, it must be a valid Tags obj
+    if tags and not isinstance(tags, Tags):
+        raise wavy.WaveValueError("Argument 'tags' must be of type 'wavy.Tags'.")
+
+    # only close the file if we opened it
+    stream = wavy.detail.get_stream_from_file(file, 'r+b', io.BufferedRandom)
+    try:
+        wavy.detail.write_tags(stream, tags)
+    finally:
+        if isinstance(file, str):
+            stream.close()
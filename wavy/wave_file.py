@@ -92,3 +92,66 @@ class WaveFile(object):
         return f"WaveFile(sample_width={self.sample_width}, " \
                f"framerate={self.framerate}, n_channels={self.n_channels}, " \
                f"n_frames={self.n_frames})"
+
+
+class LazyWaveFile(WaveFile):
+    """
+    Class that represents a WAVE file whose data is only read when it is
+    first accessed.
+    """
+
+    @property
+    def data(self):
+        """
+        numpy.ndarray: Audio data stored in numpy.ndarray, read from the file
+            the first time it is accessed (or after calling release).
+            If the number of channels is one, the array will be one dimensional.
+            Otherwise, the returned array will be two dimensional array of shape (n_frames, n_channels).
+        """
+        if self._data is None:
+            self._data = self._read_data()
+        return self._data
+
+    @property
+    def is_loaded(self):
+        """
+        bool: Whether the data is currently held in memory.
+        """
+        return self._data is not None
+
+    def __init__(self, sample_width, framerate, n_channels, n_frames,
+                 read_data, tags=None):
+        """
+
+        Args:
+            sample_width (int): Sample width in bits.
+            framerate (int): Sampling frequency in Hz.
+            n_channels (int): Number of audio channels.
+            n_frames (int): Number of audio frames.
+            read_data (callable): Function that reads the audio data.
+            tags (Tags): Tags containing information about the audio.
+        """
+
+        # copy simple info
+        self._sample_width = sample_width
+        self._framerate = framerate
+        self._n_channels = n_channels
+        self._n_frames = n_frames
+
+        # check data is not empty, as it would be once read
+        if not self._n_frames:
+            raise wavy.WaveValueError("Data array cannot be empty.")
+
+        # if we have tags, it must be a valid Tags obj
+        if tags and not isinstance(tags, wavy.Tags):
+            raise wavy.WaveValueError("Argument 'tags' must be of type 'wavy.Tags'.")
+
+        self._read_data = read_data
+        self._data = None
+        self._tags = tags
+
+    def release(self):
+        """
+        Drop the data from memory, it is read again on the next access.
+        """
+        self._data = None
@@ -0,0 +1,157 @@
+import io
+import threading
+import wavy
+import wavy.detail
+
+
+class WaveSource(object):
+    """
+    Class that serves ranges of frames of a WAVE file. The header is parsed
+    once when the source is created, then frames are read with positional
+    reads (os.pread) so that any number of threads can read from the same
+    file at the same time, without locking or opening it again.
+    """
+
+    @property
+    def sample_width(self):
+        """
+        int: Sample width in bits.
+        """
+        return self._format.wBitsPerSample
+
+    @property
+    def framerate(self):
+        """
+        int: Sampling frequency (Hz).
+        """
+        return self._format.nSamplesPerSec
+
+    @property
+    def n_channels(self):
+        """
+        int: Number of audio channels.
+        """
+        return self._format.nChannels
+
+    @property
+    def n_frames(self):
+        """
+        int: Number of audio frames.
+        """
+        return self._chunk.size // self._format.nBlockAlign
+
+    @property
+    def tags(self):
+        """
+        Tags: Tags of the file, None if it has none.
+        """
+        return self._tags
+
+    @property
+    def closed(self):
+        """
+        bool: Whether the source is closed.
+        """
+        return self._stream is None
+
+    def __init__(self, file):
+        """
+
+        Args:
+            file (str, File or bytes-like): Either the path to the file, an
+                instance of File (which is not closed by the source) or an
+                in-memory file (bytes, bytearray, memoryview or mmap).
+
+        Raises:
+            WaveFileIsCorrupted: If the header cannot be parsed.
+        """
+        # only close the file if we opened it
+        self._close_stream = not isinstance(file, io.BufferedReader)
+        self._stream = wavy.detail.get_stream_from_file(file, 'rb',
+                                                        io.BufferedReader)
+
+        try:
+            self._handler, self._format, self._tags, self._chunk = \
+                wavy.detail.read_header(self._stream)
+            wavy.detail.check_data_size(self._chunk.size, self._format)
+        except Exception:
+            self._close()
+            raise
+
+        # streams that cannot be read at a position are shared under a lock
+        self._fd = wavy.detail.get_file_descriptor(self._stream)
+        self._lock = threading.Lock()
+
+    def read_frames(self, start=None, stop=None, in_seconds=False,
+                    channels=None, dtype=None):
+        """
+        Read a range of frames, this method can be called by many threads at
+        the same time.
+
+        Args:
+            start (int or float): First frame to read. Negative values count
+                from the end.
+            stop (int or float): Frame at which to stop reading. Negative
+                values count from the end.
+            in_seconds (bool): If True, start and stop are given in seconds
+                instead of frames.
+            channels (list): Indexes of the channels to read, as for
+                wavy.read.
+            dtype (str or numpy.dtype): The dtype to convert the samples to,
+                as for wavy.read.
+
+        Returns:
+            numpy.ndarray: Audio data of shape (n_frames, n_channels), or one
+                dimensional if the number of (selected) channels is one.
+
+        Raises:
+            WaveValueError: If the arguments are not valid, or the source is
+                closed.
+
+        """
+        if self.closed:
+            raise wavy.WaveValueError("Cannot read from a closed source.")
+
+        start, stop = wavy.detail.get_frame_range(
+            self._format, self._chunk.size, start, stop, in_seconds)
+
+        data_range = wavy.detail.DataRange(
+            chunk=self._chunk, handler=self._handler, start=start, stop=stop,
+            mmap=False,
+            channels=wavy.detail.get_channels(self._format, channels),
+            dtype=wavy.detail.get_conversion_dtype(self._format,
+                                                   self._handler, dtype),
+            workers=None)
+
+        if self._fd is not None:
+            # each read has its own position in the file
+            return wavy.detail.read_data_range(
+                wavy.detail.PositionalStream(self._fd), self._format,
+                data_range)
+
+        with self._lock:
+            return wavy.detail.read_data_range(self._stream, self._format,
+                                               data_range)
+
+    def close(self):
+        """
+        Close the file.
+        """
+        if not self.closed:
+            self._close()
+
+    def _close(self):
+        if self._close_stream:
+            self._stream.close()
+        self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"WaveSource(sample_width={self.sample_width}, " \
+               f"framerate={self.framerate}, n_channels={self.n_channels}, " \
+               f"n_frames={self.n_frames})"
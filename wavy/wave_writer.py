@@ -0,0 +1,198 @@
+import io
+import wavy
+import wavy.detail
+
+
+class WaveWriter(object):
+    """
+    Class that writes a WAVE file one block of frames at the time. The sizes
+    in the header are updated when the writer is closed (and optionally
+    while writing), so the file can be of any length.
+    """
+
+    @property
+    def sample_width(self):
+        """
+        int: Sample width in bits.
+        """
+        return self._sample_width
+
+    @property
+    def framerate(self):
+        """
+        int: Sampling frequency (Hz).
+        """
+        return self._framerate
+
+    @property
+    def n_channels(self):
+        """
+        int: Number of audio channels.
+        """
+        return self._n_channels
+
+    @property
+    def n_frames(self):
+        """
+        int: Number of audio frames written so far.
+        """
+        return self._n_frames
+
+    @property
+    def closed(self):
+        """
+        bool: Whether the writer is closed.
+        """
+        return self._stream is None
+
+    def __init__(self, file, sample_width, framerate, n_channels,
+                 format='pcm', extensible=False, little_endian=True,
+                 rf64=False, flush_every=None, tags=None):
+        """
+
+        Args:
+            file (str or File): Either the path to the file or an instance of
+                File (which must be seekable and is not closed by the writer).
+            sample_width (int): Sample width in bits.
+            framerate (int): Sampling frequency in Hz.
+            n_channels (int): Number of audio channels.
+            format (str): Either 'pcm' for integer samples or 'float' for
+                floating point samples.
+            extensible (bool): If True, the extensible format is used.
+            little_endian (bool): If True, a RIFF file is written, otherwise
+                a RIFX file.
+            rf64 (bool): If True, a RF64 file is written, so that the data
+                can be larger than 4 GB.
+            flush_every (int): If given, the header is updated and the file
+                flushed every time that number of frames has been written,
+                so that the file is readable even if it is never closed.
+            tags (Tags): Tags written in a LIST chunk before the data.
+
+        Raises:
+            WaveValueError: If the arguments are not valid.
+        """
+        format_tag = wavy.detail.get_format_tag(format, sample_width)
+
+        if n_channels <= 0:
+            raise wavy.WaveValueError(
+                "Argument 'n_channels' must be positive.")
+
+        if flush_every is not None and flush_every <= 0:
+            raise wavy.WaveValueError(
+                "Argument 'flush_every' must be positive.")
+
+        # if we have tags, it must be a valid Tags obj
+        if tags and not isinstance(tags, wavy.Tags):
+            raise wavy.WaveValueError(
+                "Argument 'tags' must be of type 'wavy.Tags'.")
+
+        self._sample_width = sample_width
+        self._framerate = framerate
+        self._n_channels = n_channels
+        self._n_frames = 0
+
+        self._format_tag = format_tag
+        self._rf64 = rf64
+        self._flush_every = flush_every
+        self._n_flushed = 0
+        self._data_size = 0
+
+        self._handler = wavy.detail.StreamHandler(little_endian)
+
+        # only close the file if we opened it
+        self._close_stream = isinstance(file, str)
+        self._stream = wavy.detail.get_stream_from_file(file, 'wb',
+                                                        io.IOBase)
+
+        try:
+            self._start = self._stream.tell()
+            self._layout = wavy.detail.write_header(
+                self._stream, self._handler, format_tag, sample_width,
+                framerate, n_channels, extensible, rf64, tags)
+        except Exception:
+            self._close()
+            raise
+
+    def write(self, data):
+        """
+        Write frames to the file. Contiguous arrays in the byte order of the
+        file are written straight from their buffer, without copying.
+
+        Args:
+            data (numpy.ndarray): Audio data of shape (n_frames, n_channels),
+                or one dimensional if the number of channels is one. The dtype
+                must match the sample width and format, as for WaveFile
+                (int32 for 24 bit samples).
+
+        Raises:
+            WaveValueError: If the data cannot be written to the file, or the
+                writer is closed.
+
+        """
+        if self.closed:
+            raise wavy.WaveValueError("Cannot write to a closed writer.")
+
+        wavy.detail.check_data_format(data, self._sample_width,
+                                      self._format_tag, self._n_channels)
+
+        n_frames = len(data)
+        data_size = self._data_size + \
+            n_frames * self._n_channels * self._sample_width // 8
+
+        # sizes of RIFF files are stored in 32 bits
+        if not self._rf64 and self._layout.data_offset + data_size > \
+                wavy.detail.MAX_CHUNK_SIZE:
+            raise wavy.WaveValueError(
+                "Data is too large for a RIFF file, use rf64=True instead.")
+
+        wavy.detail.write_data(self._stream, self._handler, data,
+                               self._sample_width)
+
+        self._n_frames += n_frames
+        self._data_size = data_size
+
+        if self._flush_every is not None and \
+                self._n_frames - self._n_flushed >= self._flush_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Update the sizes in the header and flush the file.
+        """
+        if self.closed:
+            return
+        wavy.detail.update_header(self._stream, self._handler, self._layout,
+                                  self._data_size, self._n_frames,
+                                  self._start)
+        self._stream.flush()
+        self._n_flushed = self._n_frames
+
+    def close(self):
+        """
+        Pad the data, update the sizes in the header and close the file.
+        """
+        if self.closed:
+            return
+        try:
+            # chunks are padded to an even number of bytes
+            if self._data_size % 2:
+                self._stream.write(b'\x00')
+            self.flush()
+        finally:
+            self._close()
+
+    def _close(self):
+        if self._close_stream:
+            self._stream.close()
+        self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"WaveWriter(sample_width={self.sample_width}, " \
+               f"framerate={self.framerate}, n_channels={self.n_channels}, " \
+               f"n_frames={self.n_frames})"
@@ -0,0 +1,37 @@
+import wavy
+
+
+def write(file, wave_file, extensible=False, little_endian=True, rf64=False):
+    """
+    Write the audio file.
+
+    Args:
+        file (str or File): Either the path to the file or an instance of
+            File (which must be seekable).
+        wave_file (WaveFile): The audio to write. Float data is written as
+            IEEE float samples, integer data as PCM samples, and the tags
+            (if any) in a LIST chunk.
+        extensible (bool): If True, the extensible format is used.
+        little_endian (bool): If True, a RIFF file is written, otherwise a
+            RIFX file.
+        rf64 (bool): If True, a RF64 file is written, so that the data can be
+            larger than 4 GB.
+
+    Raises:
+        WaveValueError: If the file cannot be written with the given
+            arguments.
+
+    """
+    # check wave file is valid
+    if not isinstance(wave_file, wavy.WaveFile):
+        raise wavy.WaveValueError(
+            "Argument 'wave_file' must be of type 'wavy.WaveFile'.")
+
+    data = wave_file.data
+    format = 'float' if data.dtype.kind == 'f' else 'pcm'
+
+    with wavy.WaveWriter(file, wave_file.sample_width, wave_file.framerate,
+                         wave_file.n_channels, format=format,
+                         extensible=extensible, little_endian=little_endian,
+                         rf64=rf64, tags=wave_file.tags) as writer:
+        writer.write(data)